@@ -0,0 +1,211 @@
+"""
+Admin API Module
+Local HTTP control API - trigger a check, pause/resume delivery, inspect queue/limiter state and cycle stats
+"""
+
+import hmac
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import config
+
+ENDPOINTS = {
+    'GET /status': "Bot status and the last check",
+    'GET /state': "Digest queue, circuit breakers, rate limits and caches",
+    'GET /stats': "Recent check cycles (?limit=N)",
+    'POST /check': "Run a check now (queued if one is running)",
+    'POST /pause': "Pause delivery (new listings are held unseen)",
+    'POST /resume': "Resume delivery",
+}
+
+
+class _AdminRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the AdminAPI that owns the server"""
+    
+    server_version = "GModStoreScraperAdmin/1.0"
+    
+    def do_GET(self):
+        self._dispatch('GET')
+    
+    def do_POST(self):
+        self._dispatch('POST')
+    
+    def _dispatch(self, method: str):
+        api: 'AdminAPI' = self.server.api
+        url = urlparse(self.path)
+        if not api.authorized(self.headers.get('Authorization', '')):
+            self._send(401, {'error': "unauthorized"})
+            return
+        status, body = api.handle(method, url.path.rstrip('/') or '/', parse_qs(url.query))
+        self._send(status, body)
+    
+    def _send(self, status: int, body: Dict):
+        data = json.dumps(body, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        # Requests are not logged, actions are logged by the bot
+        pass
+
+
+class AdminAPI:
+    """
+    Embedded HTTP server on its own thread. Handlers only read snapshots the bot takes under
+    its lock (or thread-safe breaker snapshots) and set flags, the check itself always runs
+    in the bot's main loop.
+    """
+    
+    def __init__(self, bot, host: Optional[str] = None, port: Optional[int] = None, token: Optional[str] = None):
+        """
+        Initializes admin API
+        
+        Args:
+            bot: JobScraperBot instance
+            host: Bind address (default: ADMIN_API_HOST)
+            port: Port (default: ADMIN_API_PORT, 0 = any free port)
+            token: Required bearer token (default: ADMIN_API_TOKEN, read per request)
+        """
+        self.bot = bot
+        self.host = host or getattr(config, 'ADMIN_API_HOST', '127.0.0.1')
+        self.port = port if port is not None else getattr(config, 'ADMIN_API_PORT', 0)
+        self._token = token
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def token(self) -> str:
+        return self._token if self._token is not None else getattr(config, 'ADMIN_API_TOKEN', '')
+    
+    def authorized(self, header: str) -> bool:
+        """
+        Args:
+            header: Authorization header value
+            
+        Returns:
+            bool: Does the request carry the token (always True without a token)?
+        """
+        token = self.token
+        if not token:
+            return True
+        return hmac.compare_digest(header.encode('utf-8'), f"Bearer {token}".encode('utf-8'))
+    
+    def start(self) -> threading.Thread:
+        """
+        Starts serving in a daemon thread
+        
+        Returns:
+            threading.Thread: Server thread
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), _AdminRequestHandler)
+        self._server.daemon_threads = True
+        self._server.api = self
+        self.port = self._server.server_address[1]
+        
+        self._thread = threading.Thread(target=self._server.serve_forever, name="admin-api", daemon=True)
+        self._thread.start()
+        
+        print(f"[INFO] Admin API listening on http://{self.host}:{self.port}")
+        if not self.token and self.host not in ('127.0.0.1', 'localhost', '::1'):
+            print("[WARNING] Admin API is reachable from the network without ADMIN_API_TOKEN")
+        return self._thread
+    
+    def stop(self):
+        """Stops the server"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def handle(self, method: str, path: str, query: Dict[str, List[str]]) -> Tuple[int, Dict]:
+        """
+        Runs an endpoint
+        
+        Args:
+            method: HTTP method
+            path: Request path without trailing slash
+            query: Parsed query string
+            
+        Returns:
+            Tuple[int, Dict]: HTTP status and JSON body
+        """
+        routes = {
+            'GET /': lambda: {'endpoints': ENDPOINTS},
+            'GET /status': self.bot.status_snapshot,
+            'GET /state': self.state,
+            'GET /stats': lambda: self.stats(query),
+            'POST /check': self.bot.request_check,
+            'POST /pause': self.bot.pause_delivery,
+            'POST /resume': self.bot.resume_delivery,
+        }
+        route = routes.get(f"{method} {path}")
+        if route is None:
+            allowed = [key.split(' ')[0] for key in routes if key.split(' ')[1] == path]
+            if allowed:
+                return 405, {'error': f"use {' or '.join(allowed)}"}
+            return 404, {'error': "not found", 'endpoints': ENDPOINTS}
+        try:
+            return (202 if method == 'POST' else 200), route()
+        except Exception as e:
+            return 500, {'error': f"{type(e).__name__}: {e}"}
+    
+    def state(self) -> Dict:
+        """
+        Returns:
+            Dict: Pending deliveries, limiter state and cache sizes (queue and caches as of the last check)
+        """
+        bot = self.bot
+        scraper = bot.scraper
+        
+        state = bot.state_snapshot()
+        digest = state.get('digest_queue')
+        if digest is not None:
+            digest = dict(digest)
+            digest['seconds_left'] = round(max(0.0, digest.pop('due_at') - time.time()), 1)
+        
+        state.update({
+            'delivery_paused': bot.delivery_paused,
+            'checking': bot.checking,
+            'digest_queue': digest,
+            'circuits': [breaker.snapshot() for breaker in
+                         (scraper.listing_breaker, scraper.detail_breaker, bot.webhook.breaker)],
+            'rate_limits': {
+                'detail_request_delay': scraper.request_delay,
+                'discord_message_delay': bot.webhook.rate_limit_delay,
+                'async_max_concurrency': getattr(scraper, 'max_concurrency', None),
+                'detail_fetch_budget': getattr(config, 'DETAIL_FETCH_BUDGET', 0) if scraper.job_index else None,
+            },
+        })
+        return state
+    
+    def stats(self, query: Dict[str, List[str]]) -> Dict:
+        """
+        Args:
+            query: Query string (limit = number of cycles)
+            
+        Returns:
+            Dict: Recent cycles (newest last) and their averages
+        """
+        try:
+            limit = int(query.get('limit', [0])[0])
+        except ValueError:
+            limit = 0
+        cycles = self.bot.cycle_stats(limit)
+        
+        summary = {}
+        if cycles:
+            summary = {
+                'cycles': len(cycles),
+                'avg_duration': round(sum(cycle.get('duration', 0) for cycle in cycles) / len(cycles), 3),
+                'new': sum(cycle.get('new', 0) for cycle in cycles),
+                'sent': sum(cycle.get('sent', 0) for cycle in cycles),
+                'errors': sum(1 for cycle in cycles if cycle.get('error')),
+            }
+        return {'summary': summary, 'cycles': cycles}
@@ -0,0 +1,217 @@
+"""
+Async Discord Webhook Module
+Asyncio variant of the Discord webhook client
+"""
+
+import asyncio
+import time
+from typing import Dict, List
+
+from async_scraper import http2_available
+from circuit_breaker import CircuitBreaker
+from digest import build_digest_payloads
+from discord_webhook import DiscordWebhook
+from startup import lazy_import
+
+httpx = lazy_import('httpx')
+
+
+class AsyncDiscordWebhook(DiscordWebhook):
+    def __init__(self, webhook_url: str):
+        """
+        Initializes async Discord webhook client
+        
+        Args:
+            webhook_url: Discord webhook URL
+        """
+        super().__init__(webhook_url)
+        self._client = None
+    
+    @property
+    def client(self):
+        """HTTP client, created on first use inside the event loop"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(http2=http2_available(), timeout=10)
+        return self._client
+    
+    async def aclose(self):
+        """Closes the HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def send_jobs(self, jobs: List[Dict]) -> int:
+        """
+        Sync wrapper around send_jobs_async (runs a private event loop)
+        
+        Args:
+            jobs: List of job listings
+        
+        Returns:
+            int: Number of successfully sent listings
+        """
+        async def run():
+            try:
+                return await self.send_jobs_async(jobs)
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    def send_digest(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Sync wrapper around send_digest_async (runs a private event loop)
+        
+        Args:
+            jobs: List of job listings
+        
+        Returns:
+            List[Dict]: Listings of digest messages that were not delivered
+        """
+        async def run():
+            try:
+                return await self.send_digest_async(jobs)
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    async def send_job_async(self, job: Dict) -> bool:
+        """
+        Sends a single job listing to Discord
+        
+        Args:
+            job: Job listing data
+        
+        Returns:
+            bool: Success?
+        """
+        if not self.breaker.allow_request():
+            print(f"[WARNING] Discord circuit open, not sending: {job['title']}")
+            return False
+        
+        if await self._post_payload_async(self._build_payload(job)):
+            print(f"[SUCCESS] Listing sent: {job['title']}")
+            return True
+        return False
+    
+    async def _post_payload_async(self, payload: Dict) -> bool:
+        """
+        Posts a webhook payload, waiting out rate limits and recording the result on the circuit breaker
+        
+        Args:
+            payload: Discord webhook payload
+        
+        Returns:
+            bool: Success?
+        """
+        try:
+            start = time.perf_counter()
+            response = await self.client.post(self.webhook_url, json=payload)
+            latency = time.perf_counter() - start
+            
+            if response.status_code == 204:
+                self.breaker.record_success(latency)
+                return True
+            elif response.status_code == 429:
+                # Rate limit (endpoint is healthy, just busy)
+                self.breaker.record_success()
+                retry_after = response.json().get('retry_after', 5)
+                print(f"[WARNING] Rate limit! Waiting {retry_after} seconds...")
+                await asyncio.sleep(retry_after)
+                return await self._post_payload_async(payload)  # Retry
+            else:
+                if response.status_code >= 500:
+                    self.breaker.record_failure(f"HTTP {response.status_code}")
+                else:
+                    self.breaker.record_success(latency)
+                print(f"[ERROR] Discord webhook error: {response.status_code} - {response.text}")
+                return False
+        
+        except Exception as e:
+            self.breaker.record_failure(f"{type(e).__name__}: {e}")
+            print(f"[ERROR] Error sending listing: {e}")
+            return False
+    
+    async def send_jobs_async(self, jobs: List[Dict]) -> int:
+        """
+        Sends multiple job listings to Discord (in order, rate limited)
+        
+        Args:
+            jobs: List of job listings
+        
+        Returns:
+            int: Number of successfully sent listings
+        """
+        sent_count = 0
+        
+        for index, job in enumerate(jobs):
+            if self.breaker.state == CircuitBreaker.OPEN:
+                print(f"[WARNING] Discord circuit open, skipping {len(jobs) - index} pending listings")
+                break
+            
+            if await self.send_job_async(job):
+                sent_count += 1
+            
+            # Rate limit protection
+            await asyncio.sleep(self.rate_limit_delay)
+        
+        return sent_count
+    
+    async def send_digest_async(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Sends job listings as a category-grouped digest (a few messages instead of one per listing)
+        
+        Args:
+            jobs: List of job listings
+        
+        Returns:
+            List[Dict]: Listings of digest messages that were not delivered (empty if all were sent)
+        """
+        payloads = build_digest_payloads(jobs)
+        print(f"[INFO] Sending digest of {len(jobs)} listings in {len(payloads)} messages...")
+        undelivered = []
+        
+        for index, payload in enumerate(payloads):
+            covered = payload.pop('jobs')
+            if not self.breaker.allow_request():
+                print(f"[WARNING] Discord circuit open, skipping {len(payloads) - index} digest messages")
+                undelivered.extend(covered)
+                for skipped in payloads[index + 1:]:
+                    undelivered.extend(skipped['jobs'])
+                break
+            
+            if await self._post_payload_async(payload):
+                print(f"[SUCCESS] Digest message sent ({index + 1}/{len(payloads)}, {len(covered)} listings)")
+            else:
+                undelivered.extend(covered)
+            
+            # Rate limit protection
+            if index < len(payloads) - 1:
+                await asyncio.sleep(self.rate_limit_delay)
+        
+        return undelivered
+    
+    async def test_webhook_async(self) -> bool:
+        """
+        Tests if webhook is working
+        
+        Returns:
+            bool: Is working?
+        """
+        try:
+            response = await self.client.post(self.webhook_url, json=self._build_test_payload())
+            
+            if response.status_code == 204:
+                print("[SUCCESS] Webhook test successful!")
+                self.healthy = True
+                return True
+            else:
+                print(f"[ERROR] Webhook test failed: {response.status_code}")
+                self.healthy = False
+                return False
+        
+        except Exception as e:
+            print(f"[ERROR] Webhook test error: {e}")
+            self.healthy = False
+            return False
@@ -0,0 +1,368 @@
+"""
+Async GModStore Job Market Scraper
+Asyncio variant of the scraper - listing fetch, concurrent detail fetches and
+parsing (offloaded to an executor) on a single event loop
+"""
+
+import asyncio
+import time
+import zlib
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Optional
+
+import config
+from parse_pool import parse_detail_page_timed
+from scraper import DETAIL_STREAM_CHUNK_SIZE, JobScraper, DetailPageDownload, resolve_ca_bundle
+from startup import lazy_import
+
+httpx = lazy_import('httpx')
+
+# Encodings BoundedDecoder can inflate in bounded steps (httpx would also offer br/zstd when installed)
+DETAIL_ACCEPT_ENCODING = "gzip, deflate"
+
+
+def http2_available() -> bool:
+    """
+    Returns:
+        bool: Is HTTP/2 support (h2 package) installed?
+    """
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class BoundedDecoder:
+    """
+    Incremental gzip/deflate decoder for raw detail page chunks. Inflates at most
+    DETAIL_STREAM_CHUNK_SIZE bytes per step (like urllib3's bounded read1 on the sync path),
+    so a small compressed chunk can't expand into an unbounded buffer before the limits apply.
+    """
+    
+    def __init__(self, content_encoding: str):
+        """
+        Initializes the decoder for a response
+        
+        Args:
+            content_encoding: Content-Encoding header value ("" = not compressed)
+        """
+        encodings = [value.strip().lower() for value in content_encoding.split(',')]
+        encodings = [value for value in encodings if value and value != 'identity']
+        if len(encodings) > 1 or (encodings and encodings[0] not in ('gzip', 'x-gzip', 'deflate')):
+            raise httpx.DecodingError(f"Unsupported Content-Encoding: {content_encoding}")
+        
+        self.encoding = encodings[0] if encodings else None
+        self._decompressor = None
+        self._raw_deflate_fallback = False
+        if self.encoding in ('gzip', 'x-gzip'):
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == 'deflate':
+            # "deflate" is zlib-wrapped per the RFC, some servers send raw deflate instead
+            self._decompressor = zlib.decompressobj()
+            self._raw_deflate_fallback = True
+    
+    def decode(self, data: bytes) -> Iterator[bytes]:
+        """
+        Decodes a raw chunk step by step; input is only inflated as the caller keeps iterating
+        
+        Args:
+            data: Raw (compressed) chunk
+            
+        Yields:
+            bytes: Decoded pieces of at most DETAIL_STREAM_CHUNK_SIZE bytes
+        """
+        if self._decompressor is None:
+            if data:
+                yield data
+            return
+        
+        while data:
+            try:
+                piece = self._decompressor.decompress(data, DETAIL_STREAM_CHUNK_SIZE)
+            except zlib.error as e:
+                if self._raw_deflate_fallback:
+                    self._raw_deflate_fallback = False
+                    self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                    continue
+                raise httpx.DecodingError(str(e))
+            self._raw_deflate_fallback = False
+            data = self._decompressor.unconsumed_tail
+            if piece:
+                yield piece
+    
+    def flush(self) -> bytes:
+        """
+        Returns decoded bytes still buffered at the end of the body
+        """
+        if self._decompressor is None:
+            return b""
+        try:
+            return self._decompressor.flush()
+        except zlib.error as e:
+            raise httpx.DecodingError(str(e))
+
+
+class AsyncJobScraper(JobScraper):
+    def __init__(self, executor: Optional[Executor] = None):
+        """
+        Initializes async scraper
+        
+        Args:
+            executor: Executor used for HTML parsing (None = event loop default)
+        """
+        super().__init__()
+        self.executor = executor
+        self.max_concurrency = getattr(config, 'ASYNC_MAX_CONCURRENCY', 4)
+        self._client = None
+        self._pace_lock: Optional[asyncio.Lock] = None
+        self._next_request_at = 0.0
+    
+    def apply_config(self):
+        """Applies reloaded settings (the connection pool size is fixed until the client is recreated)"""
+        super().apply_config()
+        self.max_concurrency = getattr(config, 'ASYNC_MAX_CONCURRENCY', 4)
+        if self._client is not None:
+            self._client.headers['User-Agent'] = config.USER_AGENT
+    
+    @property
+    def client(self):
+        """
+        HTTP client (HTTP/2 when available), created on first use inside the event loop
+        """
+        if self._client is None:
+            ca_bundle_path = resolve_ca_bundle()
+            self._client = httpx.AsyncClient(
+                http2=http2_available(),
+                headers={'User-Agent': config.USER_AGENT},
+                verify=ca_bundle_path or True,
+                timeout=15,
+                limits=httpx.Limits(max_connections=self.max_concurrency),
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Closes the HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._pace_lock = None
+    
+    def fetch_jobs(self) -> List[Dict]:
+        """
+        Sync wrapper around fetch_jobs_async (runs a private event loop)
+        
+        Returns:
+            List[Dict]: List of job listings with full details
+        """
+        async def run():
+            try:
+                return await self.fetch_jobs_async()
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    async def fetch_jobs_async(self) -> List[Dict]:
+        """
+        Fetches job listings and their details concurrently
+        
+        Returns:
+            List[Dict]: List of job listings with full details
+        """
+        if not self.listing_breaker.allow_request():
+            print(f"[WARNING] GModStore circuit open, skipping check "
+                  f"(next probe in {self.listing_breaker.retry_after():.0f}s)")
+            return []
+        
+        loop = asyncio.get_running_loop()
+        
+        try:
+            start = time.perf_counter()
+            try:
+                response = await self.client.get(config.GMODSTORE_JOBS_URL, timeout=10)
+                response.raise_for_status()
+            except asyncio.CancelledError:
+                self.listing_breaker.release()
+                raise
+            except Exception as e:
+                self._record_endpoint_error(self.listing_breaker, e)
+                raise
+            self.listing_breaker.record_success(time.perf_counter() - start)
+            
+            jobs = await loop.run_in_executor(self.executor, self._parse_listing, response.content)
+            
+            # Fetch details for new, changed and stale jobs concurrently (started in priority order)
+            to_fetch, known_details = self._plan_detail_fetches(jobs)
+            print(f"[INFO] Fetching details for {len(to_fetch)}/{len(jobs)} jobs "
+                  f"(concurrency {self.max_concurrency}, HTTP/2 {'on' if http2_available() else 'off'})...")
+            self._start_detail_cycle()
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            results = await asyncio.gather(
+                *(self._fetch_details_limited(semaphore, job) for job in to_fetch)
+            )
+            
+            fetched = {}
+            skipped = 0
+            for job, details in zip(to_fetch, results):
+                if details is None:
+                    skipped += 1
+                    continue
+                fetched[job['job_id']] = details
+            if skipped:
+                print(f"[WARNING] Detail circuit open, skipped {skipped} detail fetches")
+            
+            detailed_jobs = self._merge_details(jobs, fetched, known_details)
+            self._finish_detail_cycle()
+            
+            return detailed_jobs
+        
+        except httpx.HTTPError as e:
+            print(f"[ERROR] Error connecting to GModStore: {e}")
+            return []
+        except Exception as e:
+            print(f"[ERROR] Error parsing listings: {e}")
+            return []
+    
+    async def _fetch_details_limited(self, semaphore: asyncio.Semaphore, job: Dict) -> Optional[Dict]:
+        """
+        Fetches job details within the concurrency limit
+        
+        Args:
+            semaphore: Concurrency limit
+            job: Job listing data
+        
+        Returns:
+            Optional[Dict]: Details, or None if short-circuited by the detail breaker
+        """
+        async with semaphore:
+            if not self.detail_breaker.allow_request():
+                return None
+            try:
+                await self._pace()
+            except BaseException:
+                self.detail_breaker.release()
+                raise
+            return await self.fetch_job_details_async(job['url'])
+    
+    async def _pace(self):
+        """Spaces request starts by request_delay (rate limiting)"""
+        if self._pace_lock is None:
+            self._pace_lock = asyncio.Lock()
+        
+        async with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = max(now, self._next_request_at) + self.request_delay
+    
+    async def fetch_job_details_async(self, job_url: str) -> Dict:
+        """
+        Fetches detailed information of a single job listing
+        
+        Args:
+            job_url: Job listing URL
+        
+        Returns:
+            Dict: Detailed job listing data
+        """
+        try:
+            start = time.perf_counter()
+            try:
+                content = await self._download_detail_page_async(job_url)
+            except asyncio.CancelledError:
+                self.detail_breaker.release()
+                raise
+            except Exception as e:
+                # Every allowed request must report back, or a half-open probe slot leaks
+                self._record_endpoint_error(self.detail_breaker, e)
+                raise
+            self.detail_breaker.record_success(time.perf_counter() - start)
+            
+            if content is None:
+                return {}
+            
+            cache_key, cached = self._lookup_cached_details(content)
+            if cached is not None:
+                return cached
+            
+            if self.parse_pool:
+                # Bounded by PARSE_MAX_PENDING, a crashed worker restarts the pool
+                details, cpu_time = await self.parse_pool.parse_async(content)
+            else:
+                loop = asyncio.get_running_loop()
+                details, cpu_time = await loop.run_in_executor(self.executor, parse_detail_page_timed, content)
+            self._store_cached_details(cache_key, details, cpu_time)
+            return details
+        
+        except httpx.TimeoutException:
+            print(f"[WARNING] Timeout fetching job details: {job_url}")
+            return {}
+        except httpx.HTTPError as e:
+            print(f"[WARNING] Request error fetching job details: {e}")
+            return {}
+        except Exception as e:
+            print(f"[WARNING] Error parsing job details: {e}")
+            return {}
+    
+    async def _download_detail_page_async(self, job_url: str) -> Optional[bytes]:
+        """
+        Streams a detail page with the same limits and early stop as the sync scraper
+        
+        Args:
+            job_url: Job listing URL
+        
+        Returns:
+            Optional[bytes]: Page body (possibly truncated) or None if discarded
+        """
+        download = DetailPageDownload(job_url)
+        
+        try:
+            headers = {'Accept-Encoding': DETAIL_ACCEPT_ENCODING}
+            async with self.client.stream('GET', job_url, headers=headers) as response:
+                response.raise_for_status()
+                decoder = BoundedDecoder(response.headers.get('Content-Encoding', ''))
+                
+                # Raw chunks decoded in bounded steps (aiter_bytes would inflate each chunk whole),
+                # each wait bounded by the time budget left so a drip-fed body can't run past
+                # DETAIL_MAX_SECONDS
+                chunks = response.aiter_raw().__aiter__()
+                reading = True
+                while reading:
+                    remaining = download.seconds_left()
+                    if remaining <= 0:
+                        download.stop_at_deadline()
+                        break
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), remaining)
+                    except StopAsyncIteration:
+                        tail = decoder.flush()
+                        if tail:
+                            download.feed(tail, response.num_bytes_downloaded)
+                        break
+                    except asyncio.TimeoutError:
+                        download.stop_at_deadline()
+                        break
+                    for piece in decoder.decode(chunk):
+                        if not download.feed(piece, response.num_bytes_downloaded):
+                            reading = False
+                            break
+        except BaseException:
+            download.fail()
+            raise
+        finally:
+            self.fetch_stats.append(download.complete())
+        
+        return download.content
+
+
+if __name__ == "__main__":
+    # For testing
+    scraper = AsyncJobScraper()
+    print("Fetching GModStore job listings (async)...")
+    jobs = scraper.fetch_jobs()
+    print(f"Found {len(jobs)} active listings:")
+    for job in jobs[:5]:  # Show first 5
+        print(f"  - {job['title']}")
+        print(f"    URL: {job['url']}")
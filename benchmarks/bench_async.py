@@ -0,0 +1,148 @@
+"""
+Sync vs Async Pipeline Benchmark
+Runs listing fetch, detail fetches and webhook delivery against local stub servers
+
+Usage:
+    python benchmarks/bench_async.py [--jobs 40] [--latency 0.05] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config
+from async_discord_webhook import AsyncDiscordWebhook
+from async_scraper import AsyncJobScraper
+from discord_webhook import DiscordWebhook
+from scraper import JobScraper
+
+CORPUS = ROOT / "corpus"
+
+
+def build_listing(base_url: str, job_count: int) -> bytes:
+    """Repeats the corpus listing cards until job_count cards point at the stub server"""
+    template = (CORPUS / "listing" / "jobs_browse.html").read_text(encoding='utf-8')
+    start = template.index('<div class="col-md-6 col-lg-4">')
+    end = template.rindex('</div>\n</div>')
+    cards = template[start:end].split('<div class="col-md-6 col-lg-4">')[1:]
+    
+    repeated = []
+    for i in range(job_count):
+        card = cards[i % len(cards)].replace('href="/jobmarket/jobs/', f'href="{base_url}/jobmarket/jobs/bench{i}-')
+        repeated.append('<div class="col-md-6 col-lg-4">' + card)
+    return (template[:start] + ''.join(repeated) + template[end:]).encode('utf-8')
+
+
+def start_stub_server(job_count: int, latency: float):
+    """Starts GModStore + Discord stub server in a background thread"""
+    details = [path.read_bytes() for path in sorted((CORPUS / "detail").glob("*.html"))]
+    state = {}
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def log_message(self, *args):
+            pass
+        
+        def _send(self, status: int, body: bytes = b''):
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if body:
+                try:
+                    self.wfile.write(body)
+                except ConnectionError:
+                    pass  # Client stopped reading early
+        
+        def do_GET(self):
+            time.sleep(latency)
+            if self.path.startswith('/jobmarket/jobs/browse'):
+                self._send(200, state['listing'])
+            elif self.path.startswith('/jobmarket/jobs/'):
+                self._send(200, details[hash(self.path) % len(details)])
+            else:
+                self._send(404)
+        
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            time.sleep(latency)
+            self._send(204)
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    state['listing'] = build_listing(base_url, job_count)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, base_url
+
+
+def run_sync(webhook_url: str) -> tuple:
+    scraper = JobScraper()
+    webhook = DiscordWebhook(webhook_url)
+    webhook.rate_limit_delay = 0
+    
+    start = time.perf_counter()
+    jobs = scraper.fetch_jobs()
+    sent = webhook.send_jobs(jobs)
+    return time.perf_counter() - start, len(jobs), sent
+
+
+def run_async(webhook_url: str, concurrency: int) -> tuple:
+    async def pipeline():
+        scraper = AsyncJobScraper()
+        scraper.max_concurrency = concurrency
+        webhook = AsyncDiscordWebhook(webhook_url)
+        webhook.rate_limit_delay = 0
+        try:
+            jobs = await scraper.fetch_jobs_async()
+            sent = await webhook.send_jobs_async(jobs)
+            return len(jobs), sent
+        finally:
+            await scraper.aclose()
+            await webhook.aclose()
+    
+    start = time.perf_counter()
+    job_count, sent = asyncio.run(pipeline())
+    return time.perf_counter() - start, job_count, sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async pipeline benchmark")
+    parser.add_argument('--jobs', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.05, help="Stub server latency per request (seconds)")
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+    
+    server, base_url = start_stub_server(args.jobs, args.latency)
+    config.GMODSTORE_JOBS_URL = f"{base_url}/jobmarket/jobs/browse"
+    config.DETAIL_REQUEST_DELAY = 0
+    config.CIRCUIT_LATENCY_SLO = None
+    webhook_url = f"{base_url}/api/webhooks/bench"
+    
+    # Silence per-job logging
+    real_stdout = sys.stdout
+    sys.stdout = open('/dev/null' if sys.platform != 'win32' else 'nul', 'w')
+    try:
+        sync_time, sync_jobs, sync_sent = run_sync(webhook_url)
+        async_time, async_jobs, async_sent = run_async(webhook_url, args.concurrency)
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+        server.shutdown()
+    
+    print(f"Jobs: {args.jobs} | Stub latency: {args.latency * 1000:.0f} ms | Async concurrency: {args.concurrency}")
+    print(f"Sync pipeline:  {sync_time:7.2f}s ({sync_jobs} jobs, {sync_sent} sent)")
+    print(f"Async pipeline: {async_time:7.2f}s ({async_jobs} jobs, {async_sent} sent)")
+    print(f"Speedup:        {sync_time / async_time:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
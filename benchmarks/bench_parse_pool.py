@@ -0,0 +1,74 @@
+"""
+Parse Pool Benchmark
+Measures detail page parsing throughput (pages/sec) in-process vs. with 1..N worker processes
+
+Usage:
+    python benchmarks/bench_parse_pool.py [--pages 400] [--max-workers 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from parse_pool import ParsePool
+from scraper import JobScraper
+
+CORPUS = ROOT / "corpus"
+
+
+def load_pages(count: int) -> list:
+    """Cycles the saved detail pages until count pages are loaded"""
+    fixtures = [path.read_bytes() for path in sorted((CORPUS / "detail").glob("*.html"))]
+    return [fixtures[i % len(fixtures)] for i in range(count)]
+
+
+def run_in_process(pages: list) -> float:
+    start = time.perf_counter()
+    for content in pages:
+        JobScraper._parse_job_details(content)
+    return time.perf_counter() - start
+
+
+def run_pool(pages: list, workers: int) -> float:
+    pool = ParsePool(workers)
+    try:
+        # Warm up (start workers, preload selectors)
+        for future in [pool.submit(pages[0]) for _ in range(workers)]:
+            pool.result(future)
+        
+        start = time.perf_counter()
+        futures = [pool.submit(content) for content in pages]
+        for future in futures:
+            pool.result(future)
+        return time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse pool benchmark")
+    parser.add_argument('--pages', type=int, default=400)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    pages = load_pages(args.pages)
+    page_kb = sum(len(content) for content in pages) / len(pages) / 1024
+    print(f"Pages: {args.pages} (avg {page_kb:.1f} KB) | CPU cores: {os.cpu_count()}")
+    
+    baseline = run_in_process(pages)
+    print(f"In-process:  {args.pages / baseline:8.1f} pages/sec")
+    
+    workers = 1
+    while workers <= args.max_workers:
+        elapsed = run_pool(pages, workers)
+        print(f"{workers:2d} workers:  {args.pages / elapsed:8.1f} pages/sec ({baseline / elapsed:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Subscription Matching Benchmark
+Compares the compiled automaton against a naive per-pattern re.search loop
+
+Usage:
+    python benchmarks/bench_subscriptions.py [--patterns 10000] [--jobs 1000]
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from subscriptions import SubscriptionEngine
+
+CATEGORIES = ["Gamemode", "Addon", "Modelling", "Mapping", "Lua", "Other"]
+
+
+def random_word(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+
+
+def build_subscriptions(rng: random.Random, pattern_count: int, vocabulary: list) -> list:
+    """Creates subscriptions with ~95% keywords and ~5% regex patterns"""
+    subscriptions = []
+    for i in range(0, pattern_count, 10):
+        keywords = []
+        patterns = []
+        for _ in range(min(10, pattern_count - i)):
+            word = rng.choice(vocabulary)
+            if rng.random() < 0.05:
+                patterns.append(rf"\b{word}\w*\s+dev")
+            else:
+                keywords.append(word)
+        subscriptions.append({"mention": f"<@&{i}>", "keywords": keywords, "patterns": patterns})
+    return subscriptions
+
+
+def build_jobs(rng: random.Random, job_count: int, vocabulary: list) -> list:
+    return [
+        {
+            "title": ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(4, 10))),
+            "category": rng.choice(CATEGORIES),
+        }
+        for _ in range(job_count)
+    ]
+
+
+def naive_match(subscriptions: list, jobs: list) -> list:
+    """Reference implementation: one re.search per pattern per job"""
+    compiled = []
+    for sub in subscriptions:
+        regexes = [re.compile(rf"\b{re.escape(k)}\b", re.I) for k in sub['keywords']]
+        regexes += [re.compile(p, re.I) for p in sub['patterns']]
+        compiled.append((sub['mention'], regexes))
+    
+    results = []
+    for job in jobs:
+        text = f"{job['title']} | {job['category']}"
+        results.append([mention for mention, regexes in compiled if any(r.search(text) for r in regexes)])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Subscription matching benchmark")
+    parser.add_argument('--patterns', type=int, default=10000)
+    parser.add_argument('--jobs', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    vocabulary = [random_word(rng) for _ in range(50000)]
+    subscriptions = build_subscriptions(rng, args.patterns, vocabulary)
+    jobs = build_jobs(rng, args.jobs, vocabulary)
+    
+    config.SUBSCRIPTIONS = subscriptions
+    start = time.perf_counter()
+    engine = SubscriptionEngine(subscriptions_file='')
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    engine_results = [engine.match(job) for job in jobs]
+    match_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    engine.refresh()
+    refresh_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    naive_results = naive_match(subscriptions, jobs)
+    naive_time = time.perf_counter() - start
+    
+    mismatches = sum(1 for a, b in zip(engine_results, naive_results) if a != b)
+    
+    print(f"Patterns: {args.patterns} | Jobs: {args.jobs}")
+    print(f"Automaton build:      {build_time * 1000:9.1f} ms")
+    print(f"Refresh (unchanged):  {refresh_time * 1000:9.1f} ms")
+    print(f"Automaton matching:   {match_time * 1000:9.1f} ms ({match_time / len(jobs) * 1e6:.1f} us/job)")
+    print(f"Naive re.search loop: {naive_time * 1000:9.1f} ms ({naive_time / len(jobs) * 1e6:.1f} us/job)")
+    print(f"Speedup:              {naive_time / match_time:9.1f}x")
+    print(f"Result mismatches:    {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Parser Regression Check
+Parses the saved corpus pages, compares them with the expected extraction output
+and reports parse throughput per page type
+
+Usage:
+    python benchmarks/check_corpus.py [--repeat 50] [--update]
+
+Expected output lives next to each page as <page>.expected.json. After an intended
+parser change, review the diff and regenerate it with --update.
+
+The corpus pages are synthetic - hand-written in the markup the parser targets, not
+saved from gmodstore.com - and their expected output was generated by this parser.
+The check catches unintended parser changes, it does not prove the parser matches the
+live site (see corpus/README.md for adding real pages).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from drift import ParserDriftDetector
+from scraper import JobScraper
+
+CORPUS = ROOT / "corpus"
+
+
+def expected_path(page: Path) -> Path:
+    return page.with_name(page.stem + ".expected.json")
+
+
+def parse_page(scraper: JobScraper, page_type: str, content: bytes):
+    # The listing parser logs every call
+    with contextlib.redirect_stdout(io.StringIO()):
+        if page_type == "listing":
+            return scraper._parse_listing(content)
+        return scraper._parse_job_details(content)
+
+
+def diff(expected, actual, path: str = "") -> list:
+    """Lists differing fields between expected and actual output"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        problems = []
+        for key in sorted(set(expected) | set(actual)):
+            if key not in actual:
+                problems.append(f"{path}{key}: missing (expected {expected[key]!r})")
+            elif key not in expected:
+                problems.append(f"{path}{key}: unexpected {actual[key]!r}")
+            else:
+                problems += diff(expected[key], actual[key], f"{path}{key}.")
+        return problems
+    if isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        problems = []
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            problems += diff(a, b, f"{path}[{i}].")
+        return problems
+    if expected != actual:
+        return [f"{path.rstrip('.')}: expected {expected!r}, got {actual!r}"]
+    return []
+
+
+def check(scraper: JobScraper, update: bool) -> int:
+    """Compares every corpus page with its expected output, returns the number of failing pages"""
+    failures = 0
+    for page_type in ("listing", "detail"):
+        for page in sorted((CORPUS / page_type).glob("*.html")):
+            actual = parse_page(scraper, page_type, page.read_bytes())
+            target = expected_path(page)
+            
+            if update:
+                target.write_text(json.dumps(actual, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+                print(f"UPDATED {page_type}/{page.name}")
+                continue
+            if not target.exists():
+                print(f"MISSING {page_type}/{page.name} (run with --update)")
+                failures += 1
+                continue
+            
+            problems = diff(json.loads(target.read_text(encoding='utf-8')), actual)
+            if problems:
+                failures += 1
+                print(f"FAIL    {page_type}/{page.name}")
+                for problem in problems:
+                    print(f"          {problem}")
+            else:
+                print(f"OK      {page_type}/{page.name}")
+    return failures
+
+
+def throughput(scraper: JobScraper, repeat: int):
+    """Prints parse throughput per page type"""
+    for page_type in ("listing", "detail"):
+        pages = [page.read_bytes() for page in sorted((CORPUS / page_type).glob("*.html"))]
+        if not pages:
+            continue
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for content in pages:
+                parse_page(scraper, page_type, content)
+        elapsed = time.perf_counter() - start
+        count = repeat * len(pages)
+        size_kb = sum(len(content) for content in pages) / len(pages) / 1024
+        print(f"{page_type:8s} {count / elapsed:8.1f} pages/sec ({elapsed / count * 1000:.2f} ms/page, avg {size_kb:.1f} KB)")
+
+
+def drift_rates(scraper: JobScraper) -> dict:
+    """Runs the corpus through the drift detector (rates of a healthy parser)"""
+    detector = ParserDriftDetector()
+    scraper.drift_detector = detector
+    for page in sorted((CORPUS / "listing").glob("*.html")):
+        parse_page(scraper, "listing", page.read_bytes())
+    for page in sorted((CORPUS / "detail").glob("*.html")):
+        detector.observe_detail(parse_page(scraper, "detail", page.read_bytes()))
+    return detector.rates()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser regression check")
+    parser.add_argument('--repeat', type=int, default=50, help="Parses per page for the throughput run")
+    parser.add_argument('--update', action='store_true', help="Rewrite the expected output")
+    args = parser.parse_args()
+    
+    scraper = JobScraper()
+    failures = check(scraper, args.update)
+    if args.update:
+        return
+    
+    print()
+    throughput(scraper, args.repeat)
+    
+    print()
+    rates = drift_rates(scraper)
+    print("Drift rates: " + ", ".join(f"{metric} {rate:.0%}" for metric, rate in rates.items()))
+    
+    if failures:
+        print(f"\n{failures} corpus pages failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Seen-Set False Positive Check
+Fills Bloom seen-set filters through several stages and asserts that the false positive
+rate actually achieved stays below the configured target after every stage
+
+Usage:
+    python benchmarks/check_seen_set.py [--capacity 5000] [--stages 5] [--trials 200000]
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from seen_set import STAGE_GROWTH, ScalableBloomFilter
+
+TARGETS = (0.01, 0.003, 0.001, 0.0001)
+
+# Measured rates are sampled - allow this many binomial standard deviations over the target
+SAMPLING_SIGMAS = 3
+
+
+def measure(bloom: ScalableBloomFilter, trials: int, tag: str) -> float:
+    """Share of never-added IDs the filter reports as seen"""
+    hits = sum(1 for i in range(trials) if f"absent-{tag}-{i}" in bloom)
+    return hits / trials
+
+
+def check_target(error_rate: float, capacity: int, stages: int, trials: int) -> int:
+    """Fills a filter stage by stage, returns the number of stages over the target"""
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        bloom = ScalableBloomFilter(Path(tmp) / "check.bloom", capacity, error_rate)
+        added = 0
+        for stage in range(1, stages + 1):
+            # Fill up to the point where the newest stage is full (worst case)
+            full = capacity * (STAGE_GROWTH ** stage - 1) // (STAGE_GROWTH - 1)
+            while added < full:
+                bloom.add(f"seen-{added}")
+                added += 1
+            
+            rate = measure(bloom, trials, f"{stage}")
+            ok = rate <= error_rate + SAMPLING_SIGMAS * math.sqrt(error_rate * (1 - error_rate) / trials)
+            failures += not ok
+            hashes = "/".join(str(entry[1]) for entry in bloom.stages)
+            print(f"{'OK  ' if ok else 'FAIL'} target {error_rate:<7g} stages {len(bloom.stages)} "
+                  f"({added:>7} IDs, hashes {hashes}): measured {rate:.5f}")
+        bloom.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seen-set false positive check")
+    parser.add_argument('--capacity', type=int, default=5000, help="IDs in the first filter stage")
+    parser.add_argument('--stages', type=int, default=5, help="Stages to fill")
+    parser.add_argument('--trials', type=int, default=200000, help="Lookups of unseen IDs per measurement")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    failures = sum(check_target(error_rate, args.capacity, args.stages, args.trials) for error_rate in TARGETS)
+    print(f"\nChecked {len(TARGETS)} targets in {time.perf_counter() - start:.1f}s")
+    
+    if failures:
+        print(f"{failures} measurements over the target false positive rate")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Circuit Breaker Module
+Stops calling an endpoint after repeated failures and probes it again later
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+import config
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+    
+    closed    -> requests pass, consecutive failures (or SLO breaches) are counted
+    open      -> requests are short-circuited until reset_timeout passes
+    half_open -> a limited number of probe requests decide between closed and open
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, name: str, failure_threshold: Optional[int] = None,
+                 latency_slo: Optional[float] = None, reset_timeout: Optional[float] = None,
+                 half_open_max_calls: int = 1):
+        """
+        Initializes circuit breaker
+        
+        Args:
+            name: Endpoint name (for logging)
+            failure_threshold: Consecutive failures before the circuit opens
+            latency_slo: Successful calls slower than this (seconds) count as failures
+            reset_timeout: Seconds the circuit stays open before probing
+            half_open_max_calls: Concurrent probe requests allowed while half-open
+        """
+        self.name = name
+        self._explicit = (failure_threshold, latency_slo, reset_timeout)
+        self.reload_config()
+        self.half_open_max_calls = half_open_max_calls
+        
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._probe_started_at = 0.0
+        self._short_circuited = 0
+        self._total_failures = 0
+        self._total_successes = 0
+        self._last_error: Optional[str] = None
+    
+    def reload_config(self):
+        """Reads thresholds from config (explicit constructor arguments take precedence)"""
+        failure_threshold, latency_slo, reset_timeout = self._explicit
+        self.failure_threshold = failure_threshold or getattr(config, 'CIRCUIT_FAILURE_THRESHOLD', 3)
+        self.latency_slo = latency_slo if latency_slo is not None else getattr(config, 'CIRCUIT_LATENCY_SLO', None)
+        self.reset_timeout = reset_timeout if reset_timeout is not None else getattr(config, 'CIRCUIT_RESET_TIMEOUT', 300)
+    
+    @property
+    def state(self) -> str:
+        """Current state (open circuits turn half-open once reset_timeout has passed)"""
+        with self._lock:
+            self._update_state()
+            return self._state
+    
+    def _update_state(self):
+        """
+        Moves open -> half_open when the reset timeout has elapsed and expires probes
+        that never reported back, so a lost probe can't block the circuit forever (lock held)
+        """
+        now = time.monotonic()
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._transition(self.HALF_OPEN)
+        elif (self._state == self.HALF_OPEN and self._half_open_calls
+              and now - self._probe_started_at >= self.reset_timeout):
+            print(f"[WARNING] Circuit '{self.name}' probe never reported back, allowing a new probe")
+            self._half_open_calls = 0
+    
+    def _transition(self, state: str):
+        """Changes state and logs it (lock held)"""
+        if state == self._state:
+            return
+        previous = self._state
+        self._state = state
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            print(f"[WARNING] Circuit '{self.name}' opened after {self._consecutive_failures} failures "
+                  f"(last error: {self._last_error}), retrying in {self.reset_timeout:.0f}s")
+        elif state == self.HALF_OPEN:
+            self._half_open_calls = 0
+            print(f"[INFO] Circuit '{self.name}' half-open, probing endpoint")
+        elif previous != self.CLOSED:
+            print(f"[INFO] Circuit '{self.name}' closed, endpoint recovered")
+    
+    def allow_request(self) -> bool:
+        """
+        Checks if a request may be sent
+        
+        Returns:
+            bool: False if the request should be short-circuited
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                self._probe_started_at = time.monotonic()
+                return True
+            self._short_circuited += 1
+            return False
+    
+    def record_success(self, latency: Optional[float] = None):
+        """
+        Records a successful call
+        
+        Args:
+            latency: Call duration in seconds (checked against the latency SLO)
+        """
+        if latency is not None and self.latency_slo and latency > self.latency_slo:
+            self.record_failure(f"latency {latency:.1f}s > SLO {self.latency_slo:.1f}s")
+            return
+        
+        with self._lock:
+            self._total_successes += 1
+            self._consecutive_failures = 0
+            if self._state == self.HALF_OPEN:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+            self._transition(self.CLOSED)
+    
+    def record_failure(self, error: Optional[str] = None):
+        """
+        Records a failed call
+        
+        Args:
+            error: Error description
+        """
+        with self._lock:
+            self._total_failures += 1
+            self._consecutive_failures += 1
+            self._last_error = error
+            if self._state == self.HALF_OPEN:
+                # Failed probe - back to open
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                print(f"[WARNING] Circuit '{self.name}' probe failed ({error}), "
+                      f"retrying in {self.reset_timeout:.0f}s")
+            elif self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._transition(self.OPEN)
+    
+    def release(self):
+        """Gives back a request allowed by allow_request() that ended without a result (e.g. cancelled)"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+    
+    def retry_after(self) -> float:
+        """
+        Returns:
+            float: Seconds until the next probe is allowed (0 if not open)
+        """
+        with self._lock:
+            self._update_state()
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+    
+    def snapshot(self) -> Dict:
+        """
+        Returns:
+            Dict: Breaker state for reporting
+        """
+        with self._lock:
+            self._update_state()
+            retry_after = 0.0
+            if self._state == self.OPEN:
+                retry_after = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+            return {
+                'name': self.name,
+                'state': self._state,
+                'consecutive_failures': self._consecutive_failures,
+                'total_failures': self._total_failures,
+                'total_successes': self._total_successes,
+                'short_circuited': self._short_circuited,
+                'retry_after': round(retry_after, 1),
+                'last_error': self._last_error,
+            }
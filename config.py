@@ -9,6 +9,76 @@ CHECK_INTERVAL = 1800  # 30 minutes
 # Detail page request delay (in seconds) - prevents rate limiting
 DETAIL_REQUEST_DELAY = 1.5
 
+# Detail page download limits
+DETAIL_MAX_BYTES = 2 * 1024 * 1024        # Max (decompressed) bytes read per detail page
+DETAIL_MAX_DECOMPRESSION_RATIO = 100      # Discard pages that decompress more than this ratio
+DETAIL_MAX_SECONDS = 30                   # Max total download time per detail page
+DETAIL_STREAM_TAIL_BYTES = 16 * 1024      # Bytes read after the last field label before stopping early
+
+# Circuit breakers (GModStore listing, GModStore detail pages, Discord)
+CIRCUIT_FAILURE_THRESHOLD = 3   # Consecutive failures before an endpoint is skipped
+CIRCUIT_LATENCY_SLO = 8         # Responses slower than this (seconds) count as failures
+CIRCUIT_RESET_TIMEOUT = 300     # Seconds before a probe request is sent to a failed endpoint
+
+# Async mode - listing, concurrent detail fetches and delivery on one event loop (requires httpx)
+ASYNC_MODE = False
+ASYNC_MAX_CONCURRENCY = 4       # Max concurrent detail page requests
+
+# Detail page parsing in worker processes (0 = parse in-process, -1 = one worker per CPU core)
+PARSE_WORKERS = 0
+PARSE_MAX_PENDING = 0           # Max pages waiting for a parser worker (0 = 2 x PARSE_WORKERS)
+
+# Parse cache - detail pages whose normalized HTML is unchanged are not parsed again
+# (on by default, only skips re-parsing identical pages - set PARSE_CACHE_MAX_ENTRIES = 0 to turn off)
+PARSE_CACHE_FILE = "parse_cache.json"
+PARSE_CACHE_MAX_ENTRIES = 2000  # LRU size (0 = disabled)
+
+# Job index - detail pages are only fetched for new jobs, changed listing cards and stale entries
+# (on by default: details of unchanged listings can be up to DETAIL_STALE_TTL old - set "" for the old behaviour)
+JOB_INDEX_FILE = "job_index.json"  # Empty = fetch every detail page each cycle
+DETAIL_STALE_TTL = 6 * 3600     # Seconds before an unchanged job's details are fetched again
+DETAIL_FETCH_BUDGET = 0         # Max detail fetches per cycle, new Apply jobs first (0 = unlimited)
+DETAIL_PENDING_MAX_CYCLES = 3   # Cycles a new job without details is held unseen before it is sent with basic info
+
+# Parser drift detection - fallback selector usage and N/A field rates are compared with a running baseline
+PARSER_DRIFT_TOLERANCE = 0.25   # Rate increase over the baseline that counts as drift
+PARSER_DRIFT_WARMUP_CYCLES = 3  # First cycles only build the baseline (nothing is flagged)
+PARSER_DRIFT_MIN_SAMPLES = 5    # Min listing cards / detail pages in a cycle for its rates to count
+PARSER_DRIFT_ACTION = "warn"    # "warn" = log and send anyway, "hold" = don't send listings while drifted
+
+# Digest delivery - listings are grouped by category into a few summary messages
+DIGEST_MODE = False             # Always collect listings and send them as periodic digests
+DIGEST_WINDOW = 900             # Seconds after the first queued listing before the digest is sent
+DIGEST_MAX_JOBS = 50            # Queued listings that trigger the digest before the window ends
+DIGEST_THRESHOLD = 0            # Per-listing mode: more new listings than this are sent as a digest (0 = never)
+DIGEST_QUEUE_FILE = "digest_queue.json"
+
+# Bounded-memory seen listings - recent IDs in seen_jobs.recent.json, older ones in a memory-mapped Bloom filter
+# (seen_jobs.json is imported and left as is, so the filter can be turned off again)
+SEEN_BLOOM_FILE = ""            # Filter file, e.g. "seen_jobs.bloom" (empty = keep every seen ID in memory)
+SEEN_FALSE_POSITIVE_RATE = 0.001  # Chance an old unseen listing is taken as seen (new filter files only)
+SEEN_RECENT_SIZE = 5000         # Recent IDs kept exactly
+SEEN_BLOOM_CAPACITY = 10000     # IDs in the first filter stage, later stages double in size
+
+# Settings file layered over this file (TOML, or YAML with PyYAML installed), hot-reloaded on change or SIGHUP.
+# GMS_<NAME> environment variables override both, e.g. GMS_CHECK_INTERVAL=600
+CONFIG_FILE = "config.toml"
+CONFIG_POLL_INTERVAL = 5        # Seconds between settings file checks (0 = reload on SIGHUP only)
+
+# Local admin HTTP API: trigger a check, pause/resume delivery, queue/limiter state, cycle stats
+ADMIN_API_PORT = 0              # e.g. 8765 (0 = disabled)
+ADMIN_API_HOST = "127.0.0.1"    # Only listen on other interfaces together with ADMIN_API_TOKEN
+ADMIN_API_TOKEN = ""            # Required as "Authorization: Bearer <token>" when set
+CYCLE_STATS_HISTORY = 50        # Recent checks kept for the stats endpoint
+
+# Export of every fetched listing for offline analysis (written in the background)
+EXPORT_FORMATS = []             # Any of "jsonl", "csv", "parquet" (parquet needs pyarrow), empty = off
+EXPORT_DIR = "exports"
+EXPORT_ROTATE_MB = 64           # Start a new file after this much uncompressed data...
+EXPORT_ROTATE_HOURS = 24        # ...or after this many hours
+EXPORT_BATCH_SIZE = 500         # Records written per batch
+EXPORT_FLUSH_INTERVAL = 60      # Max seconds a record waits in the buffer
+
 # GModStore job listings URL
 GMODSTORE_JOBS_URL = "https://www.gmodstore.com/jobmarket/jobs/browse"
 
@@ -28,3 +98,20 @@ STATUS_COLORS = {
 
 # GModStore logo URL
 GMODSTORE_LOGO = "https://www.gmodstore.com/favicon.ico"
+
+# Keyword subscriptions - role/user mentions added when a job's title or category matches
+# Each entry: {"mention": "<@&ROLE_ID>", "keywords": ["darkrp", "lua"], "patterns": [r"gamemode\s+dev"]}
+# Keywords match whole words (case-insensitive), patterns are regular expressions
+SUBSCRIPTIONS = []
+
+# Optional JSON file with more subscriptions (same format, reloaded automatically when changed)
+SUBSCRIPTIONS_FILE = "subscriptions.json"
+
+# Startup webhook test: "background" (doesn't delay the first scrape), "blocking" or "off"
+STARTUP_WEBHOOK_CHECK = "background"
+
+# File where the resolved TLS CA bundle path is cached between restarts
+CA_BUNDLE_CACHE_FILE = ".ca_bundle_cache"
+
+# File where time-to-first-scrape history is kept (startup report)
+STARTUP_STATS_FILE = "startup_stats.json"
@@ -0,0 +1,258 @@
+"""
+Digest Module
+Packs many job listings into a few category-grouped Discord messages and queues them for digest delivery
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import config
+
+# Discord limits (https://discord.com/developers/docs/resources/message#embed-object-embed-limits)
+EMBED_TITLE_LIMIT = 256
+EMBED_FIELD_NAME_LIMIT = 256
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_FIELDS_LIMIT = 25
+EMBEDS_PER_MESSAGE = 10
+MESSAGE_EMBED_CHARS_LIMIT = 6000  # Combined characters of all embeds in one message
+CONTENT_LIMIT = 2000
+
+# Characters kept free per embed for the title and footer set after packing
+EMBED_TEXT_RESERVE = 120
+
+DIGEST_COLOR = 0x3498DB
+DIGEST_TITLE_LENGTH = 70
+
+STATUS_EMOJIS = {
+    "Apply": "🟢",
+    "In Progress": "🟡",
+    "Negotiations": "🟠",
+    "Finished": "⚫"
+}
+
+
+def format_digest_line(job: Dict) -> str:
+    """
+    Formats one listing as a digest table row
+    
+    Args:
+        job: Job listing data
+        
+    Returns:
+        str: "🟢 [Title](url) · $150.00 · 2 apps"
+    """
+    title = job.get('title', 'New Job Listing').replace('[', '(').replace(']', ')')
+    if len(title) > DIGEST_TITLE_LENGTH:
+        title = title[:DIGEST_TITLE_LENGTH - 1] + "…"
+    
+    parts = [f"{STATUS_EMOJIS.get(job.get('status'), '🔵')} [{title}]({job.get('url', '')})"]
+    if job.get('budget') and job['budget'] != "N/A":
+        parts.append(job['budget'])
+    parts.append(f"{job.get('applications', 0)} apps")
+    return " · ".join(parts)
+
+
+def build_category_fields(jobs: List[Dict]) -> List[Dict]:
+    """
+    Groups listings by category into embed fields (large categories are split across fields)
+    
+    Args:
+        jobs: Job listings
+        
+    Returns:
+        List[Dict]: Embed fields, biggest categories first
+    """
+    groups: Dict[str, List[Dict]] = {}
+    for job in jobs:
+        category = job.get('category') or "N/A"
+        groups.setdefault(category, []).append(job)
+    
+    fields = []
+    for category, group in sorted(groups.items(), key=lambda item: (-len(item[1]), item[0])):
+        # "jobs" remembers which listings a field covers (removed before sending)
+        field = {"name": f"📁 {category} ({len(group)})"[:EMBED_FIELD_NAME_LIMIT], "value": "", "inline": False, "jobs": []}
+        for job in group:
+            line = format_digest_line(job)[:EMBED_FIELD_VALUE_LIMIT]
+            if field["value"] and len(field["value"]) + 1 + len(line) > EMBED_FIELD_VALUE_LIMIT:
+                fields.append(field)
+                field = {"name": f"📁 {category} (cont.)"[:EMBED_FIELD_NAME_LIMIT], "value": "", "inline": False, "jobs": []}
+            field["value"] = f"{field['value']}\n{line}" if field["value"] else line
+            field["jobs"].append(job)
+        fields.append(field)
+    return fields
+
+
+def build_digest_payloads(jobs: List[Dict]) -> List[Dict]:
+    """
+    Packs listings into the fewest webhook messages that fit Discord's embed limits
+    
+    Args:
+        jobs: Job listings
+        
+    Returns:
+        List[Dict]: Webhook payloads, each with a private "jobs" key listing the covered jobs
+    """
+    messages = []
+    embeds: List[Dict] = []
+    message_chars = 0
+    
+    def close_message():
+        if embeds:
+            messages.append(list(embeds))
+            embeds.clear()
+    
+    for field in build_category_fields(jobs):
+        field_chars = len(field["name"]) + len(field["value"])
+        embed_full = not embeds or len(embeds[-1]["fields"]) >= EMBED_FIELDS_LIMIT
+        
+        if embeds and message_chars + field_chars + (EMBED_TEXT_RESERVE if embed_full else 0) > MESSAGE_EMBED_CHARS_LIMIT:
+            close_message()
+            embed_full = True
+        if embed_full:
+            if len(embeds) >= EMBEDS_PER_MESSAGE:
+                close_message()
+            if not embeds:
+                message_chars = 0
+            embeds.append({"fields": []})
+            message_chars += EMBED_TEXT_RESERVE
+        
+        embeds[-1]["fields"].append(field)
+        message_chars += field_chars
+    close_message()
+    
+    payloads = []
+    for index, message_embeds in enumerate(messages, 1):
+        covered = [job for embed in message_embeds for field in embed["fields"] for job in field.pop("jobs")]
+        page = f" ({index}/{len(messages)})" if len(messages) > 1 else ""
+        for embed in message_embeds:
+            embed["color"] = DIGEST_COLOR
+        message_embeds[0]["title"] = f"📋 {len(jobs)} new job listings{page}"[:EMBED_TITLE_LIMIT]
+        message_embeds[-1]["footer"] = {"text": "GModStore Job Market digest"}
+        
+        payload = {"embeds": message_embeds, "jobs": covered}
+        
+        # Subscription mentions of the covered listings (roles/users only, never @everyone)
+        mentions = []
+        for job in covered:
+            for mention in job.get('mentions', []):
+                if mention not in mentions:
+                    mentions.append(mention)
+        if mentions:
+            payload["content"] = " ".join(mentions)[:CONTENT_LIMIT]
+            payload["allowed_mentions"] = {"parse": ["roles", "users"]}
+        payloads.append(payload)
+    
+    return payloads
+
+
+class DigestQueue:
+    """
+    Listings waiting for the next digest, persisted so a restart doesn't drop them
+    """
+    
+    def __init__(self, queue_file: Optional[str] = None, window: Optional[float] = None,
+                 max_jobs: Optional[int] = None):
+        """
+        Initializes digest queue
+        
+        Args:
+            queue_file: JSON file the queue is persisted to
+            window: Seconds after the first queued listing before the digest is sent
+            max_jobs: Queued listings that trigger the digest before the window ends
+        """
+        if queue_file is None:
+            queue_file = getattr(config, 'DIGEST_QUEUE_FILE', None)
+        self.queue_file = Path(queue_file) if queue_file else None
+        self.window = window if window is not None else getattr(config, 'DIGEST_WINDOW', 900)
+        self.max_jobs = max_jobs if max_jobs is not None else getattr(config, 'DIGEST_MAX_JOBS', 50)
+        
+        self.jobs: List[Dict] = []
+        self.first_queued_at: Optional[float] = None
+        self._load()
+    
+    def add(self, jobs: List[Dict]):
+        """
+        Queues listings (already queued job IDs are skipped)
+        
+        Args:
+            jobs: New job listings
+        """
+        queued = {job.get('job_id') for job in self.jobs}
+        added = [job for job in jobs if job.get('job_id') not in queued]
+        if not added:
+            return
+        if not self.jobs:
+            self.first_queued_at = time.time()
+        self.jobs.extend(added)
+        self.save()
+    
+    def due(self) -> bool:
+        """
+        Returns:
+            bool: Has the time or size window been reached?
+        """
+        if not self.jobs:
+            return False
+        if self.max_jobs and len(self.jobs) >= self.max_jobs:
+            return True
+        return time.time() - (self.first_queued_at or 0) >= self.window
+    
+    def seconds_left(self) -> float:
+        """
+        Returns:
+            float: Seconds until the time window ends
+        """
+        if not self.jobs:
+            return 0.0
+        return max(0.0, self.window - (time.time() - (self.first_queued_at or 0)))
+    
+    def drain(self) -> List[Dict]:
+        """
+        Empties the queue
+        
+        Returns:
+            List[Dict]: Queued listings, oldest first
+        """
+        jobs = self.jobs
+        self.jobs = []
+        self.first_queued_at = None
+        self.save()
+        return jobs
+    
+    def requeue(self, jobs: List[Dict]):
+        """
+        Puts back listings of digest messages that were not delivered, due again at the next check
+        
+        Args:
+            jobs: Undelivered listings
+        """
+        returned = {job.get('job_id') for job in jobs}
+        self.jobs = list(jobs) + [job for job in self.jobs if job.get('job_id') not in returned]
+        self.first_queued_at = time.time() - self.window
+        self.save()
+    
+    def _load(self):
+        """Loads the queue file"""
+        if not self.queue_file or not self.queue_file.exists():
+            return
+        try:
+            with open(self.queue_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.jobs = data.get('jobs', [])
+            self.first_queued_at = data.get('first_queued_at')
+            if self.jobs:
+                print(f"[INFO] {len(self.jobs)} listings waiting for the next digest")
+        except Exception as e:
+            print(f"[WARNING] Could not load digest queue: {e}")
+    
+    def save(self):
+        """Saves the queue file"""
+        if not self.queue_file:
+            return
+        try:
+            with open(self.queue_file, 'w', encoding='utf-8') as f:
+                json.dump({'first_queued_at': self.first_queued_at, 'jobs': self.jobs}, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"[WARNING] Could not save digest queue: {e}")
@@ -3,10 +3,15 @@ Discord Webhook Module
 Sends job listings to Discord as embeds
 """
 
-import requests
+import threading
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 import config
+from circuit_breaker import CircuitBreaker
+from digest import build_digest_payloads
+from startup import lazy_import
+
+requests = lazy_import('requests')
 
 
 class DiscordWebhook:
@@ -19,6 +24,13 @@ class DiscordWebhook:
         """
         self.webhook_url = webhook_url
         self.rate_limit_delay = 1  # Minimum wait time between messages (seconds)
+        self.healthy: Optional[bool] = None  # Result of the last webhook test
+        self.breaker = CircuitBreaker('discord')
+    
+    def apply_config(self):
+        """Applies reloaded settings (messages being sent finish with the old URL)"""
+        self.webhook_url = config.DISCORD_WEBHOOK_URL
+        self.breaker.reload_config()
     
     def send_job(self, job: Dict) -> bool:
         """
@@ -30,32 +42,54 @@ class DiscordWebhook:
         Returns:
             bool: Success?
         """
-        try:
-            embed = self._create_embed(job)
-            payload = {
-                "embeds": [embed]
-            }
+        if not self.breaker.allow_request():
+            print(f"[WARNING] Discord circuit open, not sending: {job['title']}")
+            return False
+        
+        if self._post_payload(self._build_payload(job)):
+            print(f"[SUCCESS] Listing sent: {job['title']}")
+            return True
+        return False
+    
+    def _post_payload(self, payload: Dict) -> bool:
+        """
+        Posts a webhook payload, waiting out rate limits and recording the result on the circuit breaker
+        
+        Args:
+            payload: Discord webhook payload
             
+        Returns:
+            bool: Success?
+        """
+        try:
+            start = time.perf_counter()
             response = requests.post(
                 self.webhook_url,
                 json=payload,
                 timeout=10
             )
+            latency = time.perf_counter() - start
             
             if response.status_code == 204:
-                print(f"[SUCCESS] Listing sent: {job['title']}")
+                self.breaker.record_success(latency)
                 return True
             elif response.status_code == 429:
-                # Rate limit
+                # Rate limit (endpoint is healthy, just busy)
+                self.breaker.record_success()
                 retry_after = response.json().get('retry_after', 5)
                 print(f"[WARNING] Rate limit! Waiting {retry_after} seconds...")
                 time.sleep(retry_after)
-                return self.send_job(job)  # Retry
+                return self._post_payload(payload)  # Retry
             else:
+                if response.status_code >= 500:
+                    self.breaker.record_failure(f"HTTP {response.status_code}")
+                else:
+                    self.breaker.record_success(latency)
                 print(f"[ERROR] Discord webhook error: {response.status_code} - {response.text}")
                 return False
                 
         except Exception as e:
+            self.breaker.record_failure(f"{type(e).__name__}: {e}")
             print(f"[ERROR] Error sending listing: {e}")
             return False
     
@@ -71,7 +105,11 @@ class DiscordWebhook:
         """
         sent_count = 0
         
-        for job in jobs:
+        for index, job in enumerate(jobs):
+            if self.breaker.state == CircuitBreaker.OPEN:
+                print(f"[WARNING] Discord circuit open, skipping {len(jobs) - index} pending listings")
+                break
+            
             if self.send_job(job):
                 sent_count += 1
             
@@ -80,6 +118,61 @@ class DiscordWebhook:
         
         return sent_count
     
+    def send_digest(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Sends job listings as a category-grouped digest (a few messages instead of one per listing)
+        
+        Args:
+            jobs: List of job listings
+            
+        Returns:
+            List[Dict]: Listings of digest messages that were not delivered (empty if all were sent)
+        """
+        payloads = build_digest_payloads(jobs)
+        print(f"[INFO] Sending digest of {len(jobs)} listings in {len(payloads)} messages...")
+        undelivered = []
+        
+        for index, payload in enumerate(payloads):
+            covered = payload.pop('jobs')
+            if not self.breaker.allow_request():
+                print(f"[WARNING] Discord circuit open, skipping {len(payloads) - index} digest messages")
+                undelivered.extend(covered)
+                for skipped in payloads[index + 1:]:
+                    undelivered.extend(skipped['jobs'])
+                break
+            
+            if self._post_payload(payload):
+                print(f"[SUCCESS] Digest message sent ({index + 1}/{len(payloads)}, {len(covered)} listings)")
+            else:
+                undelivered.extend(covered)
+            
+            # Rate limit protection
+            if index < len(payloads) - 1:
+                time.sleep(self.rate_limit_delay)
+        
+        return undelivered
+    
+    def _build_payload(self, job: Dict) -> Dict:
+        """
+        Creates webhook payload for a job listing
+        
+        Args:
+            job: Job listing data
+            
+        Returns:
+            Dict: Discord webhook payload
+        """
+        payload = {
+            "embeds": [self._create_embed(job)]
+        }
+        
+        # Subscription mentions (roles/users only, never @everyone)
+        if job.get('mentions'):
+            payload["content"] = " ".join(job['mentions'])
+            payload["allowed_mentions"] = {"parse": ["roles", "users"]}
+        
+        return payload
+    
     def _create_embed(self, job: Dict) -> Dict:
         """
         Creates Discord embed for job listing
@@ -161,6 +254,10 @@ class DiscordWebhook:
                 "inline": True
             })
         
+        # Sent without detail page data (see DETAIL_PENDING_MAX_CYCLES)
+        if job.get('details_pending'):
+            embed["footer"]["text"] += " • details unavailable"
+        
         return embed
     
     def _get_status_emoji(self, status: str) -> str:
@@ -181,6 +278,24 @@ class DiscordWebhook:
         }
         return emoji_map.get(status, "🔵")
     
+    def _build_test_payload(self) -> Dict:
+        """
+        Creates the startup test message payload
+        
+        Returns:
+            Dict: Discord webhook payload
+        """
+        test_embed = {
+            "title": "🚀 GModStore Job Scraper Started",
+            "description": "Scraper is running successfully and monitoring new job listings!",
+            "color": 0x00FF00,
+            "footer": {
+                "text": "GModStore Job Market Scraper"
+            }
+        }
+        
+        return {"embeds": [test_embed]}
+    
     def test_webhook(self) -> bool:
         """
         Tests if webhook is working
@@ -189,16 +304,7 @@ class DiscordWebhook:
             bool: Is working?
         """
         try:
-            test_embed = {
-                "title": "🚀 GModStore Job Scraper Started",
-                "description": "Scraper is running successfully and monitoring new job listings!",
-                "color": 0x00FF00,
-                "footer": {
-                    "text": "GModStore Job Market Scraper"
-                }
-            }
-            
-            payload = {"embeds": [test_embed]}
+            payload = self._build_test_payload()
             
             response = requests.post(
                 self.webhook_url,
@@ -208,14 +314,28 @@ class DiscordWebhook:
             
             if response.status_code == 204:
                 print("[SUCCESS] Webhook test successful!")
+                self.healthy = True
                 return True
             else:
                 print(f"[ERROR] Webhook test failed: {response.status_code}")
+                self.healthy = False
                 return False
                 
         except Exception as e:
             print(f"[ERROR] Webhook test error: {e}")
+            self.healthy = False
             return False
+    
+    def start_health_check(self) -> threading.Thread:
+        """
+        Runs the webhook test in a background thread so it doesn't block startup
+        
+        Returns:
+            threading.Thread: Health check thread (result in self.healthy)
+        """
+        thread = threading.Thread(target=self.test_webhook, name="webhook-health-check", daemon=True)
+        thread.start()
+        return thread
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""
+Parser Drift Module
+Tracks fallback selector usage and N/A field rates per cycle to catch GModStore markup changes
+"""
+
+from typing import Dict, List, Optional
+
+import config
+
+# Listing card fields that are "N/A" when their selector stops matching
+LISTING_FIELDS = ('budget', 'category', 'listed_date')
+
+# Detail page fields that are missing when their label heuristic stops matching
+DETAIL_FIELDS = ('status', 'budget', 'due_date', 'applications', 'views', 'category')
+
+# Key under which the detail parser reports fields extracted through a fallback path
+FALLBACKS_KEY = '_fallbacks'
+
+
+class ParserDriftDetector:
+    """
+    Compares each cycle's fallback and N/A rates with a running baseline.
+    
+    listing_fallback -> alternative 'div.item-listing' card selector was needed
+    listing_na       -> share of card fields that came out "N/A"
+    detail_fallback  -> share of detail pages where a field needed a fallback path
+    detail_na        -> share of detail fields that could not be extracted
+    
+    The baseline of a metric is the mean of its first warm-up cycles (never flagged), so fields
+    that are normally empty on GModStore don't read as drift. Cycles with fewer than min_samples
+    cards/pages are skipped, a handful of pages gives too noisy a rate.
+    """
+    
+    # Weight of the current cycle in the running baseline
+    SMOOTHING = 0.2
+    
+    def __init__(self, tolerance: Optional[float] = None, warmup_cycles: Optional[int] = None,
+                 min_samples: Optional[int] = None):
+        """
+        Initializes drift detector
+        
+        Args:
+            tolerance: Rate increase over the baseline that is flagged as drift
+            warmup_cycles: Cycles per metric that only build the baseline
+            min_samples: Min listing cards / detail pages in a cycle for its rates to count
+        """
+        self.tolerance = tolerance if tolerance is not None else getattr(config, 'PARSER_DRIFT_TOLERANCE', 0.25)
+        self.warmup_cycles = warmup_cycles if warmup_cycles is not None else getattr(config, 'PARSER_DRIFT_WARMUP_CYCLES', 3)
+        self.min_samples = min_samples if min_samples is not None else getattr(config, 'PARSER_DRIFT_MIN_SAMPLES', 5)
+        self.baseline: Dict[str, float] = {}
+        self._baseline_cycles: Dict[str, int] = {}  # Cycles folded into each metric's baseline
+        self.alerts: List[str] = []
+        self.start_cycle()
+    
+    def start_cycle(self):
+        """Resets per-cycle counters"""
+        self._listing_fallback = False
+        self._cards = 0
+        self._listing_na: Dict[str, int] = dict.fromkeys(LISTING_FIELDS, 0)
+        self._pages = 0
+        self._fallback_pages = 0
+        self._detail_na: Dict[str, int] = dict.fromkeys(DETAIL_FIELDS, 0)
+        self.alerts = []
+    
+    def observe_listing_fallback(self):
+        """Records that the primary card selector found nothing"""
+        self._listing_fallback = True
+    
+    def observe_listing(self, jobs: List[Dict]):
+        """
+        Records N/A card fields of a parsed listing page
+        
+        Args:
+            jobs: Parsed job listings
+        """
+        self._cards += len(jobs)
+        for job in jobs:
+            for field in LISTING_FIELDS:
+                if job.get(field, "N/A") == "N/A":
+                    self._listing_na[field] += 1
+    
+    def observe_detail(self, details: Dict):
+        """
+        Records missing fields and fallback usage of a parsed detail page.
+        Removes the parser's fallback marker from details.
+        
+        Args:
+            details: Extracted details (failed fetches should not be observed)
+        """
+        fallbacks = details.pop(FALLBACKS_KEY, None)
+        self._pages += 1
+        if fallbacks:
+            self._fallback_pages += 1
+        for field in DETAIL_FIELDS:
+            if field not in details:
+                self._detail_na[field] += 1
+    
+    @property
+    def flagged(self) -> bool:
+        """Did the last finished cycle drift?"""
+        return bool(self.alerts)
+    
+    @property
+    def warming_up(self) -> bool:
+        """Is the baseline still being built (no cycle counted yet, or a metric within its warm-up)?"""
+        cycles = self._baseline_cycles.values()
+        return not cycles or any(count < self.warmup_cycles for count in cycles)
+    
+    def rates(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: Rates of the current cycle (metrics without data are left out)
+        """
+        rates = {'listing_fallback': 1.0 if self._listing_fallback else 0.0}
+        if self._cards:
+            rates['listing_na'] = sum(self._listing_na.values()) / (self._cards * len(LISTING_FIELDS))
+        if self._pages:
+            rates['detail_fallback'] = self._fallback_pages / self._pages
+            rates['detail_na'] = sum(self._detail_na.values()) / (self._pages * len(DETAIL_FIELDS))
+        return rates
+    
+    def finish_cycle(self) -> List[str]:
+        """
+        Compares the cycle with the baseline and prints drift warnings
+        
+        Returns:
+            List[str]: Drift alerts (empty if the cycle looks normal)
+        """
+        samples = {'listing_na': self._cards, 'detail_fallback': self._pages, 'detail_na': self._pages}
+        alerts = []
+        for metric, rate in self.rates().items():
+            if samples.get(metric, self.min_samples) < self.min_samples:
+                continue
+            
+            baseline = self.baseline.get(metric, 0.0)
+            cycles = self._baseline_cycles.get(metric, 0)
+            if cycles < self.warmup_cycles:
+                # Warm-up - the baseline is the mean of the first cycles
+                self.baseline[metric] = baseline + (rate - baseline) / (cycles + 1)
+                self._baseline_cycles[metric] = cycles + 1
+            elif rate - baseline >= self.tolerance:
+                alerts.append(f"{metric} {rate:.0%} (baseline {baseline:.0%}){self._worst_fields(metric)}")
+            else:
+                # Drifted cycles are kept out of the baseline so a lasting break stays flagged
+                self.baseline[metric] = baseline + self.SMOOTHING * (rate - baseline)
+                self._baseline_cycles[metric] = cycles + 1
+        
+        self.alerts = alerts
+        for alert in alerts:
+            print(f"[WARNING] Parser drift: {alert} - GModStore markup may have changed")
+        return alerts
+    
+    def _worst_fields(self, metric: str) -> str:
+        """Lists the fields behind an N/A alert"""
+        counts = {'listing_na': self._listing_na, 'detail_na': self._detail_na}.get(metric)
+        if not counts:
+            return ""
+        fields = [field for field, count in sorted(counts.items(), key=lambda item: -item[1]) if count]
+        return f", fields: {', '.join(fields)}"
@@ -0,0 +1,617 @@
+"""
+Export Module
+Streams every fetched job listing to rotating, compressed JSONL/CSV files or Parquet for offline analysis
+
+Usage (bulk conversion of exported history):
+    python export.py convert exports/ --to parquet --out exports/parquet
+    python export.py convert exports/jobs-20260101-000000-1.csv.gz --to jsonl --out converted/
+
+Files being written end in .part and are renamed once they are rotated or the bot stops.
+After a crash, JSONL/CSV parts are salvaged; Parquet parts have no footer and are moved
+aside as .corrupt.
+"""
+
+import abc
+import argparse
+import csv
+import gzip
+import io
+import json
+import queue
+import re
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import config
+
+# Columns of every export record (fixed so CSV and Parquet files share one schema)
+EXPORT_FIELDS = (
+    'scraped_at', 'job_id', 'title', 'url', 'status', 'category', 'budget', 'budget_amount',
+    'applications', 'views', 'listed_date', 'due_date',
+)
+INT_FIELDS = ('applications', 'views')
+FLOAT_FIELDS = ('budget_amount',)
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'parquet')
+PART_SUFFIX = '.part'
+CORRUPT_SUFFIX = '.corrupt'  # Unfinished files that can't be read back (kept for inspection)
+
+BUDGET_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+
+def parse_budget(budget: Optional[str]) -> Optional[float]:
+    """
+    Args:
+        budget: Budget text, e.g. "$1,200.00"
+        
+    Returns:
+        Optional[float]: Amount, or None if the budget has no number
+    """
+    match = BUDGET_PATTERN.search(budget or '')
+    if not match:
+        return None
+    return float(match.group(0).replace(',', ''))
+
+
+def to_record(job: Dict, scraped_at: str) -> Dict:
+    """
+    Converts a job listing to an export record
+    
+    Args:
+        job: Job listing data
+        scraped_at: ISO-8601 UTC time of the check
+        
+    Returns:
+        Dict: Record with EXPORT_FIELDS ("N/A" becomes None)
+    """
+    record = {'scraped_at': scraped_at}
+    for field in EXPORT_FIELDS[1:]:
+        value = job.get(field)
+        record[field] = None if value == "N/A" else value
+    record['budget_amount'] = parse_budget(job.get('budget'))
+    return record
+
+
+def coerce_record(record: Dict) -> Dict:
+    """
+    Restores column types of a record read from CSV (or an older file)
+    
+    Args:
+        record: Raw record
+        
+    Returns:
+        Dict: Record with EXPORT_FIELDS and typed numbers
+    """
+    typed = {}
+    for field in EXPORT_FIELDS:
+        value = record.get(field)
+        if value == '' or value is None:
+            typed[field] = None
+        elif field in INT_FIELDS:
+            typed[field] = int(float(value))
+        elif field in FLOAT_FIELDS:
+            typed[field] = float(value)
+        else:
+            typed[field] = str(value)
+    return typed
+
+
+def _pyarrow():
+    """Imports pyarrow (optional dependency, only needed for Parquet)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Parquet export needs the 'pyarrow' package (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+
+class RotatingSink(abc.ABC):
+    """
+    Writes records to <prefix>-<time>-<n>.<extension> files in a directory and starts a new file
+    after rotate_bytes of (uncompressed) data or rotate_seconds
+    """
+    
+    extension = ''
+    recoverable = True  # Can an unfinished file be read up to its last complete batch?
+    
+    def __init__(self, directory: str, rotate_bytes: int, rotate_seconds: float, prefix: str = "jobs",
+                 recover: bool = True):
+        """
+        Initializes sink
+        
+        Args:
+            directory: Output directory
+            rotate_bytes: Uncompressed bytes per file (0 = no size limit)
+            rotate_seconds: Seconds per file (0 = no time limit)
+            prefix: File name prefix
+            recover: Finalize unfinished files of this prefix left behind by a crash? (only safe
+                when no other process is writing them)
+        """
+        self.directory = Path(directory)
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.prefix = prefix
+        self.path: Optional[Path] = None
+        self.files_written = 0
+        self._bytes = 0
+        self._opened_at = 0.0
+        self._sequence = 0
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if recover:
+            self._recover()
+    
+    def _recover(self):
+        """
+        Finalizes files left behind by a crash (their last batch may be cut off), or moves
+        them aside as .corrupt if the format can't be read without a proper close
+        """
+        for part in self.directory.glob(f"{self.prefix}-*.{self.extension}{PART_SUFFIX}"):
+            name = part.name[:-len(PART_SUFFIX)]
+            if self.recoverable:
+                part.rename(part.with_name(name))
+                print(f"[WARNING] Recovered unfinished export file {part.name}")
+            else:
+                part.rename(part.with_name(name + CORRUPT_SUFFIX))
+                print(f"[WARNING] Unfinished export file {part.name} can't be recovered, "
+                      f"moved aside as {name + CORRUPT_SUFFIX}")
+    
+    def write(self, records: List[Dict]):
+        """
+        Writes a batch of records
+        
+        Args:
+            records: Export records
+        """
+        if not records:
+            return
+        if self.path is not None and self._should_rotate():
+            self.close()
+        if self.path is None:
+            self._sequence += 1
+            name = f"{self.prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{self._sequence}.{self.extension}"
+            self.path = self.directory / (name + PART_SUFFIX)
+            self._opened_at = time.monotonic()
+            self._bytes = 0
+            self._open()
+        self._bytes += self._write(records)
+    
+    def _should_rotate(self) -> bool:
+        if self.rotate_bytes and self._bytes >= self.rotate_bytes:
+            return True
+        return bool(self.rotate_seconds) and time.monotonic() - self._opened_at >= self.rotate_seconds
+    
+    def close(self):
+        """Finishes the current file and gives it its final name"""
+        if self.path is None:
+            return
+        self._close()
+        self.path.rename(self.path.with_name(self.path.name[:-len(PART_SUFFIX)]))
+        self.path = None
+        self.files_written += 1
+    
+    def flush(self):
+        """Makes written batches durable (called after every pipeline batch)"""
+    
+    @abc.abstractmethod
+    def _open(self):
+        """Opens self.path for writing"""
+    
+    @abc.abstractmethod
+    def _write(self, records: List[Dict]) -> int:
+        """Writes records to the open file, returns the uncompressed bytes written"""
+    
+    @abc.abstractmethod
+    def _close(self):
+        """Finishes and closes the open file"""
+
+
+class JsonlSink(RotatingSink):
+    """Gzip-compressed JSON Lines, one record per line"""
+    
+    extension = 'jsonl.gz'
+    
+    def _open(self):
+        self._file = gzip.open(self.path, 'wb', compresslevel=6)
+    
+    def _write(self, records: List[Dict]) -> int:
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode('utf-8')
+        self._file.write(data)
+        return len(data)
+    
+    def flush(self):
+        if self.path is not None:
+            self._file.flush()
+    
+    def _close(self):
+        self._file.close()
+
+
+class CsvSink(RotatingSink):
+    """Gzip-compressed CSV with an EXPORT_FIELDS header in every file"""
+    
+    extension = 'csv.gz'
+    
+    def _open(self):
+        self._file = gzip.open(self.path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+        self._writer = csv.DictWriter(self._file, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+        self._writer.writeheader()
+    
+    def _write(self, records: List[Dict]) -> int:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+        writer.writerows(records)
+        data = buffer.getvalue()
+        self._file.write(data)
+        return len(data)
+    
+    def flush(self):
+        if self.path is not None:
+            self._file.flush()
+    
+    def _close(self):
+        self._file.close()
+
+
+class ParquetSink(RotatingSink):
+    """
+    Zstd-compressed Parquet. Records are buffered into row groups of row_group_size,
+    so memory stays bounded however many records pass through.
+    """
+    
+    extension = 'parquet'
+    recoverable = False  # The footer with the schema and row group index is written on close
+    
+    def __init__(self, directory: str, rotate_bytes: int, rotate_seconds: float, prefix: str = "jobs",
+                 recover: bool = True, row_group_size: int = 10000):
+        """
+        Initializes sink (raises ValueError if pyarrow is not installed)
+        
+        Args:
+            directory: Output directory
+            rotate_bytes: Approximate uncompressed bytes per file (0 = no size limit)
+            rotate_seconds: Seconds per file (0 = no time limit)
+            prefix: File name prefix
+            recover: Finalize unfinished files of this prefix left behind by a crash?
+            row_group_size: Records per Parquet row group
+        """
+        self.pa, self.pq = _pyarrow()
+        self.schema = self.pa.schema([
+            (field, self.pa.int64() if field in INT_FIELDS else
+             self.pa.float64() if field in FLOAT_FIELDS else self.pa.string())
+            for field in EXPORT_FIELDS
+        ])
+        self.row_group_size = row_group_size
+        self._rows: List[Dict] = []
+        super().__init__(directory, rotate_bytes, rotate_seconds, prefix, recover)
+    
+    def _open(self):
+        self._writer = self.pq.ParquetWriter(str(self.path), self.schema, compression='zstd')
+    
+    def _write(self, records: List[Dict]) -> int:
+        self._rows.extend(records)
+        if len(self._rows) >= self.row_group_size:
+            self._write_row_group()
+        # Parquet has no cheap byte count before encoding, the text length is a close enough estimate
+        return sum(len(str(value)) for record in records for value in record.values())
+    
+    def _write_row_group(self):
+        if self._rows:
+            self._writer.write_table(self.pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+    
+    def _close(self):
+        # Rows still buffered end up in the last row group of the file
+        self._write_row_group()
+        self._writer.close()
+
+
+SINK_CLASSES = {'jsonl': JsonlSink, 'csv': CsvSink, 'parquet': ParquetSink}
+
+
+def create_sink(export_format: str, directory: str, rotate_bytes: int = 0, rotate_seconds: float = 0,
+                prefix: str = "jobs", recover: bool = True) -> RotatingSink:
+    """
+    Args:
+        export_format: "jsonl", "csv" or "parquet"
+        directory: Output directory
+        rotate_bytes: Uncompressed bytes per file (0 = no size limit)
+        rotate_seconds: Seconds per file (0 = no time limit)
+        prefix: File name prefix
+        recover: Finalize unfinished files left behind by a crash?
+        
+    Returns:
+        RotatingSink: Sink (raises ValueError for unknown formats or a missing pyarrow)
+    """
+    sink_class = SINK_CLASSES.get(export_format)
+    if sink_class is None:
+        raise ValueError(f"Unknown export format '{export_format}' (use {', '.join(EXPORT_FORMATS)})")
+    return sink_class(directory, rotate_bytes, rotate_seconds, prefix, recover)
+
+
+class ExportPipeline:
+    """
+    Background writer - the check only converts and queues records, batching, compression
+    and file I/O happen on the export thread
+    """
+    
+    def __init__(self, sinks: List[RotatingSink], batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None, max_pending: int = 100):
+        """
+        Initializes and starts the export thread
+        
+        Args:
+            sinks: Output sinks (every record goes to all of them)
+            batch_size: Records per write (default: EXPORT_BATCH_SIZE)
+            flush_interval: Max seconds a record waits before being written (default: EXPORT_FLUSH_INTERVAL)
+            max_pending: Checks waiting for the export thread before new ones are dropped
+        """
+        self.sinks = sinks
+        self.batch_size = batch_size or getattr(config, 'EXPORT_BATCH_SIZE', 500)
+        self.flush_interval = flush_interval or getattr(config, 'EXPORT_FLUSH_INTERVAL', 60)
+        self.exported = 0
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="export-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, jobs: List[Dict]) -> bool:
+        """
+        Queues the listings of a check without waiting for disk I/O
+        
+        Args:
+            jobs: Fetched job listings
+            
+        Returns:
+            bool: Were the listings queued? (False if the writer is too far behind)
+        """
+        if not jobs:
+            return True
+        scraped_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        records = [to_record(job, scraped_at) for job in jobs]
+        try:
+            self._queue.put_nowait(records)
+            return True
+        except queue.Full:
+            self.dropped += len(records)
+            print(f"[WARNING] Export writer is behind, {len(records)} records dropped")
+            return False
+    
+    def _run(self):
+        """Export thread: collects batches and writes them to every sink"""
+        buffer: List[Dict] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                records = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                records = []
+            
+            if records is None:
+                self._write(buffer)
+                for sink in self.sinks:
+                    self._close_sink(sink)
+                return
+            
+            if records and not buffer:
+                deadline = time.monotonic() + self.flush_interval
+            buffer.extend(records)
+            if len(buffer) >= self.batch_size or (buffer and time.monotonic() >= deadline):
+                self._write(buffer)
+                buffer = []
+                deadline = None
+    
+    def _write(self, records: List[Dict]):
+        """Writes a batch to every sink (a failing sink doesn't stop the others)"""
+        if not records:
+            return
+        written = False
+        for sink in self.sinks:
+            try:
+                sink.write(records)
+                sink.flush()
+                written = True
+            except Exception as e:
+                print(f"[ERROR] Export to {sink.extension} failed: {e}")
+        # Only batches that reached at least one file count as exported
+        if written:
+            self.exported += len(records)
+    
+    @staticmethod
+    def _close_sink(sink: RotatingSink):
+        try:
+            sink.close()
+        except Exception as e:
+            print(f"[ERROR] Could not finish export file {sink.path}: {e}")
+    
+    def close(self, timeout: float = 10):
+        """
+        Writes the remaining records and finishes the open files
+        
+        Args:
+            timeout: Max seconds to wait for the export thread
+        """
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self.exported:
+            print(f"[INFO] Exported {self.exported} records")
+
+
+def create_export_pipeline() -> Optional[ExportPipeline]:
+    """
+    Creates the export pipeline from config
+    
+    Returns:
+        Optional[ExportPipeline]: Pipeline, or None if EXPORT_FORMATS is empty
+    """
+    formats = getattr(config, 'EXPORT_FORMATS', [])
+    if not formats:
+        return None
+    
+    directory = getattr(config, 'EXPORT_DIR', 'exports')
+    rotate_bytes = int(getattr(config, 'EXPORT_ROTATE_MB', 64) * 1024 * 1024)
+    rotate_seconds = getattr(config, 'EXPORT_ROTATE_HOURS', 24) * 3600
+    
+    sinks = []
+    for export_format in formats:
+        try:
+            sinks.append(create_sink(export_format, directory, rotate_bytes, rotate_seconds))
+        except (ValueError, OSError) as e:
+            print(f"[ERROR] Export format '{export_format}' disabled: {e}")
+    if not sinks:
+        return None
+    
+    print(f"[INFO] Exporting listings to {directory}/ as {', '.join(sink.extension for sink in sinks)}")
+    return ExportPipeline(sinks)
+
+
+def iter_record_batches(path: Path, batch_size: int) -> Iterator[List[Dict]]:
+    """
+    Reads an export file in batches (constant memory)
+    
+    Args:
+        path: .jsonl[.gz], .csv[.gz] or .parquet file
+        batch_size: Records per batch
+        
+    Yields:
+        List[Dict]: Typed records
+    """
+    name = path.name
+    if name.endswith('.parquet'):
+        pa, pq = _pyarrow()
+        try:
+            for batch in pq.ParquetFile(str(path)).iter_batches(batch_size=batch_size):
+                yield [coerce_record(record) for record in batch.to_pylist()]
+        except (pa.ArrowException, OSError) as e:
+            # Truncated or otherwise damaged file - skip the rest, keep converting the others
+            print(f"[WARNING] {name}: stopped at damaged data ({e})")
+        return
+    
+    opener = gzip.open if name.endswith('.gz') else open
+    batch = []
+    try:
+        with opener(path, 'rt', encoding='utf-8', newline='') as f:
+            rows = csv.DictReader(f) if '.csv' in name else (json.loads(line) for line in f if line.strip())
+            for row in rows:
+                batch.append(coerce_record(row))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+    except (EOFError, OSError, zlib.error, UnicodeDecodeError, csv.Error, json.JSONDecodeError) as e:
+        # Files recovered after a crash can end in a cut-off batch
+        print(f"[WARNING] {name}: stopped at damaged data ({e})")
+    if batch:
+        yield batch
+
+
+def export_format_of(path: Path) -> str:
+    """
+    Args:
+        path: Export file
+        
+    Returns:
+        str: Its format ("jsonl", "csv" or "parquet")
+    """
+    name = path.name[:-len('.gz')] if path.name.endswith('.gz') else path.name
+    return name.rsplit('.', 1)[-1]
+
+
+def find_export_files(inputs: List[str], source_format: Optional[str] = None) -> List[Path]:
+    """
+    Expands directories into their export files. With several EXPORT_FORMATS every format holds
+    the same listings, so a directory with more than one format needs source_format (raises ValueError).
+    
+    Args:
+        inputs: Files and directories
+        source_format: Only read files of this format (None = any)
+        
+    Returns:
+        List[Path]: Export files, sorted by name (= by time)
+    """
+    suffixes = ('.jsonl', '.jsonl.gz', '.csv', '.csv.gz', '.parquet')
+    files = []
+    for item in map(Path, inputs):
+        if item.is_dir():
+            found = sorted(path for path in item.iterdir() if path.name.endswith(suffixes))
+            formats = sorted({export_format_of(path) for path in found})
+            if source_format is None and len(formats) > 1:
+                raise ValueError(f"{item} holds {' and '.join(formats)} exports of the same listings, "
+                                 f"pick one with --from")
+            files += found
+        elif item.name.endswith(suffixes):
+            files.append(item)
+        else:
+            print(f"[WARNING] Skipped {item} (not an export file)")
+    
+    if source_format is not None:
+        files = [path for path in files if export_format_of(path) == source_format]
+    return files
+
+
+def convert(inputs: List[str], export_format: str, out_dir: str, batch_size: int, rotate_mb: float,
+            source_format: Optional[str] = None) -> int:
+    """
+    Streams export files into another format
+    
+    Args:
+        inputs: Export files and directories
+        export_format: Target format
+        out_dir: Output directory
+        batch_size: Records per read/write batch
+        rotate_mb: Uncompressed MB per output file (0 = one file)
+        source_format: Only read files of this format (None = any, see find_export_files)
+        
+    Returns:
+        int: Number of converted records
+    """
+    files = find_export_files(inputs, source_format)
+    # out_dir may be the live EXPORT_DIR: own file names, and the bot's .part files are left alone
+    sink = create_sink(export_format, out_dir, int(rotate_mb * 1024 * 1024), prefix="converted", recover=False)
+    count = 0
+    start = time.perf_counter()
+    try:
+        for path in files:
+            for batch in iter_record_batches(path, batch_size):
+                sink.write(batch)
+                count += len(batch)
+            print(f"[INFO] {path.name}: {count} records so far")
+    finally:
+        sink.close()
+    
+    elapsed = time.perf_counter() - start
+    print(f"[SUCCESS] Converted {count} records from {len(files)} files to {sink.files_written} "
+          f"{export_format} files in {out_dir} ({count / elapsed if elapsed else 0:.0f} records/sec)")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job listing export tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert_parser = commands.add_parser('convert', help="Convert exported history to another format")
+    convert_parser.add_argument('inputs', nargs='+', help="Export files or directories")
+    convert_parser.add_argument('--to', required=True, choices=EXPORT_FORMATS, help="Target format")
+    convert_parser.add_argument('--from', dest='source', choices=EXPORT_FORMATS,
+                                help="Only read files of this format (needed for directories with several formats)")
+    convert_parser.add_argument('--out', required=True, help="Output directory")
+    convert_parser.add_argument('--batch', type=int, default=10000, help="Records per batch")
+    convert_parser.add_argument('--rotate-mb', type=float, default=0, help="Uncompressed MB per output file (0 = one file)")
+    args = parser.parse_args()
+    
+    try:
+        convert(args.inputs, args.to, args.out, args.batch, args.rotate_mb, args.source)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
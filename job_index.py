@@ -0,0 +1,172 @@
+"""
+Job Index Module
+Per-job listing card fingerprints - detail pages are only fetched when a card changes or goes stale
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import config
+
+# Listing card fields that make up the fingerprint
+FINGERPRINT_FIELDS = ('title', 'budget', 'category', 'applications', 'listed_date')
+
+# Fetch priorities (lower is fetched first)
+PRIORITY_NEW = 0
+PRIORITY_CHANGED_APPLY = 1
+PRIORITY_CHANGED = 2
+PRIORITY_STALE_APPLY = 3
+PRIORITY_STALE = 4
+
+
+class JobIndex:
+    """
+    Map from job ID to listing card fingerprint, last detail fetch time and extracted details
+    """
+    
+    def __init__(self, index_file: Optional[str] = None, stale_ttl: Optional[float] = None,
+                 fetch_budget: Optional[int] = None):
+        """
+        Initializes job index (the file is loaded on first use)
+        
+        Args:
+            index_file: JSON file the index is persisted to
+            stale_ttl: Seconds after which an unchanged job's details are fetched again
+            fetch_budget: Max detail fetches per cycle (0 = unlimited)
+        """
+        if index_file is None:
+            index_file = getattr(config, 'JOB_INDEX_FILE', None)
+        self.index_file = Path(index_file) if index_file else None
+        self.stale_ttl = stale_ttl if stale_ttl is not None else getattr(config, 'DETAIL_STALE_TTL', 6 * 3600)
+        self.fetch_budget = fetch_budget if fetch_budget is not None else getattr(config, 'DETAIL_FETCH_BUDGET', 0)
+        
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._dirty = False
+    
+    @staticmethod
+    def fingerprint(job: Dict) -> str:
+        """
+        Args:
+            job: Job listing data from the listing page
+            
+        Returns:
+            str: Hash of the listing card fields
+        """
+        card = '\x1f'.join(str(job.get(field, '')) for field in FINGERPRINT_FIELDS)
+        return hashlib.blake2b(card.encode('utf-8'), digest_size=8).hexdigest()
+    
+    @property
+    def entries(self) -> Dict[str, Dict]:
+        """Indexed jobs (loaded from disk on first access)"""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+    
+    def plan(self, jobs: List[Dict]) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """
+        Decides which detail pages need fetching this cycle.
+        New jobs come first, then changed cards, then stale ones - open (Apply) jobs ahead of the rest.
+        
+        Args:
+            jobs: Job listings from the listing page
+            
+        Returns:
+            Tuple[List[Dict], Dict[str, Dict]]: Jobs to fetch (in priority order) and
+                last known details by job ID
+        """
+        now = time.time()
+        candidates = []
+        known = {}
+        
+        for position, job in enumerate(jobs):
+            entry = self.entries.get(job['job_id'])
+            if entry is None:
+                candidates.append((PRIORITY_NEW, position, job))
+                continue
+            
+            known[job['job_id']] = entry['details']
+            is_open = entry['details'].get('status', 'Apply') == 'Apply'
+            if entry['fingerprint'] != self.fingerprint(job):
+                candidates.append((PRIORITY_CHANGED_APPLY if is_open else PRIORITY_CHANGED, position, job))
+            elif not self.stale_ttl or now - entry['fetched_at'] >= self.stale_ttl:
+                candidates.append((PRIORITY_STALE_APPLY if is_open else PRIORITY_STALE, position, job))
+        
+        candidates.sort(key=lambda candidate: candidate[:2])
+        to_fetch = [job for _, _, job in candidates]
+        if self.fetch_budget and len(to_fetch) > self.fetch_budget:
+            print(f"[INFO] Detail fetch budget reached, deferring {len(to_fetch) - self.fetch_budget} jobs to next cycle")
+            to_fetch = to_fetch[:self.fetch_budget]
+        
+        return to_fetch, known
+    
+    def record(self, job: Dict, details: Dict):
+        """
+        Stores the fingerprint and details of a freshly fetched job
+        
+        Args:
+            job: Job listing data from the listing page
+            details: Extracted details (failed fetches are not recorded and retried next cycle)
+        """
+        if not details:
+            return
+        self.entries[job['job_id']] = {
+            'fingerprint': self.fingerprint(job),
+            'fetched_at': time.time(),
+            'details': dict(details),
+        }
+        self._dirty = True
+    
+    def expire(self):
+        """Marks every entry stale so its details are fetched again (parser settings changed)"""
+        for entry in self.entries.values():
+            entry['fetched_at'] = 0
+        self._dirty = True
+    
+    def prune(self, jobs: List[Dict]):
+        """
+        Drops jobs that are no longer listed
+        
+        Args:
+            jobs: Job listings from the listing page
+        """
+        listed = {job['job_id'] for job in jobs}
+        for job_id in [job_id for job_id in self.entries if job_id not in listed]:
+            del self.entries[job_id]
+            self._dirty = True
+    
+    def _load(self) -> Dict[str, Dict]:
+        """Loads the index file"""
+        if not self.index_file or not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[WARNING] Could not load job index: {e}")
+            return {}
+    
+    def save(self):
+        """Saves the index file (only if something changed)"""
+        if not self.index_file or not self._dirty:
+            return
+        try:
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            self._dirty = False
+        except Exception as e:
+            print(f"[WARNING] Could not save job index: {e}")
+
+
+def create_job_index() -> Optional[JobIndex]:
+    """
+    Creates the job index configured by JOB_INDEX_FILE
+    
+    Returns:
+        Optional[JobIndex]: Job index, or None to fetch every detail page each cycle
+    """
+    if not getattr(config, 'JOB_INDEX_FILE', None):
+        return None
+    return JobIndex()
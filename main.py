@@ -7,53 +7,136 @@ import json
 import time
 import signal
 import sys
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Set, Dict, List
+from typing import Set, Dict, List, Optional, Tuple, Union
 
+from startup import StartupProfiler, lazy_import
 import config
 from scraper import JobScraper
 from discord_webhook import DiscordWebhook
+from digest import DigestQueue
+from seen_set import BloomSeenSet, read_id_list, recent_window_file
+from settings import ConfigReloader
+from subscriptions import SubscriptionEngine
+
+# Only needed in async mode / with the admin API enabled, loaded on first use
+asyncio = lazy_import('asyncio')
+async_scraper = lazy_import('async_scraper')
+async_discord_webhook = lazy_import('async_discord_webhook')
+admin_api = lazy_import('admin_api')
+export = lazy_import('export')
+
+startup_profiler = StartupProfiler(getattr(config, 'STARTUP_STATS_FILE', None))
+startup_profiler.mark("imports")
 
 
 class JobScraperBot:
-    def __init__(self):
-        """Initializes the scraper bot"""
-        self.scraper = JobScraper()
-        self.webhook = DiscordWebhook(config.DISCORD_WEBHOOK_URL)
+    def __init__(self, settings: Optional[ConfigReloader] = None):
+        """
+        Initializes the scraper bot
+        
+        Args:
+            settings: Loaded settings layer (default: load the settings file and environment now)
+        """
+        if settings is None:
+            settings = ConfigReloader()
+            settings.load()
+        self.settings = settings
+        self.settings.on_reload(self._apply_settings)
+        self.scraper = self._create_scraper()
+        self.webhook = self._create_webhook()
+        self.subscriptions = SubscriptionEngine()
+        self.digest_queue = DigestQueue() if getattr(config, 'DIGEST_MODE', False) else None
+        self.exporter = export.create_export_pipeline() if getattr(config, 'EXPORT_FORMATS', []) else None
         self.seen_jobs_file = Path("seen_jobs.json")
-        self.seen_jobs: Set[str] = self._load_seen_jobs()
+        self._seen_jobs: Optional[Union[Set[str], BloomSeenSet]] = None  # Loaded on first use
+        self._details_pending: Dict[str, int] = {}  # New job ID -> cycles held waiting for details
         self.running = True
+        self._wake = threading.Event()
+        self._reload_requested = False
+        
+        # Admin API state
+        self.admin_api = None  # AdminAPI, started if ADMIN_API_PORT is set
+        self.delivery_paused = False
+        self.checking = False
+        self.next_check_at: Optional[float] = None
+        self.cycle_history = deque(maxlen=getattr(config, 'CYCLE_STATS_HISTORY', 50))
+        self._cycle: Dict = {}
+        # Admin API threads only see copies taken under this lock - cycle_history and the
+        # loop-owned state published by _publish_state() after each check
+        self._state_lock = threading.Lock()
+        self._published_state: Dict = {}
+        self._cycle_started = 0.0
+        self._check_requested = False
         
         # Signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
+        if hasattr(signal, 'SIGHUP'):
+            # Settings reload (kill -HUP <pid>), not available on Windows
+            signal.signal(signal.SIGHUP, self._reload_handler)
+        
+        startup_profiler.mark("bot_init")
+    
+    def _create_scraper(self) -> JobScraper:
+        """Scraper used by this bot (the async bot overrides it)"""
+        return JobScraper()
+    
+    def _create_webhook(self) -> DiscordWebhook:
+        """Webhook client used by this bot (the async bot overrides it)"""
+        return DiscordWebhook(config.DISCORD_WEBHOOK_URL)
+    
+    @property
+    def seen_jobs(self) -> Union[Set[str], BloomSeenSet]:
+        """Seen listing IDs (loaded from disk on first access)"""
+        if self._seen_jobs is None:
+            self._seen_jobs = self._load_seen_jobs()
+        return self._seen_jobs
     
-    def _load_seen_jobs(self) -> Set[str]:
+    def _load_seen_jobs(self) -> Union[Set[str], BloomSeenSet]:
         """
         Loads previously seen job listings
         
         Returns:
-            Set[str]: Seen listing IDs
+            Union[Set[str], BloomSeenSet]: Seen listing IDs (bounded memory if SEEN_BLOOM_FILE is set)
         """
+        if getattr(config, 'SEEN_BLOOM_FILE', None):
+            try:
+                return BloomSeenSet(self.seen_jobs_file)
+            except Exception as e:
+                print(f"[WARNING] Could not open seen-set filter, keeping all seen listings in memory: {e}")
+        
+        # Listings seen while the Bloom filter was on are only in its recent window file
+        window = read_id_list(recent_window_file(self.seen_jobs_file))
+        
         if self.seen_jobs_file.exists():
             try:
                 with open(self.seen_jobs_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     print(f"[INFO] Loaded {len(data)} seen listings")
-                    return set(data)
+                    return set(data).union(window)
             except Exception as e:
                 print(f"[WARNING] Could not load seen listings: {e}")
-                return set()
+                return set(window)
         else:
             print("[INFO] New seen_jobs.json file will be created")
-            return set()
+            return set(window)
     
     def _save_seen_jobs(self):
         """Saves seen job listings"""
+        if self._seen_jobs is None:
+            # Never loaded, nothing changed
+            return
         try:
-            with open(self.seen_jobs_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.seen_jobs), f, indent=2)
+            if isinstance(self._seen_jobs, BloomSeenSet):
+                # Only the recent window is rewritten, the filter is flushed in place
+                self._seen_jobs.save()
+            else:
+                with open(self.seen_jobs_file, 'w', encoding='utf-8') as f:
+                    json.dump(list(self.seen_jobs), f, indent=2)
             print(f"[INFO] Saved {len(self.seen_jobs)} listings")
         except Exception as e:
             print(f"[ERROR] Could not save seen listings: {e}")
@@ -69,9 +152,258 @@ class JobScraperBot:
         print("\n[INFO] Shutdown signal received. Cleaning up...")
         self.running = False
         self._save_seen_jobs()
+        if self.scraper.parse_pool:
+            self.scraper.parse_pool.shutdown(wait=False)
+        if self.admin_api:
+            self.admin_api.stop()
+        if self.exporter:
+            self.exporter.close()
         print("[INFO] Scraper closed. Goodbye!")
         sys.exit(0)
     
+    def _reload_handler(self, signum, frame):
+        """
+        SIGHUP handler - the reload runs in the main loop, outside of a running check
+        
+        Args:
+            signum: Signal number
+            frame: Frame object
+        """
+        self._request_reload()
+    
+    def _request_reload(self):
+        """Queues a settings reload for the main loop (called from signal handlers and the watcher thread)"""
+        self._reload_requested = True
+        self._wake.set()
+    
+    def _apply_settings(self, changed: Set[str]):
+        """
+        Pushes reloaded settings into objects that copied them (runs after each reload).
+        Requests already in flight finish with the old values.
+        
+        Args:
+            changed: Names of changed settings
+        """
+        self.scraper.apply_config()
+        self.webhook.apply_config()
+        if self.digest_queue is not None:
+            self.digest_queue.window = getattr(config, 'DIGEST_WINDOW', 900)
+            self.digest_queue.max_jobs = getattr(config, 'DIGEST_MAX_JOBS', 50)
+        if 'SUBSCRIPTIONS_FILE' in changed:
+            self.subscriptions = SubscriptionEngine()
+        self._publish_state()
+        
+        # A new CHECK_INTERVAL also applies to the wait that is already running
+        self._wake_scheduler()
+    
+    def _wake_scheduler(self):
+        """Interrupts the wait for the next check so it is recalculated"""
+        self._wake.set()
+    
+    def _wait_for_next_check(self):
+        """
+        Waits CHECK_INTERVAL seconds, handling settings reloads while waiting
+        """
+        started = time.monotonic()
+        announced = None
+        while self.running:
+            self._wake.clear()
+            if self._reload_requested:
+                self._reload_requested = False
+                self.settings.reload()
+            if self._check_requested:
+                self._check_requested = False
+                return
+            
+            remaining = started + config.CHECK_INTERVAL - time.monotonic()
+            if remaining <= 0:
+                return
+            self.next_check_at = time.time() + remaining
+            if config.CHECK_INTERVAL != announced:
+                print(f"\n[INFO] Next check: in {remaining:.0f} seconds...")
+                announced = config.CHECK_INTERVAL
+            self._wake.wait(remaining)
+    
+    def request_check(self) -> Dict:
+        """
+        Starts a check as soon as the main loop is free (admin API)
+        
+        Returns:
+            Dict: Whether a check was already running
+        """
+        print("[INFO] Check requested via admin API")
+        self._check_requested = True
+        self._wake_scheduler()
+        return {'requested': True, 'checking': self.checking}
+    
+    def pause_delivery(self) -> Dict:
+        """
+        Stops sending - checks continue, new listings stay unseen until delivery resumes (admin API)
+        
+        Returns:
+            Dict: Delivery state
+        """
+        if not self.delivery_paused:
+            print("[INFO] Delivery paused via admin API")
+        self.delivery_paused = True
+        return {'delivery_paused': True}
+    
+    def resume_delivery(self) -> Dict:
+        """
+        Resumes sending, held listings go out with the next check (admin API)
+        
+        Returns:
+            Dict: Delivery state
+        """
+        if self.delivery_paused:
+            print("[INFO] Delivery resumed via admin API")
+        self.delivery_paused = False
+        return {'delivery_paused': False}
+    
+    def status_snapshot(self) -> Dict:
+        """
+        Returns:
+            Dict: Bot status for the admin API
+        """
+        next_check_in = None
+        if self.next_check_at is not None and not self.checking:
+            next_check_in = round(max(0.0, self.next_check_at - time.time()), 1)
+        return {
+            'running': self.running,
+            'mode': 'async' if isinstance(self, AsyncJobScraperBot) else 'sync',
+            'checking': self.checking,
+            'check_requested': self._check_requested,
+            'delivery_paused': self.delivery_paused,
+            'check_interval': config.CHECK_INTERVAL,
+            'next_check_in': next_check_in,
+            'last_cycle': self.cycle_stats(1)[-1] if self.cycle_history else None,
+        }
+    
+    def cycle_stats(self, limit: int = 0) -> List[Dict]:
+        """
+        Args:
+            limit: Number of most recent checks (0 = all kept)
+            
+        Returns:
+            List[Dict]: Copies of the recorded check stats, newest last (admin API)
+        """
+        with self._state_lock:
+            cycles = list(self.cycle_history)
+        if limit > 0:
+            cycles = cycles[-limit:]
+        return [dict(cycle) for cycle in cycles]
+    
+    def state_snapshot(self) -> Dict:
+        """
+        Returns:
+            Dict: Digest queue, cache sizes and parser drift as of the last check (admin API)
+        """
+        with self._state_lock:
+            return dict(self._published_state)
+    
+    def _publish_state(self):
+        """
+        Snapshots loop-owned state for the admin API. Runs on the main loop, which is the
+        only place the digest queue, caches and drift detector are changed.
+        """
+        scraper = self.scraper
+        digest = None
+        if self.digest_queue is not None:
+            queued = list(self.digest_queue.jobs)
+            digest = {
+                'size': len(queued),
+                'max_jobs': self.digest_queue.max_jobs,
+                'due_at': time.time() + self.digest_queue.seconds_left(),
+                'jobs': [{'job_id': job.get('job_id'), 'title': job.get('title'), 'url': job.get('url')}
+                         for job in queued],
+            }
+        
+        state = {
+            'as_of': datetime.now().isoformat(timespec='seconds'),
+            'digest_queue': digest,
+            'seen_jobs': len(self._seen_jobs) if self._seen_jobs is not None else None,
+            'waiting_for_details': len(self._details_pending),
+            'job_index_entries': len(scraper.job_index.entries) if scraper.job_index else None,
+            'parse_cache_entries': len(scraper.parse_cache.entries) if scraper.parse_cache else None,
+            'parser_drift': {
+                'flagged': scraper.drift_detector.flagged,
+                'warming_up': scraper.drift_detector.warming_up,
+                'alerts': list(scraper.drift_detector.alerts),
+                'baseline': dict(scraper.drift_detector.baseline),
+            },
+        }
+        with self._state_lock:
+            self._published_state = state
+    
+    def _begin_cycle(self):
+        """Starts collecting stats of a check"""
+        self.checking = True
+        self.next_check_at = None
+        self._cycle = {'started_at': datetime.now().isoformat(timespec='seconds'),
+                       'listings': 0, 'new': 0, 'held': 0, 'sent': 0}
+        self._cycle_started = time.perf_counter()
+        self.scraper.fetch_stats = []
+    
+    def _end_cycle(self, error: Optional[Exception] = None):
+        """
+        Adds the check to the cycle history
+        
+        Args:
+            error: Exception that ended the check
+        """
+        cycle = self._cycle
+        cycle['duration'] = round(time.perf_counter() - self._cycle_started, 3)
+        fetch_stats = self.scraper.fetch_stats
+        cycle['detail_pages'] = len(fetch_stats)
+        cycle['detail_bytes'] = sum(stat['bytes_downloaded'] for stat in fetch_stats)
+        if self.scraper.parse_cache:
+            cycle['parse_cache_hits'] = self.scraper.parse_cache.cycle['hits']
+        if self.scraper.drift_detector.alerts:
+            cycle['parser_drift'] = list(self.scraper.drift_detector.alerts)
+        if error is not None:
+            cycle['error'] = f"{type(error).__name__}: {error}"
+        with self._state_lock:
+            self.cycle_history.append(cycle)
+        self._publish_state()
+        self.checking = False
+    
+    def _run_check(self) -> int:
+        """
+        Runs one check and records its stats
+        
+        Returns:
+            int: Number of new listings sent
+        """
+        self._begin_cycle()
+        try:
+            sent_count = self.check_and_send_new_jobs()
+        except Exception as e:
+            self._end_cycle(e)
+            raise
+        self._end_cycle()
+        return sent_count
+    
+    def _start_admin_api(self):
+        """Starts the admin API if ADMIN_API_PORT is set"""
+        if not getattr(config, 'ADMIN_API_PORT', 0):
+            return
+        try:
+            self.admin_api = admin_api.AdminAPI(self)
+            self.admin_api.start()
+        except OSError as e:
+            print(f"[ERROR] Admin API could not be started: {e}")
+            self.admin_api = None
+    
+    def _report_circuits(self):
+        """Prints state of circuit breakers that are not closed"""
+        breakers = [self.scraper.listing_breaker, self.scraper.detail_breaker, self.webhook.breaker]
+        for breaker in breakers:
+            snapshot = breaker.snapshot()
+            if snapshot['state'] != breaker.CLOSED:
+                print(f"[WARNING] Circuit '{snapshot['name']}': {snapshot['state']} "
+                      f"({snapshot['consecutive_failures']} consecutive failures, "
+                      f"{snapshot['short_circuited']} short-circuited, retry in {snapshot['retry_after']:.0f}s)")
+    
     def check_and_send_new_jobs(self) -> int:
         """
         Checks for new job listings and sends them to Discord
@@ -82,47 +414,208 @@ class JobScraperBot:
         print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking listings...")
         
         # Fetch listings
+        startup_profiler.mark("scrape_start")
         jobs = self.scraper.fetch_jobs()
+        if self.exporter:
+            self.exporter.submit(jobs)
+        
+        new_jobs = self._select_new_jobs(jobs)
+        per_job, digest_jobs = self._plan_delivery(new_jobs)
+        if not per_job and not digest_jobs:
+            if new_jobs:
+                # Queued for the next digest
+                self._save_seen_jobs()
+            return 0
+        
+        # Send new listings to Discord
+        sent_count = self.webhook.send_jobs(per_job) if per_job else 0
+        self._mark_seen(per_job)
+        if digest_jobs:
+            undelivered = self.webhook.send_digest(digest_jobs)
+            sent_count += len(digest_jobs) - len(undelivered)
+            self._settle_digest(digest_jobs, undelivered)
+        
+        return self._finish_cycle(per_job + digest_jobs, sent_count)
+    
+    def _select_new_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Filters unseen listings from a fetch and prepares them for sending
+        
+        Args:
+            jobs: Fetched job listings
+            
+        Returns:
+            List[Dict]: New listings with subscription mentions (marked as seen once delivered or queued)
+        """
+        startup_profiler.mark("first_scrape_done")
+        startup_profiler.report()
+        self._report_circuits()
         
         if not jobs:
             print("[WARNING] No listings found or an error occurred")
-            return 0
+            return []
         
         print(f"[INFO] Found {len(jobs)} active listings")
+        self._cycle['listings'] = len(jobs)
+        
+        if self.delivery_paused:
+            # Listings stay unseen and are sent after resume
+            held = sum(1 for job in jobs if job.get('job_id') and job['job_id'] not in self.seen_jobs)
+            self._cycle['held'] = held
+            print(f"[INFO] Delivery paused, holding {held} new listings")
+            return []
+        
+        if self.scraper.drift_detector.flagged and getattr(config, 'PARSER_DRIFT_ACTION', 'warn') == 'hold':
+            # Listings stay unseen and are sent once the parser output looks normal again
+            print("[WARNING] Holding new listings because of parser drift (PARSER_DRIFT_ACTION = 'hold')")
+            return []
         
         # Filter new listings
         new_jobs = []
+        selected = set()
+        waiting = 0
         for job in jobs:
             job_id = job.get('job_id')
-            if job_id and job_id not in self.seen_jobs:
-                new_jobs.append(job)
-                self.seen_jobs.add(job_id)
+            if not job_id or job_id in self.seen_jobs or job_id in selected:
+                continue
+            if job.get('details_pending') and self._hold_for_details(job):
+                waiting += 1
+                continue
+            new_jobs.append(job)
+            selected.add(job_id)
+            self._details_pending.pop(job_id, None)
+        
+        # Held IDs that left the listing page are forgotten
+        listed = {job.get('job_id') for job in jobs}
+        for job_id in [job_id for job_id in self._details_pending if job_id not in listed]:
+            del self._details_pending[job_id]
+        
+        if waiting:
+            print(f"[INFO] Holding {waiting} new listings until their details are fetched")
+            self._cycle['waiting_for_details'] = waiting
         
         if not new_jobs:
             print("[INFO] No new listings")
-            return 0
+            return []
         
         print(f"[INFO] Found {len(new_jobs)} new listings!")
+        self._cycle['new'] = len(new_jobs)
         
-        # Send new listings to Discord
-        sent_count = self.webhook.send_jobs(new_jobs)
+        # Add subscription mentions
+        matched = self.subscriptions.annotate(new_jobs)
+        if matched:
+            print(f"[INFO] {matched} listings matched subscriptions")
+        
+        return new_jobs
+    
+    def _hold_for_details(self, job: Dict) -> bool:
+        """
+        Decides whether a new listing without details stays unseen for another cycle
         
+        Args:
+            job: New listing whose details were deferred, short-circuited or failed
+            
+        Returns:
+            bool: True to hold it, False to send it with basic info only
+        """
+        job_id = job['job_id']
+        cycles = self._details_pending.get(job_id, 0) + 1
+        if cycles <= getattr(config, 'DETAIL_PENDING_MAX_CYCLES', 3):
+            self._details_pending[job_id] = cycles
+            return True
+        print(f"[WARNING] No details for {job['title'][:50]} after {cycles - 1} cycles, sending basic info")
+        return False
+    
+    def _plan_delivery(self, new_jobs: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Splits listings between per-listing messages and a digest
+        
+        Args:
+            new_jobs: New listings of this cycle
+            
+        Returns:
+            Tuple[List[Dict], List[Dict]]: Listings to send one by one and listings to send as a digest
+        """
+        if self.delivery_paused:
+            return [], []
+        
+        if self.digest_queue is not None:
+            # Digest mode - collect listings until the time or size window is reached
+            # (queued listings are persisted, so they count as seen)
+            self.digest_queue.add(new_jobs)
+            self._mark_seen(new_jobs)
+            if self.digest_queue.due():
+                return [], self.digest_queue.drain()
+            if self.digest_queue.jobs:
+                print(f"[INFO] {len(self.digest_queue.jobs)} listings queued for digest "
+                      f"(sent in {self.digest_queue.seconds_left() / 60:.0f} min "
+                      f"or at {self.digest_queue.max_jobs} listings)")
+            return [], []
+        
+        # Per-listing mode - a burst (e.g. after an outage) is sent as a digest instead
+        threshold = getattr(config, 'DIGEST_THRESHOLD', 0)
+        if threshold and len(new_jobs) > threshold:
+            print(f"[INFO] {len(new_jobs)} new listings exceed DIGEST_THRESHOLD ({threshold}), sending a digest")
+            return [], new_jobs
+        return new_jobs, []
+    
+    def _mark_seen(self, jobs: List[Dict]):
+        """
+        Marks listings as seen
+        
+        Args:
+            jobs: Delivered or queued listings
+        """
+        for job in jobs:
+            self.seen_jobs.add(job['job_id'])
+    
+    def _settle_digest(self, digest_jobs: List[Dict], undelivered: List[Dict]):
+        """
+        Marks delivered digest listings as seen. Listings of digest messages that failed go back
+        to the digest queue, or (burst digests) stay unseen so the next check sends them again.
+        
+        Args:
+            digest_jobs: Listings the digest was built from
+            undelivered: Listings of digest messages that were not delivered
+        """
+        failed = {job['job_id'] for job in undelivered}
+        self._mark_seen([job for job in digest_jobs if job['job_id'] not in failed])
+        if not undelivered:
+            return
+        if self.digest_queue is not None:
+            self.digest_queue.requeue(undelivered)
+            print(f"[WARNING] {len(undelivered)} digest listings not delivered, queued for the next check")
+        else:
+            print(f"[WARNING] {len(undelivered)} digest listings not delivered, retrying next check")
+    
+    def _finish_cycle(self, new_jobs: List[Dict], sent_count: int) -> int:
+        """
+        Saves seen listings after sending
+        
+        Args:
+            new_jobs: Listings that were sent
+            sent_count: Number of successfully sent listings
+            
+        Returns:
+            int: Number of new listings sent
+        """
         # Save seen listings
         self._save_seen_jobs()
+        self._cycle['sent'] = sent_count
         
         print(f"[SUCCESS] {sent_count}/{len(new_jobs)} listings sent successfully")
         
         return sent_count
     
-    def run(self):
-        """
-        Main loop - Checks listings at regular intervals
-        """
+    def _print_banner(self):
+        """Prints startup banner and exits if the webhook URL is not set"""
         print("=" * 60)
         print("GModStore Job Market Discord Scraper")
         print("=" * 60)
         print(f"Check interval: {config.CHECK_INTERVAL} seconds ({config.CHECK_INTERVAL // 60} minutes)")
         print(f"Target URL: {config.GMODSTORE_JOBS_URL}")
+        if self.settings.settings_file:
+            print(f"Settings file: {self.settings.settings_file} (reloaded on change or SIGHUP)")
         print("Starting...\n")
         
         # Webhook test
@@ -130,25 +623,39 @@ class JobScraperBot:
             print("[ERROR] Set DISCORD_WEBHOOK_URL in config.py!")
             print("Exiting...")
             sys.exit(1)
+    
+    def run(self):
+        """
+        Main loop - Checks listings at regular intervals
+        """
+        self._print_banner()
         
-        print("[INFO] Testing Discord webhook...")
-        if not self.webhook.test_webhook():
-            print("[ERROR] Webhook test failed! Check the URL.")
-            # In headless/service mode input() doesn't work, continue automatically
-            if sys.stdin.isatty():
-                print("Do you want to continue? (y/N): ", end='')
-                response = input().strip().lower()
-                if response != 'y':
-                    sys.exit(1)
-            else:
-                print("[WARNING] Running in service mode, continuing...")
-                time.sleep(5)
+        webhook_check = getattr(config, 'STARTUP_WEBHOOK_CHECK', 'background')
+        if webhook_check == "blocking":
+            print("[INFO] Testing Discord webhook...")
+            if not self.webhook.test_webhook():
+                print("[ERROR] Webhook test failed! Check the URL.")
+                # In headless/service mode input() doesn't work, continue automatically
+                if sys.stdin.isatty():
+                    print("Do you want to continue? (y/N): ", end='')
+                    response = input().strip().lower()
+                    if response != 'y':
+                        sys.exit(1)
+                else:
+                    print("[WARNING] Running in service mode, continuing...")
+                    time.sleep(5)
+        elif webhook_check == "background":
+            # Doesn't block the first scrape, result is logged when it arrives
+            print("[INFO] Testing Discord webhook in background...")
+            self.webhook.start_health_check()
         
+        self.settings.start_watching(on_change=self._request_reload)
+        self._start_admin_api()
         print("\n[INFO] Bot started. Press Ctrl+C to stop.\n")
         
         # Perform first check immediately
         try:
-            self.check_and_send_new_jobs()
+            self._run_check()
         except Exception as e:
             print(f"[ERROR] Error during first check: {e}")
         
@@ -156,11 +663,10 @@ class JobScraperBot:
         while self.running:
             try:
                 # Wait until next check
-                print(f"\n[INFO] Next check: in {config.CHECK_INTERVAL} seconds...")
-                time.sleep(config.CHECK_INTERVAL)
+                self._wait_for_next_check()
                 
                 # Perform check
-                self.check_and_send_new_jobs()
+                self._run_check()
                 
             except KeyboardInterrupt:
                 # Ctrl+C - signal handler will catch
@@ -171,10 +677,192 @@ class JobScraperBot:
                 time.sleep(60)
 
 
+class AsyncJobScraperBot(JobScraperBot):
+    """
+    Asyncio variant of the bot - fetching, parsing and delivery run on one event loop
+    """
+    
+    _loop: Optional['asyncio.AbstractEventLoop'] = None
+    _async_wake: Optional['asyncio.Event'] = None
+    
+    def _create_scraper(self) -> JobScraper:
+        return async_scraper.AsyncJobScraper()
+    
+    def _create_webhook(self) -> DiscordWebhook:
+        return async_discord_webhook.AsyncDiscordWebhook(config.DISCORD_WEBHOOK_URL)
+    
+    def _wake_scheduler(self):
+        """Interrupts the wait for the next check (may be called from admin API threads)"""
+        if self._loop is not None and self._async_wake is not None:
+            self._loop.call_soon_threadsafe(self._async_wake.set)
+    
+    def _request_reload(self):
+        """Runs a settings reload on the event loop, between awaits like the SIGHUP handler"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self.settings.reload)
+    
+    async def _wait_for_next_check_async(self):
+        """
+        Waits CHECK_INTERVAL seconds, recalculating the wait when settings change
+        """
+        started = self._loop.time()
+        announced = None
+        while self.running:
+            self._async_wake.clear()
+            if self._check_requested:
+                self._check_requested = False
+                return
+            
+            remaining = started + config.CHECK_INTERVAL - self._loop.time()
+            if remaining <= 0:
+                return
+            self.next_check_at = time.time() + remaining
+            if config.CHECK_INTERVAL != announced:
+                print(f"\n[INFO] Next check: in {remaining:.0f} seconds...")
+                announced = config.CHECK_INTERVAL
+            try:
+                await asyncio.wait_for(self._async_wake.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+    
+    async def check_and_send_new_jobs_async(self) -> int:
+        """
+        Checks for new job listings and sends them to Discord
+        
+        Returns:
+            int: Number of new listings sent
+        """
+        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking listings...")
+        
+        # Fetch listings
+        startup_profiler.mark("scrape_start")
+        jobs = await self.scraper.fetch_jobs_async()
+        if self.exporter:
+            self.exporter.submit(jobs)
+        
+        new_jobs = self._select_new_jobs(jobs)
+        per_job, digest_jobs = self._plan_delivery(new_jobs)
+        if not per_job and not digest_jobs:
+            if new_jobs:
+                # Queued for the next digest
+                self._save_seen_jobs()
+            return 0
+        
+        # Send new listings to Discord
+        sent_count = await self.webhook.send_jobs_async(per_job) if per_job else 0
+        self._mark_seen(per_job)
+        if digest_jobs:
+            undelivered = await self.webhook.send_digest_async(digest_jobs)
+            sent_count += len(digest_jobs) - len(undelivered)
+            self._settle_digest(digest_jobs, undelivered)
+        
+        return self._finish_cycle(per_job + digest_jobs, sent_count)
+    
+    async def _run_check_async(self) -> int:
+        """
+        Runs one check and records its stats
+        
+        Returns:
+            int: Number of new listings sent
+        """
+        self._begin_cycle()
+        try:
+            sent_count = await self.check_and_send_new_jobs_async()
+        except Exception as e:
+            self._end_cycle(e)
+            raise
+        self._end_cycle()
+        return sent_count
+    
+    def run(self):
+        """
+        Runs the async main loop until SIGINT/SIGTERM
+        """
+        asyncio.run(self._main())
+    
+    async def _main(self):
+        """Installs signal handlers, runs the loop and cleans up on cancellation"""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._async_wake = asyncio.Event()
+        main_task = asyncio.current_task()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, main_task.cancel)
+            except NotImplementedError:
+                # Windows - the default signal handlers stay in place
+                pass
+        if hasattr(signal, 'SIGHUP'):
+            # Settings reload - runs on the loop between awaits, in-flight requests are not interrupted
+            loop.add_signal_handler(signal.SIGHUP, self.settings.reload)
+        
+        try:
+            await self.run_async()
+        except asyncio.CancelledError:
+            print("\n[INFO] Shutdown signal received. Cleaning up...")
+        finally:
+            self.running = False
+            self._save_seen_jobs()
+            if self.scraper.parse_pool:
+                self.scraper.parse_pool.shutdown(wait=False)
+            if self.admin_api:
+                self.admin_api.stop()
+            if self.exporter:
+                self.exporter.close()
+            await self.scraper.aclose()
+            await self.webhook.aclose()
+            print("[INFO] Scraper closed. Goodbye!")
+    
+    async def run_async(self):
+        """
+        Main loop - Checks listings at regular intervals
+        """
+        self._print_banner()
+        
+        webhook_check = getattr(config, 'STARTUP_WEBHOOK_CHECK', 'background')
+        if webhook_check == "blocking":
+            print("[INFO] Testing Discord webhook...")
+            if not await self.webhook.test_webhook_async():
+                print("[ERROR] Webhook test failed! Check the URL.")
+                print("[WARNING] Continuing...")
+        elif webhook_check == "background":
+            # Doesn't block the first scrape, result is logged when it arrives
+            print("[INFO] Testing Discord webhook in background...")
+            self._health_check_task = asyncio.create_task(self.webhook.test_webhook_async())
+        
+        self.settings.start_watching(on_change=self._request_reload)
+        self._start_admin_api()
+        print("\n[INFO] Bot started (async). Press Ctrl+C to stop.\n")
+        
+        # Perform first check immediately
+        try:
+            await self._run_check_async()
+        except Exception as e:
+            print(f"[ERROR] Error during first check: {e}")
+        
+        # Main loop
+        while self.running:
+            try:
+                # Wait until next check
+                await self._wait_for_next_check_async()
+                
+                # Perform check
+                await self._run_check_async()
+                
+            except Exception as e:
+                print(f"[ERROR] Unexpected error: {e}")
+                print("[INFO] Will retry in 60 seconds...")
+                await asyncio.sleep(60)
+
+
 def main():
     """Main function"""
     try:
-        bot = JobScraperBot()
+        # Settings file and environment are applied first, they can switch ASYNC_MODE
+        settings = ConfigReloader()
+        settings.load()
+        bot_class = AsyncJobScraperBot if getattr(config, 'ASYNC_MODE', False) else JobScraperBot
+        bot = bot_class(settings)
         bot.run()
     except Exception as e:
         print(f"[FATAL ERROR] Application could not be started: {e}")
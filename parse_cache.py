@@ -0,0 +1,193 @@
+"""
+Parse Cache Module
+Content-addressed cache of extracted detail page data - identical pages are not parsed twice
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+import config
+from parse_pool import parse_settings
+
+# Volatile page parts that change on every request but never affect extracted fields
+VOLATILE_PATTERNS = [
+    re.compile(rb'(<meta[^>]*name="csrf-token"[^>]*content=")[^"]*', re.I),
+    re.compile(rb'(name="_token"[^>]*value=")[^"]*', re.I),
+    re.compile(rb'("csrf[_-]?token"\s*:\s*")[^"]*', re.I),
+    re.compile(rb'(\snonce=")[^"]*', re.I),
+    re.compile(rb'(\.(?:js|css)\?(?:id|v)=)[^"&]*', re.I),
+    re.compile(rb'(data-(?:timestamp|server-time|generated-at|request-id)=")[^"]*', re.I),
+]
+
+
+class ParseCache:
+    """
+    LRU map from normalized page hash to extracted details, persisted as JSON
+    """
+    
+    # Bump when the detail parser changes so stale extractions are dropped
+    VERSION = 3
+    
+    def __init__(self, cache_file: Optional[str] = None, max_entries: Optional[int] = None):
+        """
+        Initializes parse cache (the file is loaded on first use)
+        
+        Args:
+            cache_file: JSON file the cache is persisted to
+            max_entries: Max cached pages (least recently used are evicted)
+        """
+        if cache_file is None:
+            cache_file = getattr(config, 'PARSE_CACHE_FILE', None)
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.max_entries = max_entries or getattr(config, 'PARSE_CACHE_MAX_ENTRIES', 2000)
+        
+        self._entries: Optional[OrderedDict] = None
+        self._dirty = False
+        self._cost_total = 0.0  # CPU seconds spent on parses (for the savings estimate)
+        self._cost_count = 0
+        self.cycle = {'hits': 0, 'misses': 0}
+    
+    @staticmethod
+    def normalize(content: bytes) -> bytes:
+        """
+        Strips CSRF tokens, nonces, cache busters and request timestamps
+        
+        Args:
+            content: Raw page HTML
+            
+        Returns:
+            bytes: Normalized page
+        """
+        for pattern in VOLATILE_PATTERNS:
+            content = pattern.sub(rb'\1', content)
+        return content
+    
+    def key(self, content: bytes) -> str:
+        """
+        Args:
+            content: Raw page HTML
+            
+        Returns:
+            str: Hash of the normalized page and the parser settings it is extracted with
+        """
+        digest = hashlib.blake2b(self.normalize(content), digest_size=16)
+        digest.update(json.dumps(parse_settings(), sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+    
+    @property
+    def entries(self) -> OrderedDict:
+        """Cached extractions (loaded from disk on first access)"""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Looks up extracted details
+        
+        Args:
+            key: Content hash
+            
+        Returns:
+            Optional[Dict]: Copy of cached details or None
+        """
+        details = self.entries.get(key)
+        if details is None:
+            self.cycle['misses'] += 1
+            return None
+        
+        self.entries.move_to_end(key)
+        self.cycle['hits'] += 1
+        return dict(details)
+    
+    def put(self, key: str, details: Dict, cpu_time: Optional[float] = None):
+        """
+        Stores extracted details
+        
+        Args:
+            key: Content hash
+            details: Extracted details
+            cpu_time: CPU seconds the parse took
+        """
+        if cpu_time is not None:
+            self._cost_total += cpu_time
+            self._cost_count += 1
+        if not details:
+            # Failed parses are retried next time
+            return
+        
+        self.entries[key] = dict(details)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._dirty = True
+    
+    def start_cycle(self):
+        """Resets per-cycle hit/miss counters"""
+        self.cycle = {'hits': 0, 'misses': 0}
+    
+    def cycle_report(self) -> Dict:
+        """
+        Returns:
+            Dict: Hit ratio and estimated CPU time saved in the current cycle
+        """
+        hits = self.cycle['hits']
+        lookups = hits + self.cycle['misses']
+        avg_cost = self._cost_total / self._cost_count if self._cost_count else 0.0
+        return {
+            'hits': hits,
+            'lookups': lookups,
+            'hit_ratio': hits / lookups if lookups else 0.0,
+            'cpu_saved': hits * avg_cost,
+            'entries': len(self.entries),
+        }
+    
+    def _load(self) -> OrderedDict:
+        """Loads the cache file"""
+        if not self.cache_file or not self.cache_file.exists():
+            return OrderedDict()
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION:
+                print("[INFO] Parse cache is from an older parser version, starting fresh")
+                return OrderedDict()
+            cost = data.get('cost', {})
+            self._cost_total = float(cost.get('total', 0.0))
+            self._cost_count = int(cost.get('count', 0))
+            return OrderedDict((key, details) for key, details in data.get('entries', []))
+        except Exception as e:
+            print(f"[WARNING] Could not load parse cache: {e}")
+            return OrderedDict()
+    
+    def save(self):
+        """Saves the cache file (only if something changed)"""
+        if not self.cache_file or not self._dirty:
+            return
+        try:
+            data = {
+                'version': self.VERSION,
+                'cost': {'total': self._cost_total, 'count': self._cost_count},
+                'entries': list(self.entries.items()),
+            }
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            self._dirty = False
+        except Exception as e:
+            print(f"[WARNING] Could not save parse cache: {e}")
+
+
+def create_parse_cache() -> Optional[ParseCache]:
+    """
+    Creates the parse cache configured by PARSE_CACHE_MAX_ENTRIES
+    
+    Returns:
+        Optional[ParseCache]: Parse cache, or None if disabled
+    """
+    if not getattr(config, 'PARSE_CACHE_MAX_ENTRIES', 0):
+        return None
+    return ParseCache()
@@ -0,0 +1,188 @@
+"""
+Parse Pool Module
+Process pool stage that parses raw detail pages off the I/O threads
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import config
+from startup import lazy_import
+
+# Only needed when PARSE_WORKERS is set
+futures = lazy_import('concurrent.futures')
+futures_process = lazy_import('concurrent.futures.process')
+asyncio = lazy_import('asyncio')
+
+SLOT_POLL_INTERVAL = 0.01  # Seconds between free slot checks of parse_async()
+
+# Settings the detail parser reads - sent with every page so worker processes follow
+# reloads, and part of the parse cache key so cached results match the current values
+PARSE_SETTINGS = ('ACTIVE_JOB_STATUSES',)
+
+
+def parse_settings() -> Dict:
+    """
+    Returns:
+        Dict: Current values of the settings the detail parser reads
+    """
+    return {name: getattr(config, name, None) for name in PARSE_SETTINGS}
+
+
+def _init_worker():
+    """Preloads BeautifulSoup and the compiled detail selectors in a worker process"""
+    import bs4  # noqa: F401
+    import scraper  # noqa: F401
+
+
+def parse_detail_page(content: bytes, settings: Optional[Dict] = None) -> Dict:
+    """
+    Parses a detail page in a worker process
+    
+    Args:
+        content: Raw page HTML
+        settings: parse_settings() of the submitting process (workers only see config.py otherwise)
+        
+    Returns:
+        Dict: Extracted details (only this compact record crosses the process boundary)
+    """
+    from scraper import JobScraper
+    if settings:
+        for name, value in settings.items():
+            setattr(config, name, value)
+    return JobScraper._parse_job_details(content)
+
+
+def parse_detail_page_timed(content: bytes, settings: Optional[Dict] = None) -> Tuple[Dict, float]:
+    """
+    Parses a detail page and measures the CPU time it took
+    
+    Args:
+        content: Raw page HTML
+        settings: parse_settings() of the submitting process
+        
+    Returns:
+        Tuple[Dict, float]: Extracted details and CPU seconds
+    """
+    start = time.process_time()
+    details = parse_detail_page(content, settings)
+    return details, time.process_time() - start
+
+
+class ParsePool:
+    """
+    Pool of parser worker processes with bounded in-flight pages (back-pressure)
+    """
+    
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        """
+        Initializes parse pool (worker processes start on first use)
+        
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            max_pending: Max pages submitted but not yet parsed (default: 2 x workers)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self._executor: Optional['futures.ProcessPoolExecutor'] = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+    
+    @property
+    def executor(self) -> 'futures.ProcessPoolExecutor':
+        """Worker process pool, created on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+            return self._executor
+    
+    def submit(self, content: bytes) -> 'futures.Future':
+        """
+        Submits a page for parsing. Blocks while max_pending pages are in flight,
+        so the fetch stage can't run ahead of the parse stage.
+        
+        Args:
+            content: Raw page HTML
+            
+        Returns:
+            Future: Resolves to (extracted details, CPU seconds)
+        """
+        self._slots.acquire()
+        return self._submit_acquired(content)
+    
+    def _submit_acquired(self, content: bytes) -> 'futures.Future':
+        """Submits a page once a slot is held (the slot is released when parsing finishes)"""
+        try:
+            future = self.executor.submit(parse_detail_page_timed, content, parse_settings())
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+    
+    def result(self, future: 'futures.Future') -> Tuple[Dict, Optional[float]]:
+        """
+        Waits for a parse result
+        
+        Args:
+            future: Future returned by submit()
+            
+        Returns:
+            Tuple[Dict, Optional[float]]: Extracted details (empty on error) and CPU seconds
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            return self._failed(e)
+    
+    async def parse_async(self, content: bytes) -> Tuple[Dict, Optional[float]]:
+        """
+        Parses a page from the event loop with the same back-pressure and crash handling
+        as submit()/result(). Waits for a free slot without blocking the loop.
+        
+        Args:
+            content: Raw page HTML
+            
+        Returns:
+            Tuple[Dict, Optional[float]]: Extracted details (empty on error) and CPU seconds
+        """
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(SLOT_POLL_INTERVAL)
+        try:
+            # Cancelling the wrapper cancels a not yet started parse, which frees the slot
+            return await asyncio.wrap_future(self._submit_acquired(content))
+        except Exception as e:
+            return self._failed(e)
+    
+    def _failed(self, error: Exception) -> Tuple[Dict, None]:
+        """Logs a failed parse and restarts the pool if a worker crashed"""
+        if isinstance(error, futures_process.BrokenProcessPool):
+            print(f"[WARNING] Parser worker crashed, restarting pool: {error}")
+            self.shutdown(wait=False)
+        else:
+            print(f"[WARNING] Error parsing job details: {error}")
+        return {}, None
+    
+    def shutdown(self, wait: bool = True):
+        """Stops the worker processes"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+def create_parse_pool() -> Optional[ParsePool]:
+    """
+    Creates the parse pool configured by PARSE_WORKERS
+    
+    Returns:
+        Optional[ParsePool]: Parse pool, or None to parse in-process
+    """
+    workers = getattr(config, 'PARSE_WORKERS', 0)
+    if not workers:
+        return None
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return ParsePool(workers, getattr(config, 'PARSE_MAX_PENDING', 0) or None)
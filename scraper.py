@@ -4,59 +4,294 @@ Web scraping module - Fetches and parses job listings
 """
 
 import os
-import certifi
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
 import re
 import time
 import config
+from circuit_breaker import CircuitBreaker
+from drift import FALLBACKS_KEY, ParserDriftDetector
+from job_index import create_job_index
+from parse_cache import create_parse_cache
+from parse_pool import create_parse_pool, parse_detail_page_timed, parse_settings
+from startup import lazy_import
+
+# Heavy dependencies are imported on first use to keep cold start fast
+requests = lazy_import('requests')
+urllib3 = lazy_import('urllib3')
+bs4 = lazy_import('bs4')
+certifi = lazy_import('certifi')
+
+# Common system CA bundle paths
+SYSTEM_CA_BUNDLE_PATHS = [
+    "/etc/ssl/certs/ca-certificates.crt", # Debian/Ubuntu/Gentoo etc.
+    "/etc/pki/tls/certs/ca-bundle.crt",   # Fedora/RHEL 6
+    "/etc/ssl/ca-bundle.pem",             # OpenSUSE
+    "/etc/pki/tls/cacert.pem",            # OpenELEC
+    "/etc/pki/ca-trust/extracted/pem/tls-ca-bundle.pem", # CentOS/RHEL 7
+    "/usr/local/etc/ssl/cert.pem",        # FreeBSD
+    "/etc/ssl/cert.pem",                  # macOS
+]
+
+
+@lru_cache(maxsize=1)
+def resolve_ca_bundle() -> Optional[str]:
+    """
+    Resolves SSL certificate bundle path.
+    Uses the path cached by a previous run if it still exists, otherwise checks
+    certifi's default path and then common system paths.
+    
+    Returns:
+        Optional[str]: CA bundle path or None
+    """
+    cache_file = getattr(config, 'CA_BUNDLE_CACHE_FILE', None)
+    cache_path = Path(cache_file) if cache_file else None
+    
+    # 1. Check path cached by a previous run
+    if cache_path and cache_path.exists():
+        try:
+            cached = cache_path.read_text(encoding='utf-8').strip()
+            # The bundle may have been removed since (e.g. certifi upgraded into a new path)
+            if cached and os.path.isfile(cached):
+                return cached
+        except OSError:
+            pass
+    
+    # 2. Check certifi default path
+    resolved = None
+    certifi_path = certifi.where()
+    if os.path.exists(certifi_path):
+        resolved = certifi_path
+    else:
+        print(f"[WARNING] Certifi path not found: {certifi_path}")
+        
+        # 3. Check common system CA bundle paths
+        for path in SYSTEM_CA_BUNDLE_PATHS:
+            if os.path.exists(path):
+                print(f"[INFO] Using system CA bundle: {path}")
+                resolved = path
+                break
+    
+    if not resolved:
+        print("[ERROR] Could not find a suitable TLS CA certificate bundle!")
+        return None
+    
+    if cache_path:
+        try:
+            cache_path.write_text(resolved, encoding='utf-8')
+        except OSError as e:
+            print(f"[WARNING] Could not cache CA bundle path: {e}")
+    
+    return resolved
+
+# Detail page selectors - compiled once (also preloaded by parser worker processes)
+DETAIL_STATUS_CLASS = re.compile(r'job.*status|status.*badge', re.I)
+DETAIL_BUDGET_LABEL = re.compile(r'^Budget$', re.I)
+DETAIL_DUE_DATE_LABEL = re.compile(r'DUE\s*DATE', re.I)
+DETAIL_APPLICATIONS_LABEL = re.compile(r'^Applications$', re.I)
+DETAIL_VIEWS_LABEL = re.compile(r'^Views$', re.I)
+DETAIL_CATEGORY_LABEL = re.compile(r'^Category$', re.I)
+DETAIL_APPLICATIONS_PATTERNS = [
+    re.compile(r'(\d+)\s*applicant', re.I),
+    re.compile(r'Applications[:\s]+(\d+)', re.I),
+]
+DETAIL_VIEWS_PATTERNS = [
+    re.compile(r'([\d,]+)\s*views?', re.I),
+    re.compile(r'Views[:\s]+([\d,]+)', re.I),
+]
+NUMBER_PATTERN = re.compile(r'(\d+)')
+GROUPED_NUMBER_PATTERN = re.compile(r'([\d,]+)')
+
+# Detail page streaming - labels the detail parser looks for; once all of them
+# (plus DETAIL_STREAM_TAIL_BYTES for their values) are received, the download stops
+DETAIL_STREAM_MARKERS = {
+    'status': re.compile(rb'class="[^"]*(?:job[^"]*status|status[^"]*badge)', re.I),
+    'budget': re.compile(rb'>\s*Budget\s*<', re.I),
+    'due_date': re.compile(rb'DUE\s*DATE', re.I),
+    'views': re.compile(rb'>\s*Views\s*<', re.I),
+    'applications': re.compile(rb'>\s*Applications\s*<', re.I),
+    'category': re.compile(rb'>\s*Category\s*<', re.I),
+}
+DETAIL_STREAM_CHUNK_SIZE = 16 * 1024
+DETAIL_READ_TIMEOUT = 15  # Per-read socket timeout, shrunk to the time budget left near the deadline
+DETAIL_MARKER_OVERLAP = 256  # Re-scanned bytes so markers split across chunks are found
+
+
+class DetailPageDownload:
+    """
+    Accumulates a streamed detail page and decides when to stop reading.
+    Shared by the sync and async scrapers.
+    """
+    
+    def __init__(self, url: str):
+        """
+        Initializes download state
+        
+        Args:
+            url: Detail page URL
+        """
+        self.url = url
+        self.max_bytes = getattr(config, 'DETAIL_MAX_BYTES', 2 * 1024 * 1024)
+        self.max_ratio = getattr(config, 'DETAIL_MAX_DECOMPRESSION_RATIO', 100)
+        self.max_seconds = getattr(config, 'DETAIL_MAX_SECONDS', 30)
+        self.tail_bytes = getattr(config, 'DETAIL_STREAM_TAIL_BYTES', 16 * 1024)
+        
+        self.stat = {'url': url, 'bytes_downloaded': 0, 'bytes_decoded': 0, 'elapsed': 0.0, 'result': 'complete'}
+        self.body = bytearray()
+        self.discarded = False
+        self._start = time.perf_counter()
+        self._pending_markers = dict(DETAIL_STREAM_MARKERS)
+        self._stop_at: Optional[int] = None  # Offset after which the page is no longer needed
+        self._last_marker_end = 0
+    
+    def feed(self, chunk: bytes, bytes_downloaded: int) -> bool:
+        """
+        Adds a decoded chunk
+        
+        Args:
+            chunk: Decoded body chunk
+            bytes_downloaded: Bytes received on the wire so far
+            
+        Returns:
+            bool: Should reading continue?
+        """
+        body = self.body
+        search_from = max(0, len(body) - DETAIL_MARKER_OVERLAP)
+        body.extend(chunk)
+        self.stat['bytes_downloaded'] = bytes_downloaded
+        self.stat['bytes_decoded'] = len(body)
+        
+        # Decompression bomb protection
+        if len(body) > DETAIL_STREAM_CHUNK_SIZE and bytes_downloaded and len(body) / bytes_downloaded > self.max_ratio:
+            print(f"[WARNING] Suspicious compression ratio, discarding: {self.url}")
+            self.stat['result'] = 'ratio_limit'
+            self.discarded = True
+            return False
+        
+        if len(body) >= self.max_bytes:
+            print(f"[WARNING] Detail page exceeded {self.max_bytes} bytes, truncating: {self.url}")
+            del body[self.max_bytes:]
+            self.stat['result'] = 'size_limit'
+            return False
+        
+        if self.seconds_left() <= 0:
+            self.stop_at_deadline()
+            return False
+        
+        # Early termination once every field label has been seen
+        if self._stop_at is None:
+            for field, marker in list(self._pending_markers.items()):
+                match = marker.search(body, search_from)
+                if match:
+                    del self._pending_markers[field]
+                    self._last_marker_end = max(self._last_marker_end, match.end())
+            if not self._pending_markers:
+                self._stop_at = self._last_marker_end + self.tail_bytes
+        if self._stop_at is not None and len(body) >= self._stop_at:
+            # Cut at a fixed offset so the kept body doesn't depend on chunk boundaries
+            del body[self._stop_at:]
+            self.stat['result'] = 'early_stop'
+            return False
+        
+        return True
+    
+    def seconds_left(self) -> float:
+        """Time left of the DETAIL_MAX_SECONDS budget (negative once exceeded)"""
+        return self.max_seconds - (time.perf_counter() - self._start)
+    
+    def stop_at_deadline(self):
+        """Keeps what has been received so far when the time budget runs out"""
+        print(f"[WARNING] Detail page download too slow, truncating: {self.url}")
+        self.stat['result'] = 'deadline'
+    
+    def fail(self):
+        """Marks the download as failed"""
+        self.stat['result'] = 'error'
+    
+    def complete(self) -> Dict:
+        """
+        Finishes the download
+        
+        Returns:
+            Dict: Download stats (bytes downloaded, time-to-complete, result)
+        """
+        self.stat['elapsed'] = time.perf_counter() - self._start
+        return self.stat
+    
+    @property
+    def content(self) -> Optional[bytes]:
+        """Page body (possibly truncated) or None if discarded"""
+        return None if self.discarded else bytes(self.body)
 
 
 class JobScraper:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': config.USER_AGENT
-        })
+        self._session = None
+        self.ca_bundle_path = None
         self.request_delay = getattr(config, 'DETAIL_REQUEST_DELAY', 1.5)  # Delay between detail page requests
+        self.fetch_stats: List[Dict] = []  # Per-page download stats of the last cycle
+        
+        # Circuit breakers - a degraded site costs seconds per cycle instead of minutes
+        self.listing_breaker = CircuitBreaker('gmodstore-listing')
+        self.detail_breaker = CircuitBreaker('gmodstore-detail')
+        
+        # Optional process pool for detail page parsing (PARSE_WORKERS)
+        self.parse_pool = create_parse_pool()
+        
+        # Content-hash cache of parsed detail pages (PARSE_CACHE_MAX_ENTRIES)
+        self.parse_cache = create_parse_cache()
         
-        # Configure SSL
-        self.ca_bundle_path = self._configure_ssl()
-        if self.ca_bundle_path:
-            self.session.verify = self.ca_bundle_path
+        # Listing card fingerprints - unchanged jobs reuse their last details (JOB_INDEX_FILE)
+        self.job_index = create_job_index()
+        
+        # Fallback selector / N/A field rates, checked before results are sent
+        self.drift_detector = ParserDriftDetector()
+        self._parse_settings = parse_settings()  # Values the indexed details were extracted with
+    
+    def apply_config(self):
+        """Applies reloaded settings - in-flight fetches finish, later requests use the new values"""
+        self.request_delay = getattr(config, 'DETAIL_REQUEST_DELAY', 1.5)
+        self.listing_breaker.reload_config()
+        self.detail_breaker.reload_config()
+        if self.job_index:
+            self.job_index.stale_ttl = getattr(config, 'DETAIL_STALE_TTL', 6 * 3600)
+            self.job_index.fetch_budget = getattr(config, 'DETAIL_FETCH_BUDGET', 0)
+        self.drift_detector.tolerance = getattr(config, 'PARSER_DRIFT_TOLERANCE', 0.25)
+        self.drift_detector.warmup_cycles = getattr(config, 'PARSER_DRIFT_WARMUP_CYCLES', 3)
+        self.drift_detector.min_samples = getattr(config, 'PARSER_DRIFT_MIN_SAMPLES', 5)
+        if parse_settings() != self._parse_settings:
+            # Indexed details were extracted under the old values - refetch them (the parse
+            # cache key includes the settings, so its old entries simply stop matching)
+            self._parse_settings = parse_settings()
+            if self.job_index:
+                self.job_index.expire()
+        if self._session is not None:
+            self._session.headers['User-Agent'] = config.USER_AGENT
+    
+    @property
+    def session(self):
+        """
+        HTTP session, created (and SSL configured) on first use
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': config.USER_AGENT
+            })
+            
+            # Configure SSL
+            self.ca_bundle_path = self._configure_ssl()
+            if self.ca_bundle_path:
+                self._session.verify = self.ca_bundle_path
+        return self._session
 
     def _configure_ssl(self) -> Optional[str]:
         """
-        Configures SSL certificate bundle path.
-        Checks if certifi's default path exists, if not, tries common system paths.
+        Configures SSL certificate bundle path (resolved once per process, cached across restarts)
         """
-        # 1. Check certifi default path
-        certifi_path = certifi.where()
-        if os.path.exists(certifi_path):
-            return certifi_path
-            
-        print(f"[WARNING] Certifi path not found: {certifi_path}")
-        
-        # 2. Check common system CA bundle paths
-        common_paths = [
-            "/etc/ssl/certs/ca-certificates.crt", # Debian/Ubuntu/Gentoo etc.
-            "/etc/pki/tls/certs/ca-bundle.crt",   # Fedora/RHEL 6
-            "/etc/ssl/ca-bundle.pem",             # OpenSUSE
-            "/etc/pki/tls/cacert.pem",            # OpenELEC
-            "/etc/pki/ca-trust/extracted/pem/tls-ca-bundle.pem", # CentOS/RHEL 7
-            "/usr/local/etc/ssl/cert.pem",        # FreeBSD
-            "/etc/ssl/cert.pem",                  # macOS
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                print(f"[INFO] Using system CA bundle: {path}")
-                return path
-                
-        print("[ERROR] Could not find a suitable TLS CA certificate bundle!")
-        return None
+        return resolve_ca_bundle()
     
     def fetch_jobs(self) -> List[Dict]:
         """
@@ -66,47 +301,70 @@ class JobScraper:
         Returns:
             List[Dict]: List of job listings with full details
         """
+        if not self.listing_breaker.allow_request():
+            print(f"[WARNING] GModStore circuit open, skipping check "
+                  f"(next probe in {self.listing_breaker.retry_after():.0f}s)")
+            return []
+        
         try:
-            response = self.session.get(config.GMODSTORE_JOBS_URL, timeout=10)
-            response.raise_for_status()
+            start = time.perf_counter()
+            try:
+                response = self.session.get(config.GMODSTORE_JOBS_URL, timeout=10)
+                response.raise_for_status()
+            except Exception as e:
+                self._record_endpoint_error(self.listing_breaker, e)
+                raise
+            self.listing_breaker.record_success(time.perf_counter() - start)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            jobs = self._parse_jobs(soup)
+            jobs = self._parse_listing(response.content)
             
-            # Fetch details for each job
-            print(f"[INFO] Fetching details for {len(jobs)} jobs...")
-            detailed_jobs = []
+            # Fetch details for new, changed and stale jobs only
+            to_fetch, known_details = self._plan_detail_fetches(jobs)
+            print(f"[INFO] Fetching details for {len(to_fetch)}/{len(jobs)} jobs...")
+            self._start_detail_cycle()
+            fetched = {}  # job ID -> details or (cache key, parse pool future)
             
-            for i, job in enumerate(jobs, 1):
+            for i, job in enumerate(to_fetch, 1):
+                if not self.detail_breaker.allow_request():
+                    # Short-circuit pending detail fetches, keep basic info
+                    print(f"[WARNING] Detail circuit open, skipping {len(to_fetch) - i + 1} pending detail fetches")
+                    break
+                
                 try:
-                    print(f"[INFO] Fetching details ({i}/{len(jobs)}): {job['title'][:50]}...")
-                    details = self.fetch_job_details(job['url'])
-                    
-                    if details:
-                        # Merge basic info with detailed info
-                        job.update(details)
-                        
-                        # Validate job (check due date, etc.)
-                        if self._is_valid_job(job):
-                            detailed_jobs.append(job)
-                        else:
-                            print(f"[INFO] Filtered out: {job['title'][:50]} (invalid or expired)")
+                    print(f"[INFO] Fetching details ({i}/{len(to_fetch)}): {job['title'][:50]}...")
+                    content = self._fetch_detail_content(job['url'])
+                    if content is None:
+                        fetched[job['job_id']] = {}
                     else:
-                        # If details fetch fails, still add basic info
-                        if self._is_valid_job(job):
-                            detailed_jobs.append(job)
+                        cache_key, cached = self._lookup_cached_details(content)
+                        if cached is not None:
+                            fetched[job['job_id']] = cached
+                        elif self.parse_pool:
+                            # Parsed in a worker process while the next page downloads
+                            fetched[job['job_id']] = (cache_key, self.parse_pool.submit(content))
+                        else:
+                            fetched[job['job_id']] = self._parse_details_safe(content, cache_key)
                     
                     # Rate limiting
-                    if i < len(jobs):
+                    if i < len(to_fetch):
                         time.sleep(self.request_delay)
                         
                 except Exception as e:
                     print(f"[WARNING] Error fetching details for job: {e}")
                     # Add job with basic info if detail fetch fails
-                    if self._is_valid_job(job):
-                        detailed_jobs.append(job)
+                    fetched[job['job_id']] = {}
                     continue
             
+            for job_id, details in fetched.items():
+                if not isinstance(details, dict):
+                    cache_key, future = details
+                    details, cpu_time = self.parse_pool.result(future)
+                    self._store_cached_details(cache_key, details, cpu_time)
+                    fetched[job_id] = details
+            
+            detailed_jobs = self._merge_details(jobs, fetched, known_details)
+            self._finish_detail_cycle()
+            
             return detailed_jobs
         
         except requests.RequestException as e:
@@ -116,7 +374,144 @@ class JobScraper:
             print(f"[ERROR] Error parsing listings: {e}")
             return []
     
-    def _parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+    def _plan_detail_fetches(self, jobs: List[Dict]) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """
+        Picks the jobs whose detail pages need fetching this cycle
+        
+        Args:
+            jobs: Job listings from the listing page
+            
+        Returns:
+            Tuple[List[Dict], Dict[str, Dict]]: Jobs to fetch (in priority order) and last known details by job ID
+        """
+        if not self.job_index:
+            return jobs, {}
+        
+        to_fetch, known_details = self.job_index.plan(jobs)
+        if len(to_fetch) < len(jobs):
+            print(f"[INFO] {len(jobs) - len(to_fetch)} listing cards unchanged, reusing their details")
+        return to_fetch, known_details
+    
+    def _merge_details(self, jobs: List[Dict], fetched: Dict[str, Dict], known_details: Dict[str, Dict]) -> List[Dict]:
+        """
+        Merges fetched (or last known) details into the jobs and updates the job index
+        
+        Args:
+            jobs: Job listings from the listing page, in listing order
+            fetched: Details fetched this cycle by job ID (empty if the fetch failed)
+            known_details: Last known details by job ID
+            
+        Returns:
+            List[Dict]: Valid jobs with full details
+        """
+        detailed_jobs = []
+        for job in jobs:
+            details = fetched.get(job['job_id'])
+            if details:
+                self.drift_detector.observe_detail(details)
+                if self.job_index:
+                    self.job_index.record(job, details)
+            else:
+                # Not fetched or fetch failed - fall back to the last known details
+                details = known_details.get(job['job_id'])
+                if not details:
+                    # Deferred by the fetch budget, short-circuited or failed - not enriched yet
+                    job['details_pending'] = True
+            self._collect_job(job, details, detailed_jobs)
+        
+        if self.job_index:
+            self.job_index.prune(jobs)
+            self.job_index.save()
+        return detailed_jobs
+    
+    def _collect_job(self, job: Dict, details: Optional[Dict], detailed_jobs: List[Dict]):
+        """
+        Merges detail page data into a job and keeps it if still valid
+        
+        Args:
+            job: Job listing data from the listing page
+            details: Detail page data (empty if the fetch failed)
+            detailed_jobs: Output list
+        """
+        if details:
+            # Merge basic info with detailed info
+            job.update(details)
+            
+            # Validate job (check due date, etc.)
+            if self._is_valid_job(job):
+                detailed_jobs.append(job)
+            else:
+                print(f"[INFO] Filtered out: {job['title'][:50]} (invalid or expired)")
+        else:
+            # If details fetch fails, still add basic info
+            if self._is_valid_job(job):
+                detailed_jobs.append(job)
+    
+    @staticmethod
+    def _record_endpoint_error(breaker: CircuitBreaker, error: Exception):
+        """
+        Records a request error on a circuit breaker.
+        Client errors (4xx except 429) say nothing about endpoint health and are ignored.
+        
+        Args:
+            breaker: Endpoint circuit breaker
+            error: Request exception (or any other error raised by the call)
+        """
+        response = getattr(error, 'response', None)
+        if response is not None and 400 <= response.status_code < 500 and response.status_code != 429:
+            breaker.record_success()
+            return
+        breaker.record_failure(f"{type(error).__name__}: {error}")
+    
+    def _start_detail_cycle(self):
+        """Resets per-cycle download stats and parse cache counters"""
+        self.fetch_stats = []
+        if self.parse_cache:
+            self.parse_cache.start_cycle()
+    
+    def _finish_detail_cycle(self):
+        """Prints the cycle's detail page stats, checks for parser drift and persists the parse cache"""
+        self._print_fetch_stats()
+        self.drift_detector.finish_cycle()
+        if self.parse_cache:
+            report = self.parse_cache.cycle_report()
+            if report['lookups']:
+                print(f"[INFO] Parse cache: {report['hits']}/{report['lookups']} hits "
+                      f"({report['hit_ratio']:.0%}), ~{report['cpu_saved'] * 1000:.0f} ms CPU saved, "
+                      f"{report['entries']} entries")
+            self.parse_cache.save()
+    
+    def _print_fetch_stats(self):
+        """Prints bandwidth summary of the detail pages fetched this cycle"""
+        if not self.fetch_stats:
+            return
+        
+        downloaded = sum(stat['bytes_downloaded'] for stat in self.fetch_stats)
+        elapsed = sum(stat['elapsed'] for stat in self.fetch_stats)
+        early_stops = sum(1 for stat in self.fetch_stats if stat['result'] == 'early_stop')
+        limited = sum(1 for stat in self.fetch_stats if stat['result'] in ('size_limit', 'ratio_limit', 'deadline'))
+        
+        print(f"[INFO] Detail pages: {len(self.fetch_stats)} fetched, "
+              f"{downloaded / 1024:.1f} KB downloaded ({downloaded / len(self.fetch_stats) / 1024:.1f} KB/page), "
+              f"{elapsed / len(self.fetch_stats):.2f}s/page, {early_stops} stopped early, {limited} hit limits")
+    
+    def _parse_listing(self, content: bytes) -> List[Dict]:
+        """
+        Parses job listings from listing page HTML
+        
+        Args:
+            content: Page HTML
+            
+        Returns:
+            List[Dict]: Parsed job listings
+        """
+        self.drift_detector.start_cycle()
+        soup = bs4.BeautifulSoup(content, 'html.parser')
+        jobs = self._parse_jobs(soup)
+        self.drift_detector.observe_listing(jobs)
+        return jobs
+    
+    def _parse_jobs(self, soup: 'bs4.BeautifulSoup') -> List[Dict]:
         """
         Parses job listings from HTML
         
@@ -133,6 +528,7 @@ class JobScraper:
         
         if not job_cards:
             print("[WARNING] 'item-listing--job' class not found, trying alternative...")
+            self.drift_detector.observe_listing_fallback()
             # Alternative selector
             job_cards = soup.select('div.item-listing')
         
@@ -336,175 +732,334 @@ class JobScraper:
         Returns:
             Dict: Detailed job listing data
         """
-        details = {}
+        content = self._fetch_detail_content(job_url)
+        if content is None:
+            return {}
         
-        try:
-            response = self.session.get(job_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Description - Note: GModStore uses dynamic Vue.js rendering (v-quill-render)
-            # The description content is loaded via JavaScript and not available in static HTML
-            # For now, we'll create a descriptive summary from available data
-            
-            # Try to find any static text content that might be useful
-            description_parts = []
-            
-            # Add budget if available
-            if details.get('budget'):
-                description_parts.append(f"Budget: {details['budget']}")
-            
-            # Add category if available
-            if details.get('category'):
-                description_parts.append(f"Category: {details['category']}")
-            
-            # Add application count
-            if details.get('applications') is not None:
-                app_count = details['applications']
-                description_parts.append(f"{app_count} application{'s' if app_count != 1 else ''}")
-            
-            # Create basic description
-            if description_parts:
-                details['description'] = " | ".join(description_parts)
-            
-            # Note: To get full description, you would need to:
-            # 1. Use Selenium/Playwright for JavaScript rendering
-            # 2. Access GModStore API if available
-            # 3. Parse from a different source
-            # For this use case, the summary is sufficient for Discord notifications
-            
-            # Status - Look for job status badge/label
-            status_elem = soup.find(['span', 'div'], class_=re.compile(r'job.*status|status.*badge', re.I))
-            if status_elem:
-                status_text = status_elem.get_text(strip=True)
-                if status_text in config.ACTIVE_JOB_STATUSES + ["Finished"]:
-                    details['status'] = status_text
-            
-            # Budget - Look for price/budget information
-            budget_label = soup.find(string=re.compile(r'^Budget$', re.I))
-            if budget_label:
-                parent = budget_label.find_parent()
-                if parent:
-                    card = parent.find_parent('div', class_='card')
-                    if card:
-                        card_body = card.find('div', class_='card-body')
-                        if card_body:
-                            card_text = card_body.find('div', class_='card-text')
-                            if card_text:
-                                details['budget'] = card_text.get_text(strip=True)
-            
-            # Due Date - Multiple approaches
-            due_date = None
+        cache_key, details = self._lookup_cached_details(content)
+        if details is None:
+            details = self._parse_details_safe(content, cache_key)
+        details.pop(FALLBACKS_KEY, None)
+        return details
+    
+    def _fetch_detail_content(self, job_url: str) -> Optional[bytes]:
+        """
+        Downloads a detail page and records the result on the detail circuit breaker
+        
+        Args:
+            job_url: Job listing URL
             
-            # Try 1: Look for "DUE DATE" text
-            due_elem = soup.find(string=re.compile(r'DUE\s*DATE', re.I))
-            if due_elem:
-                # Find the next element with date info
-                parent = due_elem.find_parent()
-                if parent:
-                    next_elem = parent.find_next(['span', 'div', 'time', 'dd'])
-                    if next_elem:
-                        due_date = next_elem.get_text(strip=True)
-            
-            # Try 2: Look for v-date-time with time attribute
-            if not due_date:
-                date_elem = soup.find('v-date-time', {'time': True})
-                if date_elem:
-                    due_date = date_elem.get('time')
+        Returns:
+            Optional[bytes]: Page body or None if the fetch failed
+        """
+        try:
+            start = time.perf_counter()
+            try:
+                content = self._download_detail_page(job_url)
+            except Exception as e:
+                # Every allowed request must report back, or a half-open probe slot leaks
+                self._record_endpoint_error(self.detail_breaker, e)
+                raise
+            self.detail_breaker.record_success(time.perf_counter() - start)
             
-            # Try 3: Look for time element
-            if not due_date:
-                time_elem = soup.find('time', {'datetime': True})
-                if time_elem:
-                    due_date = time_elem.get('datetime') or time_elem.get_text(strip=True)
-            
-            if due_date:
-                details['due_date'] = due_date
-            
-            # Applications - Look for applicant count
-            # First try to find "Applications" label and its value
-            app_label = soup.find(string=re.compile(r'^Applications$', re.I))
-            if app_label:
-                parent = app_label.find_parent()
-                if parent:
-                    next_elem = parent.find_next(['dd', 'span', 'div'])
-                    if next_elem:
-                        app_text = next_elem.get_text(strip=True)
-                        num_match = re.search(r'(\d+)', app_text)
-                        if num_match:
-                            details['applications'] = int(num_match.group(1))
-            
-            # Fallback: search in text
-            if 'applications' not in details:
-                app_patterns = [
-                    (r'(\d+)\s*applicant', re.I),
-                    (r'Applications[:\s]+(\d+)', re.I),
-                ]
-                
-                for pattern, flags in app_patterns:
-                    app_match = soup.find(string=re.compile(pattern, flags))
-                    if app_match:
-                        num_match = re.search(pattern, app_match, flags)
-                        if num_match:
-                            details['applications'] = int(num_match.group(1))
-                            break
-            
-            # Views - Look for view count
-            # First try to find "Views" label and its value
-            views_label = soup.find(string=re.compile(r'^Views$', re.I))
-            if views_label:
-                parent = views_label.find_parent()
-                if parent:
-                    next_elem = parent.find_next(['dd', 'span', 'div'])
-                    if next_elem:
-                        views_text = next_elem.get_text(strip=True)
-                        num_match = re.search(r'([\d,]+)', views_text)
-                        if num_match:
-                            view_str = num_match.group(1).replace(',', '')
-                            details['views'] = int(view_str)
-            
-            # Fallback: search in text
-            if 'views' not in details:
-                view_patterns = [
-                    (r'([\d,]+)\s*views?', re.I),
-                    (r'Views[:\s]+([\d,]+)', re.I),
-                ]
-                
-                for pattern, flags in view_patterns:
-                    view_match = soup.find(string=re.compile(pattern, flags))
-                    if view_match:
-                        num_match = re.search(pattern, view_match, flags)
-                        if num_match:
-                            # Parse number with commas (e.g., "1,234")
-                            view_str = num_match.group(1).replace(',', '')
-                            details['views'] = int(view_str)
-                            break
-            
-            # Category - Look for category information
-            cat_elem = soup.find(string=re.compile(r'^Category$', re.I))
-            if cat_elem:
-                parent = cat_elem.find_parent()
-                if parent:
-                    # Try to find the next dd element (definition description) or a link
-                    next_elem = parent.find_next(['dd', 'a'])
-                    if next_elem:
-                        cat_text = next_elem.get_text(strip=True)
-                        # Clean up category - should be short like "Gamemode", "Modelling", etc.
-                        if cat_text and len(cat_text) < 50 and not cat_text.startswith('Job:'):
-                            details['category'] = cat_text
-            
-            return details
+            return content
             
         except requests.Timeout:
             print(f"[WARNING] Timeout fetching job details: {job_url}")
-            return {}
+            return None
         except requests.RequestException as e:
             print(f"[WARNING] Request error fetching job details: {e}")
-            return {}
+            return None
+        except Exception as e:
+            print(f"[WARNING] Error fetching job details: {e}")
+            return None
+    
+    def _parse_details_safe(self, content: bytes, cache_key: Optional[str] = None) -> Dict:
+        """
+        Parses a detail page in-process, returning empty details on error
+        
+        Args:
+            content: Page HTML
+            cache_key: Parse cache key to store the result under
+            
+        Returns:
+            Dict: Detailed job listing data
+        """
+        try:
+            details, cpu_time = parse_detail_page_timed(content)
         except Exception as e:
             print(f"[WARNING] Error parsing job details: {e}")
             return {}
+        
+        self._store_cached_details(cache_key, details, cpu_time)
+        return details
+    
+    def _lookup_cached_details(self, content: bytes) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        Looks up a detail page in the parse cache
+        
+        Args:
+            content: Page HTML
+            
+        Returns:
+            Tuple[Optional[str], Optional[Dict]]: Cache key (None if caching is off) and cached details
+        """
+        if not self.parse_cache:
+            return None, None
+        cache_key = self.parse_cache.key(content)
+        return cache_key, self.parse_cache.get(cache_key)
+    
+    def _store_cached_details(self, cache_key: Optional[str], details: Dict, cpu_time: Optional[float]):
+        """
+        Stores freshly parsed details in the parse cache
+        
+        Args:
+            cache_key: Key from _lookup_cached_details()
+            details: Extracted details
+            cpu_time: CPU seconds the parse took
+        """
+        if self.parse_cache and cache_key:
+            self.parse_cache.put(cache_key, details, cpu_time)
+    
+    def _download_detail_page(self, job_url: str) -> Optional[bytes]:
+        """
+        Streams a detail page with size, decompression and time limits.
+        Stops early once all extraction markers (plus a tail margin) have been received.
+        Records bytes downloaded and time-to-complete in self.fetch_stats.
+        
+        Args:
+            job_url: Job listing URL
+            
+        Returns:
+            Optional[bytes]: Page body (possibly truncated) or None if discarded
+        """
+        download = DetailPageDownload(job_url)
+        
+        try:
+            with self.session.get(job_url, timeout=DETAIL_READ_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                self._read_detail_body(response.raw, download)
+        except Exception:
+            download.fail()
+            raise
+        finally:
+            self.fetch_stats.append(download.complete())
+        
+        return download.content
+    
+    @staticmethod
+    def _read_detail_body(raw, download: DetailPageDownload):
+        """
+        Reads a streamed body into the download. Each read returns as soon as any data arrives and
+        the socket timeout is shrunk to the time budget left, so a server drip-feeding bytes can't
+        keep a read going past DETAIL_MAX_SECONDS. urllib3 errors are raised as the matching
+        requests exceptions so they take the normal request-error path.
+        
+        Args:
+            raw: urllib3 (>= 2.6) response of a stream=True request
+            download: Download state
+        """
+        sock = getattr(getattr(raw, 'connection', None), 'sock', None)
+        # read1() (urllib3 >= 2.3) returns whatever has arrived instead of blocking for amt bytes, and
+        # urllib3 >= 2.6 bounds decompression per read - both pinned in requirements.txt
+        if not hasattr(raw, 'read1'):
+            raise RuntimeError(f"urllib3 {urllib3.__version__} can't bound detail page downloads, "
+                               f"urllib3 >= 2.6 is required (pip install -r requirements.txt)")
+        read = raw.read1
+        
+        try:
+            while True:
+                remaining = download.seconds_left()
+                if remaining <= 0:
+                    download.stop_at_deadline()
+                    return
+                if sock is not None:
+                    sock.settimeout(min(DETAIL_READ_TIMEOUT, remaining))
+                
+                try:
+                    chunk = read(DETAIL_STREAM_CHUNK_SIZE, decode_content=True)
+                except urllib3.exceptions.ReadTimeoutError:
+                    if download.seconds_left() < 0.05:
+                        # Timed out on the shrunk budget, not the server's read timeout
+                        download.stop_at_deadline()
+                        return
+                    raise
+                
+                if not chunk or not download.feed(chunk, raw.tell()):
+                    return
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.exceptions.ReadTimeout(e)
+        except urllib3.exceptions.DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except urllib3.exceptions.ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.RequestException(e)
+    
+    @staticmethod
+    def _parse_job_details(content: bytes) -> Dict:
+        """
+        Parses detailed information from a job detail page
+        
+        Args:
+            content: Page HTML
+            
+        Returns:
+            Dict: Detailed job listing data
+        """
+        details = {}
+        fallbacks = []  # Fields extracted through a fallback path (parser drift signal)
+        
+        soup = bs4.BeautifulSoup(content, 'html.parser')
+        
+        # Description - Note: GModStore uses dynamic Vue.js rendering (v-quill-render)
+        # The description content is loaded via JavaScript and not available in static HTML
+        # For now, we'll create a descriptive summary from available data
+        
+        # Try to find any static text content that might be useful
+        description_parts = []
+        
+        # Add budget if available
+        if details.get('budget'):
+            description_parts.append(f"Budget: {details['budget']}")
+        
+        # Add category if available
+        if details.get('category'):
+            description_parts.append(f"Category: {details['category']}")
+        
+        # Add application count
+        if details.get('applications') is not None:
+            app_count = details['applications']
+            description_parts.append(f"{app_count} application{'s' if app_count != 1 else ''}")
+        
+        # Create basic description
+        if description_parts:
+            details['description'] = " | ".join(description_parts)
+        
+        # Note: To get full description, you would need to:
+        # 1. Use Selenium/Playwright for JavaScript rendering
+        # 2. Access GModStore API if available
+        # 3. Parse from a different source
+        # For this use case, the summary is sufficient for Discord notifications
+        
+        # Status - Look for job status badge/label
+        status_elem = soup.find(['span', 'div'], class_=DETAIL_STATUS_CLASS)
+        if status_elem:
+            status_text = status_elem.get_text(strip=True)
+            if status_text in config.ACTIVE_JOB_STATUSES + ["Finished"]:
+                details['status'] = status_text
+        
+        # Budget - Look for price/budget information
+        budget_label = soup.find(string=DETAIL_BUDGET_LABEL)
+        if budget_label:
+            parent = budget_label.find_parent()
+            if parent:
+                card = parent.find_parent('div', class_='card')
+                if card:
+                    card_body = card.find('div', class_='card-body')
+                    if card_body:
+                        card_text = card_body.find('div', class_='card-text')
+                        if card_text:
+                            details['budget'] = card_text.get_text(strip=True)
+        
+        # Due Date - Multiple approaches
+        due_date = None
+        
+        # Try 1: Look for "DUE DATE" text
+        due_elem = soup.find(string=DETAIL_DUE_DATE_LABEL)
+        if due_elem:
+            # Find the next element with date info
+            parent = due_elem.find_parent()
+            if parent:
+                next_elem = parent.find_next(['span', 'div', 'time', 'dd'])
+                if next_elem:
+                    due_date = next_elem.get_text(strip=True)
+        
+        # Try 2: Look for v-date-time with time attribute
+        if not due_date:
+            date_elem = soup.find('v-date-time', {'time': True})
+            if date_elem:
+                due_date = date_elem.get('time')
+                fallbacks.append('due_date')
+        
+        # Try 3: Look for time element
+        if not due_date:
+            time_elem = soup.find('time', {'datetime': True})
+            if time_elem:
+                due_date = time_elem.get('datetime') or time_elem.get_text(strip=True)
+                fallbacks.append('due_date')
+        
+        if due_date:
+            details['due_date'] = due_date
+        
+        # Applications - Look for applicant count
+        # First try to find "Applications" label and its value
+        app_label = soup.find(string=DETAIL_APPLICATIONS_LABEL)
+        if app_label:
+            parent = app_label.find_parent()
+            if parent:
+                next_elem = parent.find_next(['dd', 'span', 'div'])
+                if next_elem:
+                    app_text = next_elem.get_text(strip=True)
+                    num_match = NUMBER_PATTERN.search(app_text)
+                    if num_match:
+                        details['applications'] = int(num_match.group(1))
+        
+        # Fallback: search in text
+        if 'applications' not in details:
+            for pattern in DETAIL_APPLICATIONS_PATTERNS:
+                app_match = soup.find(string=pattern)
+                if app_match:
+                    num_match = pattern.search(app_match)
+                    if num_match:
+                        details['applications'] = int(num_match.group(1))
+                        fallbacks.append('applications')
+                        break
+        
+        # Views - Look for view count
+        # First try to find "Views" label and its value
+        views_label = soup.find(string=DETAIL_VIEWS_LABEL)
+        if views_label:
+            parent = views_label.find_parent()
+            if parent:
+                next_elem = parent.find_next(['dd', 'span', 'div'])
+                if next_elem:
+                    views_text = next_elem.get_text(strip=True)
+                    num_match = GROUPED_NUMBER_PATTERN.search(views_text)
+                    if num_match:
+                        view_str = num_match.group(1).replace(',', '')
+                        details['views'] = int(view_str)
+        
+        # Fallback: search in text
+        if 'views' not in details:
+            for pattern in DETAIL_VIEWS_PATTERNS:
+                view_match = soup.find(string=pattern)
+                if view_match:
+                    num_match = pattern.search(view_match)
+                    if num_match:
+                        # Parse number with commas (e.g., "1,234")
+                        view_str = num_match.group(1).replace(',', '')
+                        details['views'] = int(view_str)
+                        fallbacks.append('views')
+                        break
+        
+        # Category - Look for category information
+        cat_elem = soup.find(string=DETAIL_CATEGORY_LABEL)
+        if cat_elem:
+            parent = cat_elem.find_parent()
+            if parent:
+                # Try to find the next dd element (definition description) or a link
+                next_elem = parent.find_next(['dd', 'a'])
+                if next_elem:
+                    cat_text = next_elem.get_text(strip=True)
+                    # Clean up category - should be short like "Gamemode", "Modelling", etc.
+                    if cat_text and len(cat_text) < 50 and not cat_text.startswith('Job:'):
+                        details['category'] = cat_text
+        
+        if fallbacks:
+            details[FALLBACKS_KEY] = fallbacks
+        
+        return details
 
 
 if __name__ == "__main__":
@@ -0,0 +1,308 @@
+"""
+Seen Set Module
+Bounded-memory set of seen listing IDs - exact window of recent IDs plus a memory-mapped scalable Bloom filter
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import struct
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import config
+
+BLOOM_MAGIC = b'GSSB'
+BLOOM_VERSION = 1
+MAX_STAGES = 32
+
+# magic, version, stage count, base capacity, target false positive rate
+HEADER_FORMAT = '<4sHHId'
+# bit count, hash count, items, byte offset in file
+STAGE_FORMAT = '<QHIQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT) + MAX_STAGES * struct.calcsize(STAGE_FORMAT)
+
+# Each new stage holds twice as many IDs with half the false positive rate of the previous one,
+# so the combined rate stays below the target no matter how many stages are added
+STAGE_GROWTH = 2
+STAGE_TIGHTENING = 0.5
+
+
+def _bloom_parameters(capacity: int, error_rate: float) -> Tuple[int, int]:
+    """
+    Args:
+        capacity: Expected number of items
+        error_rate: Target false positive rate
+        
+    Returns:
+        Tuple[int, int]: Bit count (multiple of 8) and hash count
+    """
+    # The optimal hash count -log2(p) is rounded up (fewer hashes than optimal raise the rate),
+    # then the bit count is solved for that integer count so a full stage still meets the target:
+    # (1 - e^(-k * n / m)) ^ k = p  ->  m = -k * n / ln(1 - p ^ (1 / k))
+    hashes = max(1, math.ceil(-math.log2(error_rate)))
+    bits = math.ceil(-hashes * capacity / math.log(1 - error_rate ** (1 / hashes)))
+    bits = (bits + 7) // 8 * 8
+    return bits, hashes
+
+
+def _hash_pair(item: str) -> Tuple[int, int]:
+    """Two independent 64-bit hashes for double hashing"""
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class ScalableBloomFilter:
+    """
+    Scalable Bloom filter stored in a memory-mapped file (only touched pages are resident)
+    """
+    
+    def __init__(self, path: Path, capacity: int, error_rate: float):
+        """
+        Opens or creates the filter file
+        
+        Args:
+            path: Filter file
+            capacity: IDs in the first stage (existing files keep their own parameters)
+            error_rate: Target false positive rate
+        """
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.stages: List[List[int]] = []  # [bit count, hash count, items, offset]
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        
+        if path.exists() and path.stat().st_size >= HEADER_SIZE:
+            self._open()
+            self._read_header()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.truncate(HEADER_SIZE)
+            self._open()
+            self._add_stage()
+    
+    def _open(self):
+        """Maps the filter file into memory"""
+        self._file = open(self.path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+    
+    def _read_header(self):
+        """Loads parameters and the stage table"""
+        magic, version, stage_count, capacity, error_rate = struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        if magic != BLOOM_MAGIC or version != BLOOM_VERSION:
+            raise ValueError(f"{self.path} is not a seen-set filter file")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        offset = struct.calcsize(HEADER_FORMAT)
+        for _ in range(stage_count):
+            self.stages.append(list(struct.unpack_from(STAGE_FORMAT, self._map, offset)))
+            offset += struct.calcsize(STAGE_FORMAT)
+    
+    def _write_header(self):
+        """Stores parameters and the stage table"""
+        struct.pack_into(HEADER_FORMAT, self._map, 0, BLOOM_MAGIC, BLOOM_VERSION,
+                         len(self.stages), self.capacity, self.error_rate)
+        offset = struct.calcsize(HEADER_FORMAT)
+        for stage in self.stages:
+            struct.pack_into(STAGE_FORMAT, self._map, offset, *stage)
+            offset += struct.calcsize(STAGE_FORMAT)
+    
+    def _add_stage(self):
+        """Appends a larger, stricter stage once the current one is full"""
+        if len(self.stages) >= MAX_STAGES:
+            raise ValueError("Seen-set filter has too many stages, increase SEEN_BLOOM_CAPACITY")
+        index = len(self.stages)
+        bits, hashes = _bloom_parameters(self.capacity * STAGE_GROWTH ** index,
+                                         self.error_rate * STAGE_TIGHTENING ** (index + 1))
+        offset = len(self._map)
+        
+        # The map has to be released before the file can grow (required on Windows)
+        self._map.close()
+        self._file.truncate(offset + bits // 8)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        
+        self.stages.append([bits, hashes, 0, offset])
+        self._write_header()
+    
+    def __contains__(self, item: str) -> bool:
+        h1, h2 = _hash_pair(item)
+        for bits, hashes, _, offset in self.stages:
+            for i in range(hashes):
+                position = (h1 + i * h2) % bits
+                if not self._map[offset + position // 8] & (1 << (position % 8)):
+                    break
+            else:
+                return True
+        return False
+    
+    def add(self, item: str):
+        """Adds an item (caller checks membership first)"""
+        stage = self.stages[-1]
+        if stage[2] >= self.capacity * STAGE_GROWTH ** (len(self.stages) - 1):
+            self._add_stage()
+            stage = self.stages[-1]
+        
+        bits, hashes, _, offset = stage
+        h1, h2 = _hash_pair(item)
+        for i in range(hashes):
+            position = (h1 + i * h2) % bits
+            self._map[offset + position // 8] |= 1 << (position % 8)
+        stage[2] += 1
+    
+    def __len__(self) -> int:
+        return sum(stage[2] for stage in self.stages)
+    
+    def flush(self):
+        """Writes the header and flushes dirty pages to disk"""
+        self._write_header()
+        self._map.flush()
+    
+    def close(self):
+        """Unmaps the filter file"""
+        if self._map is not None:
+            self.flush()
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+
+def recent_window_file(seen_file: Path) -> Path:
+    """
+    File of the recent-ID window kept next to the seen listings file (seen_jobs.json -> seen_jobs.recent.json)
+    
+    Args:
+        seen_file: Seen listings file
+        
+    Returns:
+        Path: Recent window file
+    """
+    return Path(seen_file).with_suffix('.recent.json')
+
+
+def read_id_list(path: Path) -> List[str]:
+    """
+    Reads a JSON list of listing IDs
+    
+    Args:
+        path: JSON file
+        
+    Returns:
+        List[str]: IDs (empty if the file is missing or unreadable)
+    """
+    if not path.exists():
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return list(json.load(f))
+    except Exception as e:
+        print(f"[WARNING] Could not load seen listings from {path.name}: {e}")
+        return []
+
+
+class BloomSeenSet:
+    """
+    Seen listing IDs: exact LRU window of recent IDs plus a Bloom filter for the long tail.
+    Supports the `in` / add() / len() subset of set used by the bot.
+    
+    The window is saved to its own file and the plain seen listings file is never rewritten,
+    so turning the filter off again falls back to the full ID list (plus the window).
+    """
+    
+    def __init__(self, seen_file: Path, bloom_file: Optional[str] = None, error_rate: Optional[float] = None,
+                 recent_size: Optional[int] = None, capacity: Optional[int] = None):
+        """
+        Loads the recent window and maps the filter
+        
+        Args:
+            seen_file: Plain seen listings file (imported, never written)
+            bloom_file: Filter file
+            error_rate: Target false positive rate (new filter files only)
+            recent_size: IDs kept exactly
+            capacity: IDs in the first filter stage (new filter files only)
+        """
+        self.seen_file = Path(seen_file)
+        self.recent_file = recent_window_file(self.seen_file)
+        self.recent_size = recent_size or getattr(config, 'SEEN_RECENT_SIZE', 5000)
+        self.recent: OrderedDict = OrderedDict()
+        self._dirty = False
+        
+        bloom_path = Path(bloom_file or getattr(config, 'SEEN_BLOOM_FILE', 'seen_jobs.bloom'))
+        self.bloom = ScalableBloomFilter(
+            bloom_path,
+            capacity or getattr(config, 'SEEN_BLOOM_CAPACITY', 10000),
+            error_rate or getattr(config, 'SEEN_FALSE_POSITIVE_RATE', 0.001),
+        )
+        
+        recent, imported = self._load_recent()
+        for job_id in recent:
+            self.add(job_id)
+        # Imported IDs go into the window file on the next save, so they aren't imported again
+        self._dirty = imported
+    
+    def _load_recent(self) -> Tuple[List[str], bool]:
+        """
+        Reads recent IDs
+        
+        Returns:
+            Tuple[List[str], bool]: IDs (oldest first), were IDs imported from the plain seen listings file?
+        """
+        if not self.recent_file.exists() and not self.seen_file.exists():
+            print(f"[INFO] New {self.recent_file.name} file will be created")
+            return [], False
+        
+        data = read_id_list(self.recent_file)
+        imported = False
+        # A plain seen listings file written after the window (first start with the filter, or
+        # runs with the filter turned off) holds IDs the filter hasn't seen yet
+        if self.seen_file.exists() and (not self.recent_file.exists()
+                                        or self.seen_file.stat().st_mtime > self.recent_file.stat().st_mtime):
+            plain = read_id_list(self.seen_file)
+            print(f"[INFO] Importing {len(plain)} seen listings from {self.seen_file.name}")
+            data += plain
+            imported = True
+        
+        print(f"[INFO] Loaded {len(data)} recent seen listings "
+              f"({len(self.bloom)} in filter, target false positive rate {self.bloom.error_rate:g})")
+        return data, imported
+    
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.recent or job_id in self.bloom
+    
+    def add(self, job_id: str):
+        """
+        Marks an ID as seen
+        
+        Args:
+            job_id: Listing ID
+        """
+        if job_id in self.recent:
+            self.recent.move_to_end(job_id)
+            return
+        if job_id not in self.bloom:
+            self.bloom.add(job_id)
+        self.recent[job_id] = None
+        while len(self.recent) > self.recent_size:
+            self.recent.popitem(last=False)
+        self._dirty = True
+    
+    def __len__(self) -> int:
+        return len(self.bloom)
+    
+    def save(self):
+        """Flushes the filter and saves the recent window"""
+        self.bloom.flush()
+        if not self._dirty:
+            return
+        with open(self.recent_file, 'w', encoding='utf-8') as f:
+            json.dump(list(self.recent), f, indent=2)
+        self._dirty = False
+    
+    def close(self):
+        """Saves and unmaps the filter"""
+        self.save()
+        self.bloom.close()
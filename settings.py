@@ -0,0 +1,314 @@
+"""
+Settings Module
+Layers a TOML/YAML settings file and GMS_* environment variables over config.py,
+validates them and hot-reloads them into the running bot
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import config
+
+# Environment variables with this prefix override settings (e.g. GMS_CHECK_INTERVAL=600)
+ENV_PREFIX = "GMS_"
+
+# Settings that are only read at startup - changes are reported but need a restart
+RESTART_REQUIRED = {
+    'ASYNC_MODE', 'PARSE_WORKERS', 'PARSE_MAX_PENDING', 'PARSE_CACHE_FILE', 'PARSE_CACHE_MAX_ENTRIES',
+    'JOB_INDEX_FILE', 'DIGEST_MODE', 'DIGEST_QUEUE_FILE', 'SEEN_BLOOM_FILE', 'SEEN_FALSE_POSITIVE_RATE',
+    'SEEN_RECENT_SIZE', 'SEEN_BLOOM_CAPACITY', 'STARTUP_WEBHOOK_CHECK', 'CA_BUNDLE_CACHE_FILE',
+    'STARTUP_STATS_FILE', 'CONFIG_FILE', 'CONFIG_POLL_INTERVAL', 'ADMIN_API_PORT', 'ADMIN_API_HOST',
+    'CYCLE_STATS_HISTORY', 'EXPORT_FORMATS', 'EXPORT_DIR', 'EXPORT_ROTATE_MB', 'EXPORT_ROTATE_HOURS',
+    'EXPORT_BATCH_SIZE', 'EXPORT_FLUSH_INTERVAL',
+}
+
+# Allowed values of enum-like settings
+CHOICES = {
+    'STARTUP_WEBHOOK_CHECK': ('background', 'blocking', 'off'),
+    'PARSER_DRIFT_ACTION': ('warn', 'hold'),
+}
+
+# Numeric settings that must be positive (all other numbers must not be negative)
+POSITIVE = {'CHECK_INTERVAL', 'ASYNC_MAX_CONCURRENCY', 'CIRCUIT_FAILURE_THRESHOLD', 'DETAIL_MAX_BYTES'}
+
+
+def _load_toml(path: Path) -> Dict:
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ValueError("TOML settings need Python 3.11+ or the 'tomli' package")
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
+def _load_yaml(path: Path) -> Dict:
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("YAML settings need the 'PyYAML' package")
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+
+def _parse_env_value(raw: str, default: Any) -> Any:
+    """
+    Converts an environment variable to the type of the config.py default
+    
+    Args:
+        raw: Variable value
+        default: Default value from config.py
+        
+    Returns:
+        Any: Parsed value (validated later)
+    """
+    if isinstance(default, str):
+        return raw
+    if isinstance(default, bool) and raw.strip().lower() in ('1', 'true', 'yes', 'on', '0', 'false', 'no', 'off'):
+        return raw.strip().lower() in ('1', 'true', 'yes', 'on')
+    try:
+        return json.loads(raw)
+    except ValueError:
+        if isinstance(default, list):
+            # Comma-separated list: GMS_ACTIVE_JOB_STATUSES="Apply,In Progress"
+            return [item.strip() for item in raw.split(',') if item.strip()]
+        return raw
+
+
+def validate_setting(name: str, value: Any, default: Any) -> Optional[str]:
+    """
+    Checks a setting against the type of its config.py default
+    
+    Args:
+        name: Setting name
+        value: New value
+        default: Default value from config.py
+        
+    Returns:
+        Optional[str]: Error message, or None if valid
+    """
+    if default is None:
+        return None
+    if isinstance(default, bool):
+        if not isinstance(value, bool):
+            return f"{name} must be true or false"
+    elif isinstance(default, (int, float)):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return f"{name} must be a number"
+        if value < 0 or (name in POSITIVE and value <= 0):
+            return f"{name} must be {'positive' if name in POSITIVE else 'zero or more'}"
+    elif isinstance(default, str):
+        if not isinstance(value, str):
+            return f"{name} must be a string"
+        if name in CHOICES and value not in CHOICES[name]:
+            return f"{name} must be one of {', '.join(CHOICES[name])}"
+        if name.endswith('_URL') and not value.startswith(('http://', 'https://')):
+            return f"{name} must be an http(s) URL"
+    elif isinstance(default, list):
+        if not isinstance(value, list):
+            return f"{name} must be a list"
+        if name == 'ACTIVE_JOB_STATUSES' and not all(isinstance(item, str) for item in value):
+            return f"{name} must be a list of strings"
+    elif isinstance(default, dict):
+        if not isinstance(value, dict):
+            return f"{name} must be a table/mapping"
+    return None
+
+
+class ConfigReloader:
+    """
+    Applies settings file and environment overrides to the config module and reloads them on change.
+    Code that reads config.X at use time picks up new values automatically; objects that copy
+    settings register a callback with on_reload().
+    """
+    
+    def __init__(self, settings_file: Optional[str] = None):
+        """
+        Initializes config reloader (config.py values become the defaults)
+        
+        Args:
+            settings_file: TOML (.toml) or YAML (.yaml/.yml) file (default: GMS_CONFIG_FILE or CONFIG_FILE)
+        """
+        if settings_file is None:
+            settings_file = os.environ.get(f"{ENV_PREFIX}CONFIG_FILE") or getattr(config, 'CONFIG_FILE', None)
+        self.settings_file = Path(settings_file) if settings_file else None
+        self.defaults = {name: value for name, value in vars(config).items() if name.isupper()}
+        self.overrides: Dict[str, Any] = {}
+        self._callbacks: List[Callable[[Set[str]], None]] = []
+        self._lock = threading.Lock()
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+    
+    def on_reload(self, callback: Callable[[Set[str]], None]):
+        """
+        Registers a callback that receives the names of changed settings after each reload
+        
+        Args:
+            callback: Function(changed setting names)
+        """
+        self._callbacks.append(callback)
+    
+    def _stat_file(self) -> Optional[Tuple[int, int]]:
+        """Settings file modification time and size (None if missing)"""
+        try:
+            stat = self.settings_file.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except (OSError, AttributeError):
+            return None
+    
+    def _read_file(self) -> Dict[str, Any]:
+        """Reads the settings file (keys are case-insensitive)"""
+        if not self.settings_file or not self.settings_file.exists():
+            return {}
+        if self.settings_file.suffix.lower() in ('.yaml', '.yml'):
+            data = _load_yaml(self.settings_file)
+        else:
+            data = _load_toml(self.settings_file)
+        if not isinstance(data, dict):
+            raise ValueError("settings file must contain a table/mapping")
+        return {str(key).upper(): value for key, value in data.items()}
+    
+    def _read_env(self) -> Dict[str, Any]:
+        """Reads GMS_* environment variables"""
+        values = {}
+        for key, raw in os.environ.items():
+            name = key[len(ENV_PREFIX):]
+            if key.startswith(ENV_PREFIX) and name in self.defaults and name != 'CONFIG_FILE':
+                values[name] = _parse_env_value(raw, self.defaults[name])
+        return values
+    
+    def _collect(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Merges file and environment overrides and validates them
+        
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: Overrides (file < environment) and errors
+        """
+        errors = []
+        try:
+            overrides = self._read_file()
+        except Exception as e:
+            return {}, [f"{self.settings_file}: {e}"]
+        overrides.update(self._read_env())
+        
+        for name in list(overrides):
+            if name not in self.defaults:
+                print(f"[WARNING] Unknown setting ignored: {name}")
+                del overrides[name]
+                continue
+            error = validate_setting(name, overrides[name], self.defaults[name])
+            if error:
+                errors.append(error)
+        return overrides, errors
+    
+    def load(self) -> bool:
+        """
+        Applies the settings at startup
+        
+        Returns:
+            bool: Were the overrides valid? (invalid overrides are not applied)
+        """
+        return self.reload(initial=True)
+    
+    def reload(self, initial: bool = False) -> bool:
+        """
+        Re-reads file and environment and applies the changes all at once (or not at all)
+        
+        Args:
+            initial: Startup load (no restart warnings)
+            
+        Returns:
+            bool: Were the new settings valid?
+        """
+        with self._lock:
+            self._file_state = self._stat_file()
+            overrides, errors = self._collect()
+            if errors:
+                for error in errors:
+                    print(f"[ERROR] Invalid setting: {error}")
+                print("[WARNING] Settings not applied, keeping the current configuration")
+                return False
+            
+            changed = set()
+            for name, default in self.defaults.items():
+                value = overrides.get(name, default)
+                if getattr(config, name, None) != value:
+                    setattr(config, name, value)
+                    changed.add(name)
+            self.overrides = overrides
+        
+        if initial:
+            if overrides:
+                print(f"[INFO] Settings overridden: {', '.join(sorted(overrides))}")
+            return True
+        
+        if not changed:
+            print("[INFO] Settings reloaded, nothing changed")
+            return True
+        print(f"[INFO] Settings reloaded: {', '.join(sorted(changed))}")
+        restart = changed & RESTART_REQUIRED
+        if restart:
+            print(f"[WARNING] Restart needed for: {', '.join(sorted(restart))}")
+        for callback in self._callbacks:
+            try:
+                callback(changed)
+            except Exception as e:
+                print(f"[ERROR] Error applying settings: {e}")
+        return True
+    
+    def file_changed(self) -> bool:
+        """
+        Returns:
+            bool: Did the settings file change since the last load?
+        """
+        return self._stat_file() != self._file_state
+    
+    def check_file(self) -> bool:
+        """
+        Reloads if the settings file changed since the last load
+        
+        Returns:
+            bool: Was a reload triggered?
+        """
+        if not self.file_changed():
+            return False
+        self.reload()
+        return True
+    
+    def start_watching(self, interval: Optional[float] = None,
+                       on_change: Optional[Callable[[], None]] = None) -> Optional[threading.Thread]:
+        """
+        Polls the settings file in a background thread
+        
+        Args:
+            interval: Seconds between checks (default: CONFIG_POLL_INTERVAL, 0 = off)
+            on_change: Called from the watcher thread when the file changed, instead of reloading
+                there - lets the owner run reload() (and the reload callbacks) on its own thread
+            
+        Returns:
+            Optional[threading.Thread]: Watcher thread
+        """
+        interval = interval if interval is not None else getattr(config, 'CONFIG_POLL_INTERVAL', 5)
+        if not interval or not self.settings_file or self._watcher is not None:
+            return None
+        
+        def watch():
+            while not self._stop.wait(interval):
+                if on_change is None:
+                    self.check_file()
+                elif self.file_changed():
+                    on_change()
+        
+        self._watcher = threading.Thread(target=watch, name="settings-watcher", daemon=True)
+        self._watcher.start()
+        return self._watcher
+    
+    def stop_watching(self):
+        """Stops the watcher thread"""
+        self._stop.set()
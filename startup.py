@@ -0,0 +1,138 @@
+"""
+Startup Module
+Lazy module imports and startup timing report
+"""
+
+import importlib
+import json
+import time
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Optional
+
+# Reference point for all startup timings (set when this module is first imported)
+PROCESS_START = time.perf_counter()
+
+# Import timings of lazily loaded modules: (module name, seconds)
+IMPORT_TIMES: List[tuple] = []
+
+
+class LazyModule:
+    """
+    Module proxy that imports the real module on first attribute access
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            start = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            if all(name != self._name for name, _ in IMPORT_TIMES):
+                IMPORT_TIMES.append((self._name, time.perf_counter() - start))
+        return self._module
+    
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Returns a proxy that imports the module on first use
+    
+    Args:
+        name: Module name
+    
+    Returns:
+        LazyModule: Module proxy
+    """
+    return LazyModule(name)
+
+
+class StartupProfiler:
+    """
+    Records startup phases and tracks time-to-first-scrape across restarts
+    """
+    
+    def __init__(self, stats_file: Optional[str] = None, history_size: int = 20):
+        """
+        Initializes startup profiler
+        
+        Args:
+            stats_file: JSON file where time-to-first-scrape history is kept
+            history_size: Number of past startups to keep
+        """
+        self.stats_file = Path(stats_file) if stats_file else None
+        self.history_size = history_size
+        self.marks: Dict[str, float] = {}
+        self.reported = False
+    
+    def mark(self, phase: str):
+        """
+        Records the time elapsed since process start for a phase (first call wins)
+        
+        Args:
+            phase: Phase name
+        """
+        self.marks.setdefault(phase, time.perf_counter() - PROCESS_START)
+    
+    def report(self, final_phase: str = "first_scrape_done"):
+        """
+        Prints the startup report and stores time-to-first-scrape
+        
+        Args:
+            final_phase: Phase used as time-to-first-scrape (listings fetched and parsed,
+                so lazily imported modules are included)
+        """
+        if self.reported or final_phase not in self.marks:
+            return
+        self.reported = True
+        
+        print("[INFO] Startup report:")
+        for phase, elapsed in sorted(self.marks.items(), key=lambda item: item[1]):
+            print(f"[INFO]   {phase:<24} {elapsed * 1000:9.1f} ms")
+        for name, elapsed in IMPORT_TIMES:
+            print(f"[INFO]   import time: {elapsed * 1e6:>10.0f} us | {name}")
+        
+        time_to_first_scrape = self.marks[final_phase]
+        history = self._load_history(final_phase)
+        if history:
+            previous = median(history)
+            change = (time_to_first_scrape - previous) / previous * 100 if previous else 0.0
+            print(f"[INFO]   Time-to-first-scrape: {time_to_first_scrape * 1000:.1f} ms "
+                  f"(median of last {len(history)}: {previous * 1000:.1f} ms, {change:+.1f}%)")
+        else:
+            print(f"[INFO]   Time-to-first-scrape: {time_to_first_scrape * 1000:.1f} ms")
+        
+        history.append(round(time_to_first_scrape, 6))
+        self._save_history(final_phase, history[-self.history_size:])
+    
+    def _load_history(self, phase: str) -> List[float]:
+        """Loads previous time-to-first-scrape values (only those measured at the same phase)"""
+        if not self.stats_file or not self.stats_file.exists():
+            return []
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get('phase') != phase:
+                return []
+            return [float(value) for value in data.get('history', [])]
+        except Exception as e:
+            print(f"[WARNING] Could not load startup stats: {e}")
+            return []
+    
+    def _save_history(self, phase: str, history: List[float]):
+        """Saves time-to-first-scrape history"""
+        if not self.stats_file:
+            return
+        try:
+            with open(self.stats_file, 'w', encoding='utf-8') as f:
+                json.dump({'phase': phase, 'history': history}, f)
+        except Exception as e:
+            print(f"[WARNING] Could not save startup stats: {e}")
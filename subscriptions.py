@@ -0,0 +1,273 @@
+"""
+Keyword Subscription Module
+Matches job listings against user keyword/regex subscriptions and adds role mentions
+"""
+
+import hashlib
+import json
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import config
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton for matching many keywords in a single pass.
+    Keywords are matched case-insensitively on word boundaries.
+    """
+    
+    def __init__(self, keywords: List[Tuple[str, int]]):
+        """
+        Builds the automaton
+        
+        Args:
+            keywords: (keyword, owner index) pairs
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]  # (keyword length, owner)
+        
+        for keyword, owner in keywords:
+            self._add(keyword, owner)
+        self._build_failure_links()
+    
+    def _add(self, keyword: str, owner: int):
+        """Adds a keyword to the trie"""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(keyword), owner))
+    
+    def _build_failure_links(self):
+        """Computes failure links breadth-first and merges outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+    
+    def search(self, text: str) -> Set[int]:
+        """
+        Finds owners of all keywords present in text
+        
+        Args:
+            text: Normalized (lowercase) text
+        
+        Returns:
+            Set[int]: Matching owner indexes
+        """
+        owners = set()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        text_length = len(text)
+        
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+            
+            end = index + 1
+            if end < text_length and text[end].isalnum():
+                continue
+            for length, owner in output[state]:
+                start = end - length
+                if start == 0 or not text[start - 1].isalnum():
+                    owners.add(owner)
+        
+        return owners
+    
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+class SubscriptionEngine:
+    """
+    Compiles all subscriptions into one keyword automaton plus one combined regex.
+    The automaton is only rebuilt when the subscriptions change.
+    """
+    
+    def __init__(self, subscriptions_file: Optional[str] = None):
+        """
+        Initializes subscription engine
+        
+        Args:
+            subscriptions_file: Optional JSON file with additional subscriptions
+        """
+        if subscriptions_file is None:
+            subscriptions_file = getattr(config, 'SUBSCRIPTIONS_FILE', None)
+        self.subscriptions_file = Path(subscriptions_file) if subscriptions_file else None
+        self._file_mtime: Optional[float] = None
+        self._file_subscriptions: List[Dict] = []
+        self._signature: Optional[str] = None
+        
+        self._mentions: List[str] = []
+        self._automaton: Optional[KeywordAutomaton] = None
+        self._prefilter: Optional[re.Pattern] = None
+        self._patterns: List[Tuple[re.Pattern, int]] = []
+        
+        self.refresh()
+    
+    def _load_file_subscriptions(self) -> List[Dict]:
+        """
+        Loads subscriptions from JSON file (only re-read when the file changed)
+        
+        Returns:
+            List[Dict]: Subscriptions from file
+        """
+        if not self.subscriptions_file or not self.subscriptions_file.exists():
+            self._file_mtime = None
+            self._file_subscriptions = []
+            return self._file_subscriptions
+        
+        mtime = self.subscriptions_file.stat().st_mtime
+        if mtime == self._file_mtime:
+            return self._file_subscriptions
+        
+        try:
+            with open(self.subscriptions_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._file_subscriptions = data if isinstance(data, list) else []
+        except Exception as e:
+            print(f"[WARNING] Could not load subscriptions: {e}")
+        self._file_mtime = mtime
+        return self._file_subscriptions
+    
+    def refresh(self) -> bool:
+        """
+        Rebuilds the automaton if subscriptions changed
+        
+        Returns:
+            bool: Was the automaton rebuilt?
+        """
+        subscriptions = list(getattr(config, 'SUBSCRIPTIONS', [])) + self._load_file_subscriptions()
+        signature = hashlib.sha1(
+            json.dumps(subscriptions, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        
+        if signature == self._signature:
+            return False
+        
+        self._build(subscriptions)
+        self._signature = signature
+        return True
+    
+    def _build(self, subscriptions: List[Dict]):
+        """
+        Compiles subscriptions into the automaton and combined regex
+        
+        Args:
+            subscriptions: Subscription entries
+        """
+        mentions = []
+        keywords = []
+        patterns = []
+        
+        for sub in subscriptions:
+            mention = sub.get('mention')
+            if not mention:
+                continue
+            owner = len(mentions)
+            mentions.append(mention)
+            
+            for keyword in sub.get('keywords', []):
+                keyword = self._normalize(keyword)
+                if keyword:
+                    keywords.append((keyword, owner))
+            
+            for pattern in sub.get('patterns', []):
+                try:
+                    patterns.append((re.compile(pattern, re.I), owner))
+                except re.error as e:
+                    print(f"[WARNING] Invalid subscription pattern '{pattern}': {e}")
+        
+        self._mentions = mentions
+        self._automaton = KeywordAutomaton(keywords) if keywords else None
+        self._patterns = patterns
+        self._prefilter = None
+        if patterns:
+            # One pass over the text decides if any regex can match at all
+            try:
+                self._prefilter = re.compile(
+                    '|'.join(f'(?:{compiled.pattern})' for compiled, _ in patterns), re.I
+                )
+            except re.error:
+                # Patterns that can't be combined (backreferences, inline flags) are checked one by one
+                self._prefilter = None
+        
+        print(f"[INFO] Subscriptions compiled: {len(mentions)} subscriptions, "
+              f"{len(keywords)} keywords, {len(patterns)} patterns")
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lowercases text and collapses whitespace"""
+        return ' '.join(str(text).lower().split())
+    
+    def match(self, job: Dict) -> List[str]:
+        """
+        Returns mentions of subscriptions matching a job's title or category
+        
+        Args:
+            job: Job listing data
+        
+        Returns:
+            List[str]: Matching mentions (subscription order)
+        """
+        if not self._mentions:
+            return []
+        
+        text = self._normalize(f"{job.get('title', '')} | {job.get('category', '')}")
+        owners = self._automaton.search(text) if self._automaton else set()
+        
+        if self._patterns and (self._prefilter is None or self._prefilter.search(text)):
+            for compiled, owner in self._patterns:
+                if owner not in owners and compiled.search(text):
+                    owners.add(owner)
+        
+        return [self._mentions[owner] for owner in sorted(owners)]
+    
+    def annotate(self, jobs: List[Dict]) -> int:
+        """
+        Adds matching mentions to each job ('mentions' key)
+        
+        Args:
+            jobs: Job listings
+        
+        Returns:
+            int: Number of jobs with at least one mention
+        """
+        self.refresh()
+        
+        matched = 0
+        for job in jobs:
+            mentions = self.match(job)
+            job['mentions'] = mentions
+            if mentions:
+                matched += 1
+        return matched
+
+
+if __name__ == "__main__":
+    # For testing
+    engine = SubscriptionEngine()
+    test_job = {"title": "Looking for a DarkRP developer", "category": "Gamemode"}
+    print(f"Mentions: {engine.match(test_job)}")